@@ -191,5 +191,13 @@ class GiveAchievementTaskPrototype(BasePrototype):
         return cls(model=cls._db_create(account_id=account_id,
                                         achievement_id=achievement_id))
 
+    @classmethod
+    def create_bulk(cls, tasks):
+        if not tasks:
+            return
+
+        cls._model_class.objects.bulk_create([cls._model_class(account_id=account_id, achievement_id=achievement_id)
+                                              for account_id, achievement_id in tasks])
+
     def remove(self):
         self._model.delete()
@@ -1,10 +1,11 @@
 # coding: utf-8
+import bisect
 import contextlib
 import collections
 
 from the_tale.common.utils import storage
 
-from the_tale.accounts.achievements.prototypes import AchievementPrototype, AccountAchievementsPrototype
+from the_tale.accounts.achievements.prototypes import AchievementPrototype, AccountAchievementsPrototype, GiveAchievementTaskPrototype
 from the_tale.accounts.achievements.exceptions import AchievementsError
 from the_tale.accounts.achievements.relations import ACHIEVEMENT_GROUP
 
@@ -30,14 +31,77 @@ class AchievementsStorage(storage.Storage):
 
         return by_type
 
+    _types_version = None
+    _postponed_tasks = None
+
+    def _sync_types(self):
+        self.sync()
+
+        if self._types_version is not None and self._types_version == self._version:
+            return
+
+        self._approved_by_types = {}
+
+        for achievement in self.all():
+            if achievement.approved:
+                self._approved_by_types.setdefault(achievement.type, []).append(achievement)
+
+        for achievements in self._approved_by_types.values():
+            achievements.sort(key=lambda achievement: achievement.barrier)
+
+        self._barriers_by_types = {type: [achievement.barrier for achievement in achievements]
+                                   for type, achievements in self._approved_by_types.items()}
+
+        self._types_version = self._version
+
+    def reached_achievements(self, type, old_value, new_value):
+        '''
+        approved achievements, for which achievement.check(old_value, new_value) is True
+        '''
+        self._sync_types()
+
+        if type not in self._approved_by_types:
+            return []
+
+        barriers = self._barriers_by_types[type]
+
+        if new_value < 0:
+            start, end = bisect.bisect_left(barriers, new_value), bisect.bisect_left(barriers, old_value)
+        else:
+            start, end = bisect.bisect_right(barriers, old_value), bisect.bisect_right(barriers, new_value)
+
+        return self._approved_by_types[type][start:end]
 
     def verify_achievements(self, account_id, type, old_value, new_value):
         if old_value == new_value:
             return
 
-        for achievement in self.by_type(type, only_approved=True):
-            if achievement.check(old_value, new_value):
-                AccountAchievementsPrototype.give_achievement(account_id=account_id, achievement=achievement)
+        for achievement in self.reached_achievements(type, old_value, new_value):
+            self.give_achievement(account_id=account_id, achievement=achievement)
+
+    def give_achievement(self, account_id, achievement):
+        if self._postponed_tasks is None:
+            AccountAchievementsPrototype.give_achievement(account_id=account_id, achievement=achievement)
+            return
+
+        self._postponed_tasks.append((account_id, achievement.id))
+
+    @contextlib.contextmanager
+    def postpone_giving(self):
+        '''
+        collect all given achievements and create their tasks by single query on exit
+        '''
+        if self._postponed_tasks is not None:
+            yield
+            return
+
+        self._postponed_tasks = []
+
+        try:
+            yield
+        finally:
+            tasks, self._postponed_tasks = self._postponed_tasks, None
+            GiveAchievementTaskPrototype.create_bulk(tasks)
 
     @contextlib.contextmanager
     def verify(self, type, object):
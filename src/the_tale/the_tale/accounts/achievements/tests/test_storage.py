@@ -97,3 +97,42 @@ class StorageTests(testcase.TestCase):
                                                      type=ACHIEVEMENT_TYPE.MONEY,
                                                      old_value=0,
                                                      new_value=self.achievement_4.barrier)
+
+    def test_reached_achievements(self):
+        self.assertEqual([a.id for a in achievements_storage.reached_achievements(ACHIEVEMENT_TYPE.MONEY, old_value=0, new_value=3)],
+                         [self.achievement_3.id, self.achievement_4.id])
+        self.assertEqual([a.id for a in achievements_storage.reached_achievements(ACHIEVEMENT_TYPE.MONEY, old_value=-1, new_value=0)],
+                         [self.achievement_1.id])
+        self.assertEqual(achievements_storage.reached_achievements(ACHIEVEMENT_TYPE.MONEY, old_value=4, new_value=3), [])
+        self.assertEqual(achievements_storage.reached_achievements(ACHIEVEMENT_TYPE.DEATHS, old_value=0, new_value=100), [])
+
+    def test_reached_achievements__negative_values(self):
+        achievement_7 = AchievementPrototype.create(group=ACHIEVEMENT_GROUP.MONEY, type=ACHIEVEMENT_TYPE.MONEY, barrier=-2, points=10,
+                                                    caption='achievement_7', description='description_7', approved=True)
+
+        self.assertEqual([a.id for a in achievements_storage.reached_achievements(ACHIEVEMENT_TYPE.MONEY, old_value=0, new_value=-2)],
+                         [achievement_7.id])
+        self.assertEqual(achievements_storage.reached_achievements(ACHIEVEMENT_TYPE.MONEY, old_value=0, new_value=-1), [])
+
+    def test_reached_achievements__approved_changed(self):
+        self.achievement_2.approved = True
+        self.achievement_2.save()
+
+        self.assertEqual([a.id for a in achievements_storage.reached_achievements(ACHIEVEMENT_TYPE.MONEY, old_value=0, new_value=1)],
+                         [self.achievement_2.id])
+
+    def test_postpone_giving(self):
+        with self.check_delta(GiveAchievementTaskPrototype._db_count, 3):
+            with achievements_storage.postpone_giving():
+                with self.check_not_changed(GiveAchievementTaskPrototype._db_count):
+                    achievements_storage.verify_achievements(self.account_1.id,
+                                                             type=ACHIEVEMENT_TYPE.MONEY,
+                                                             old_value=0,
+                                                             new_value=self.achievement_4.barrier)
+                    achievements_storage.verify_achievements(self.account_1.id,
+                                                             type=ACHIEVEMENT_TYPE.TIME,
+                                                             old_value=0,
+                                                             new_value=self.achievement_6.barrier)
+
+        self.assertEqual(set(GiveAchievementTaskPrototype._db_all().values_list('achievement_id', flat=True)),
+                         set((self.achievement_3.id, self.achievement_4.id, self.achievement_6.id)))
@@ -1,11 +1,13 @@
 # coding: utf-8
+from django.db import transaction
+
 from the_tale.common.utils.workers import BaseWorker
 
 from the_tale.game.heroes import logic as heroes_logic
-from the_tale.game.heroes import models as heroes_models
 
 from the_tale.accounts.achievements.prototypes import GiveAchievementTaskPrototype, AccountAchievementsPrototype
 from the_tale.accounts.achievements.storage import achievements_storage
+from the_tale.accounts.achievements.conf import achievements_settings
 
 
 class Worker(BaseWorker):
@@ -46,14 +48,23 @@ class Worker(BaseWorker):
 
             task.remove()
 
-    def get_achievements_source_iterator(self, achievement):
-        from the_tale.accounts.prototypes import AccountPrototype
+    def get_achievement_type_values(self, achievement):
+        from the_tale.accounts import logic as accounts_logic
 
         if achievement.type.source.is_ACCOUNT:
-            return (AccountPrototype(model=account_model) for account_model in AccountPrototype._db_all())
+            return accounts_logic.achievement_type_values(achievement.type, barrier=achievement.barrier)
 
         if achievement.type.source.is_GAME_OBJECT:
-            return (heroes_logic.load_hero(hero_model=hero_model) for hero_model in heroes_models.Hero.objects.all().iterator())
+            return heroes_logic.achievement_type_values(achievement.type, barrier=achievement.barrier)
+
+    def add_achievement_to_accounts(self, achievement, accounts_ids, notify):
+        for i in range(0, len(accounts_ids), achievements_settings.SPREAD_CHUNK_SIZE):
+            chunk = accounts_ids[i:i+achievements_settings.SPREAD_CHUNK_SIZE]
+
+            with transaction.atomic():
+                for achievements in AccountAchievementsPrototype.from_query(AccountAchievementsPrototype._db_filter(account_id__in=chunk)):
+                    achievements.add_achievement(achievement, notify=notify)
+                    achievements.save()
 
     def spread_achievement(self, achievement):
         self.logger.info('spread achievement %d' % achievement.id)
@@ -61,7 +72,8 @@ class Worker(BaseWorker):
         if achievement.type.source.is_NONE:
             return
 
-        for source in self.get_achievements_source_iterator(achievement):
-            if not achievement.check(old_value=0, new_value=source.get_achievement_type_value(achievement.type)):
-                continue
-            self.add_achievement(achievement, source.account_id, notify=False)
+        accounts_ids = [account_id
+                        for account_id, value in self.get_achievement_type_values(achievement)
+                        if account_id is not None and achievement.check(old_value=0, new_value=value)]
+
+        self.add_achievement_to_accounts(achievement, accounts_ids, notify=False)
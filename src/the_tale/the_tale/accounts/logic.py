@@ -6,6 +6,7 @@ import datetime
 from django.conf import settings as project_settings
 from django.contrib.auth import login as django_login, authenticate as django_authenticate, logout as django_logout
 from django.db import transaction
+from django.db import models as django_models
 
 from dext.common.utils.logic import normalize_email
 from dext.common.utils.urls import url
@@ -261,3 +262,38 @@ def initiate_transfer_money(sender_id, recipient_id, amount, comment):
     amqp_environment.environment.workers.refrigerator.cmd_wait_task(task.id)
 
     return task
+
+
+def achievement_type_values(achievement_type, barrier=None):
+    '''
+    yields (account_id, value) pairs, where value equals to account.get_achievement_type_value(achievement_type)
+    accounts with zero counters are skipped
+    '''
+    from the_tale.game.bills.models import Bill, Vote
+    from the_tale.game.bills.relations import BILL_STATE, VOTE_TYPE
+
+    if achievement_type.is_KEEPER_MIGHT:
+        query = Account.objects.all()
+
+        if barrier and barrier > 0:
+            query = query.filter(might__gte=barrier)
+        elif barrier and barrier < 0:
+            query = query.filter(might__lte=barrier)
+
+        yield from query.values_list('id', 'might').iterator()
+        return
+
+    if achievement_type.is_POLITICS_ACCEPTED_BILLS:
+        query = Bill.objects.filter(state=BILL_STATE.ACCEPTED)
+    elif achievement_type.is_POLITICS_VOTES_TOTAL:
+        query = Vote.objects.all()
+    elif achievement_type.is_POLITICS_VOTES_FOR:
+        query = Vote.objects.filter(type=VOTE_TYPE.FOR)
+    elif achievement_type.is_POLITICS_VOTES_AGAINST:
+        query = Vote.objects.filter(type=VOTE_TYPE.AGAINST)
+    else:
+        raise exceptions.UnkwnownAchievementTypeError(achievement_type=achievement_type)
+
+    for account_id, number in query.values('owner_id').annotate(number=django_models.Count('id')).order_by().values_list('owner_id', 'number'):
+        if account_id is not None:
+            yield account_id, number
@@ -4,6 +4,8 @@ import math
 from django.db import models
 from django.utils.html import strip_tags
 
+from the_tale.common.utils import bbcode
+
 from the_tale.accounts.models import Award
 from the_tale.accounts.prototypes import AccountPrototype
 from the_tale.accounts import relations
@@ -20,41 +22,59 @@ from the_tale.linguistics import prototypes as linguistics_prototypes
 from the_tale.linguistics import relations as linguistics_relations
 
 
-def get_linguistic_entity_info(entity_id, contribution_type, source):
-    contributors = linguistics_prototypes.ContributionPrototype._db_filter(entity_id=entity_id,
-                                                                           source=source,
-                                                                           state=linguistics_relations.CONTRIBUTION_STATE.IN_GAME).order_by('created_at').values_list('type', 'account_id')
-
-    author_type, author_id = contributors[0]
+def _add_mights(mights, query, field, amount):
+    query = query.values(field).annotate(number=models.Count('id')).order_by().values_list(field, 'number')
 
-    contributors_count = sum(1 for type, a_id in contributors if type == contribution_type)
+    for account_id, number in query:
+        if account_id is None:
+            continue
+        mights[account_id] = mights.get(account_id, 0) + number * amount
 
-    if author_type == contribution_type:
-        contributors_count -= 1
 
-    return author_id, contributors_count
+def _filter_accounts(query, field, accounts_ids):
+    if accounts_ids is None:
+        return query
+    return query.filter(**{'%s__in' % field: accounts_ids})
 
 
-def calculate_linguistics_migth(account_id, contribution_type, might_per_added_entity, might_per_edited_entity, source):
+def calculate_linguistics_mights(mights, contribution_type, might_per_added_entity, might_per_edited_entity, source, accounts_ids=None):
 
     state = linguistics_relations.CONTRIBUTION_STATE.IN_GAME
 
-    entities_ids = set(linguistics_prototypes.ContributionPrototype._db_filter(account_id=account_id,
+    query = linguistics_prototypes.ContributionPrototype._db_filter(source=source, state=state)
+
+    if accounts_ids is not None:
+        entities_ids = linguistics_prototypes.ContributionPrototype._db_filter(account_id__in=accounts_ids,
                                                                                type=contribution_type,
                                                                                state=state,
-                                                                               source=source).values_list('entity_id', flat=True))
+                                                                               source=source).values('entity_id')
+        query = query.filter(entity_id__in=entities_ids)
 
-    might = 0
+    entities = {}
 
-    for entity_id in entities_ids:
-        author_id, contributors_count = get_linguistic_entity_info(entity_id, contribution_type, source)
+    for entity_id, type, account_id in query.order_by('created_at').values_list('entity_id', 'type', 'account_id'):
+        entities.setdefault(entity_id, []).append((type, account_id))
 
-        if author_id == account_id:
-            might += might_per_added_entity
-        else:
-            might += might_per_edited_entity / contributors_count
+    for contributors in entities.values():
+        author_type, author_id = contributors[0]
 
-    return might
+        contributors_ids = [account_id for type, account_id in contributors if type == contribution_type]
+
+        contributors_count = len(contributors_ids)
+
+        if author_type == contribution_type:
+            contributors_count -= 1
+
+        for account_id in set(contributors_ids):
+            if accounts_ids is not None and account_id not in accounts_ids:
+                continue
+
+            if author_id == account_id:
+                might = might_per_added_entity
+            else:
+                might = might_per_edited_entity / contributors_count
+
+            mights[account_id] = mights.get(account_id, 0) + might
 
 
 def folclor_post_might(characters_count):
@@ -74,88 +94,128 @@ def folclor_post_might(characters_count):
     return might
 
 
-def calculate_might(account): # pylint: disable=R0914
+def calculate_mights(accounts_ids=None): # pylint: disable=R0914
+    '''
+    returns {account_id: might} for accounts with non zero might
+    if accounts_ids is None, calculates might of all accounts
+    '''
 
     MIGHT_FROM_REFERRAL = 0.1
 
-    might = 0
-
-    might += Post.objects.filter(thread__subcategory__restricted=False,
-                                 author_id=account.id,
-                                 state=POST_STATE.DEFAULT).count() * relations.MIGHT_AMOUNT.FOR_FORUM_POST.amount
-    might += Thread.objects.filter(subcategory__restricted=False,
-                                   author_id=account.id).count() * relations.MIGHT_AMOUNT.FOR_FORUM_THREAD.amount
-
-    might += Vote.objects.filter(owner_id=account.id).exclude(type=VOTE_TYPE.REFRAINED).count() * relations.MIGHT_AMOUNT.FOR_BILL_VOTE.amount
-    might += Bill.objects.filter(owner_id=account.id, state=BILL_STATE.ACCEPTED).count() * relations.MIGHT_AMOUNT.FOR_BILL_ACCEPTED.amount
-
-    might += calculate_linguistics_migth(account.id,
-                                         contribution_type=linguistics_relations.CONTRIBUTION_TYPE.WORD,
-                                         might_per_added_entity=relations.MIGHT_AMOUNT.FOR_ADDED_WORD_FOR_PLAYER.amount,
-                                         might_per_edited_entity=relations.MIGHT_AMOUNT.FOR_EDITED_WORD_FOR_PLAYER.amount,
-                                         source=linguistics_relations.CONTRIBUTION_SOURCE.PLAYER)
-    might += calculate_linguistics_migth(account.id,
-                                         contribution_type=linguistics_relations.CONTRIBUTION_TYPE.WORD,
-                                         might_per_added_entity=relations.MIGHT_AMOUNT.FOR_ADDED_WORD_FOR_MODERATOR.amount,
-                                         might_per_edited_entity=relations.MIGHT_AMOUNT.FOR_EDITED_WORD_FOR_MODERATOR.amount,
-                                         source=linguistics_relations.CONTRIBUTION_SOURCE.MODERATOR)
-    might += calculate_linguistics_migth(account.id,
-                                         contribution_type=linguistics_relations.CONTRIBUTION_TYPE.TEMPLATE,
-                                         might_per_added_entity=relations.MIGHT_AMOUNT.FOR_ADDED_TEMPLATE_FOR_PLAYER.amount,
-                                         might_per_edited_entity=relations.MIGHT_AMOUNT.FOR_EDITED_TEMPLATE_FOR_PLAYER.amount,
-                                         source=linguistics_relations.CONTRIBUTION_SOURCE.PLAYER)
-    might += calculate_linguistics_migth(account.id,
-                                         contribution_type=linguistics_relations.CONTRIBUTION_TYPE.TEMPLATE,
-                                         might_per_added_entity=relations.MIGHT_AMOUNT.FOR_ADDED_TEMPLATE_FOR_MODERATOR.amount,
-                                         might_per_edited_entity=relations.MIGHT_AMOUNT.FOR_EDITED_TEMPLATE_FOR_MODERATOR.amount,
-                                         source=linguistics_relations.CONTRIBUTION_SOURCE.MODERATOR)
-
-    folclor_posts = BlogPostProtype.from_query(BlogPostProtype._db_filter(author_id=account.id, state=BLOG_POST_STATE.ACCEPTED))
-    folclor_texts = (strip_tags(post.text_html) for post in folclor_posts)
-
-    for text in folclor_texts:
-        characters_count = len(text)
-        might += folclor_post_might(characters_count)
-
-    referrals_mights = AccountPrototype._model_class.objects.filter(referral_of=account.id).aggregate(models.Sum('might'))['might__sum']
-
-    might += referrals_mights * MIGHT_FROM_REFERRAL if referrals_mights else 0
+    if accounts_ids is not None:
+        accounts_ids = frozenset(accounts_ids)
+
+    mights = {}
+
+    _add_mights(mights,
+                _filter_accounts(Post.objects.filter(thread__subcategory__restricted=False, state=POST_STATE.DEFAULT), 'author_id', accounts_ids),
+                'author_id',
+                relations.MIGHT_AMOUNT.FOR_FORUM_POST.amount)
+    _add_mights(mights,
+                _filter_accounts(Thread.objects.filter(subcategory__restricted=False), 'author_id', accounts_ids),
+                'author_id',
+                relations.MIGHT_AMOUNT.FOR_FORUM_THREAD.amount)
+
+    _add_mights(mights,
+                _filter_accounts(Vote.objects.exclude(type=VOTE_TYPE.REFRAINED), 'owner_id', accounts_ids),
+                'owner_id',
+                relations.MIGHT_AMOUNT.FOR_BILL_VOTE.amount)
+    _add_mights(mights,
+                _filter_accounts(Bill.objects.filter(state=BILL_STATE.ACCEPTED), 'owner_id', accounts_ids),
+                'owner_id',
+                relations.MIGHT_AMOUNT.FOR_BILL_ACCEPTED.amount)
+
+    calculate_linguistics_mights(mights,
+                                 contribution_type=linguistics_relations.CONTRIBUTION_TYPE.WORD,
+                                 might_per_added_entity=relations.MIGHT_AMOUNT.FOR_ADDED_WORD_FOR_PLAYER.amount,
+                                 might_per_edited_entity=relations.MIGHT_AMOUNT.FOR_EDITED_WORD_FOR_PLAYER.amount,
+                                 source=linguistics_relations.CONTRIBUTION_SOURCE.PLAYER,
+                                 accounts_ids=accounts_ids)
+    calculate_linguistics_mights(mights,
+                                 contribution_type=linguistics_relations.CONTRIBUTION_TYPE.WORD,
+                                 might_per_added_entity=relations.MIGHT_AMOUNT.FOR_ADDED_WORD_FOR_MODERATOR.amount,
+                                 might_per_edited_entity=relations.MIGHT_AMOUNT.FOR_EDITED_WORD_FOR_MODERATOR.amount,
+                                 source=linguistics_relations.CONTRIBUTION_SOURCE.MODERATOR,
+                                 accounts_ids=accounts_ids)
+    calculate_linguistics_mights(mights,
+                                 contribution_type=linguistics_relations.CONTRIBUTION_TYPE.TEMPLATE,
+                                 might_per_added_entity=relations.MIGHT_AMOUNT.FOR_ADDED_TEMPLATE_FOR_PLAYER.amount,
+                                 might_per_edited_entity=relations.MIGHT_AMOUNT.FOR_EDITED_TEMPLATE_FOR_PLAYER.amount,
+                                 source=linguistics_relations.CONTRIBUTION_SOURCE.PLAYER,
+                                 accounts_ids=accounts_ids)
+    calculate_linguistics_mights(mights,
+                                 contribution_type=linguistics_relations.CONTRIBUTION_TYPE.TEMPLATE,
+                                 might_per_added_entity=relations.MIGHT_AMOUNT.FOR_ADDED_TEMPLATE_FOR_MODERATOR.amount,
+                                 might_per_edited_entity=relations.MIGHT_AMOUNT.FOR_EDITED_TEMPLATE_FOR_MODERATOR.amount,
+                                 source=linguistics_relations.CONTRIBUTION_SOURCE.MODERATOR,
+                                 accounts_ids=accounts_ids)
+
+    folclor_posts = _filter_accounts(BlogPostProtype._db_filter(state=BLOG_POST_STATE.ACCEPTED), 'author_id', accounts_ids)
+
+    for author_id, text in folclor_posts.values_list('author_id', 'text'):
+        characters_count = len(strip_tags(bbcode.render(text)))
+        mights[author_id] = mights.get(author_id, 0) + folclor_post_might(characters_count)
+
+    referrals_query = _filter_accounts(AccountPrototype._model_class.objects.filter(referral_of__isnull=False), 'referral_of_id', accounts_ids)
+
+    for account_id, referrals_might in referrals_query.values('referral_of_id').annotate(referrals_might=models.Sum('might')).order_by().values_list('referral_of_id', 'referrals_might'):
+        if referrals_might:
+            mights[account_id] = mights.get(account_id, 0) + referrals_might * MIGHT_FROM_REFERRAL
 
     for award_type in relations.AWARD_TYPE.records:
-        might += Award.objects.filter(account_id=account.id, type=award_type).count() * relations.MIGHT_AMOUNT.index_award[award_type][0].amount
+        _add_mights(mights,
+                    _filter_accounts(Award.objects.filter(type=award_type), 'account_id', accounts_ids),
+                    'account_id',
+                    relations.MIGHT_AMOUNT.index_award[award_type][0].amount)
 
-    return might
+    return mights
+
+
+def calculate_might(account):
+    return calculate_mights(accounts_ids=[account.id]).get(account.id, 0)
 
 
 def recalculate_accounts_might():
 
-    for account_model in AccountPrototype.live_query():
-        account = AccountPrototype(model=account_model)
+    mights = calculate_mights()
 
-        new_might = calculate_might(account)
+    changed_accounts_ids = [account_id
+                            for account_id, might in AccountPrototype.live_query().values_list('id', 'might')
+                            if might != mights.get(account_id, 0)]
 
-        if account.might != new_might:
-            account.set_might(new_might)
-            account.cmd_update_hero()
+    for account in AccountPrototype.from_query(AccountPrototype._db_filter(id__in=changed_accounts_ids)):
+        account.set_might(mights.get(account.id, 0))
+        account.cmd_update_hero()
 
     recalculate_folclor_rating()
 
 
+def folclor_vote_rating(might):
+    if might is None or might < 100:
+        might = 1
+    else:
+        might /= 100
+
+    return math.log(might) * 100
+
+
 def recalculate_folclor_rating():
     from the_tale.blogs import models as folclor_models
 
-    for post in folclor_models.Post.objects.all().iterator():
-        voters_ids = folclor_models.Vote.objects.filter(post_id=post.id).values_list('voter_id', flat=True)
+    ratings = {post_id: 0 for post_id in folclor_models.Post.objects.values_list('id', flat=True)}
 
-        rating = 0
+    for post_id, might in folclor_models.Vote.objects.values_list('post_id', 'voter__might'):
+        ratings[post_id] += folclor_vote_rating(might)
 
-        for account in AccountPrototype._model_class.objects.filter(id__in=voters_ids).iterator():
-            might = account.might
-            if might is None or might < 100:
-                might = 1
-            else:
-                might /= 100
+    old_ratings = dict(folclor_models.Post.objects.values_list('id', 'rating'))
+
+    posts_by_rating = {}
+
+    for post_id, rating in ratings.items():
+        rating = int(math.ceil(rating))
 
-            rating += math.log(might) * 100
+        if old_ratings.get(post_id) != rating:
+            posts_by_rating.setdefault(rating, []).append(post_id)
 
-        folclor_models.Post.objects.filter(id=post.id).update(rating=int(math.ceil(rating)))
+    for rating, posts_ids in posts_by_rating.items():
+        folclor_models.Post.objects.filter(id__in=posts_ids).update(rating=rating)
@@ -43,6 +43,22 @@ class AccountPrototypeTests(testcase.TestCase, pm_helpers.Mixin):
                 continue
             self.account.get_achievement_type_value(achievement_type)
 
+    def test_achievement_type_values(self):
+        self.account.set_might(666)
+
+        for achievement_type in ACHIEVEMENT_TYPE.records:
+            if not achievement_type.source.is_ACCOUNT:
+                continue
+
+            values = dict(logic.achievement_type_values(achievement_type))
+            self.assertEqual(values.get(self.account.id, 0), self.account.get_achievement_type_value(achievement_type))
+
+    def test_achievement_type_values__barrier(self):
+        self.account.set_might(666)
+
+        self.assertEqual(dict(logic.achievement_type_values(ACHIEVEMENT_TYPE.KEEPER_MIGHT, barrier=666)), {self.account.id: 666})
+        self.assertEqual(dict(logic.achievement_type_values(ACHIEVEMENT_TYPE.KEEPER_MIGHT, barrier=667)), {})
+
 
     @mock.patch('the_tale.accounts.conf.accounts_settings.ACTIVE_STATE_REFRESH_PERIOD', 0)
     def test_update_active_state__expired(self):
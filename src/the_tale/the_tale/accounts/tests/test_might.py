@@ -1,5 +1,7 @@
 # coding: utf-8
 
+from unittest import mock
+
 from the_tale.common.utils import testcase
 
 from the_tale.forum.prototypes import CategoryPrototype, SubCategoryPrototype, ThreadPrototype, PostPrototype
@@ -22,7 +24,8 @@ from the_tale.game.bills.models import Vote
 from the_tale.game.bills.conf import bills_settings
 from the_tale.game.bills.relations import BILL_STATE, VOTE_TYPE
 
-from the_tale.accounts.might import calculate_might, folclor_post_might
+from the_tale.accounts.might import calculate_might, calculate_mights, folclor_post_might, recalculate_accounts_might
+from the_tale.accounts.prototypes import AccountPrototype
 
 from the_tale.linguistics import prototypes as linguistics_prototypes
 from the_tale.linguistics import relations as linguistics_relations
@@ -371,6 +374,23 @@ class CalculateMightTests(testcase.TestCase):
 
         self.assertTrue(calculate_might(self.account) > 0)
 
+    def test_calculate_mights__all_accounts(self):
+        Award.objects.create(account=self.account._model, type=relations.AWARD_TYPE.BUG_MINOR)
+        Award.objects.create(account=self.account_2._model, type=relations.AWARD_TYPE.BUG_MAJOR)
+
+        self.assertEqual(calculate_mights(), {self.account.id: calculate_might(self.account),
+                                              self.account_2.id: calculate_might(self.account_2)})
+
+    def test_recalculate_accounts_might__only_changed(self):
+        Award.objects.create(account=self.account._model, type=relations.AWARD_TYPE.BUG_MINOR)
+
+        with mock.patch('the_tale.accounts.prototypes.AccountPrototype.cmd_update_hero') as cmd_update_hero:
+            recalculate_accounts_might()
+
+        self.assertEqual(cmd_update_hero.call_count, 1)
+        self.assertEqual(AccountPrototype.get_by_id(self.account.id).might, relations.MIGHT_AMOUNT.AWARD_BUG_MINOR.amount)
+        self.assertEqual(AccountPrototype.get_by_id(self.account_2.id).might, 0)
+
 
 
 class CalculateMightHelpersTests(testcase.TestCase):
@@ -3,6 +3,7 @@
 from dext.common.amqp_queues.environment import BaseEnvironment
 
 from the_tale.game.conf import game_settings
+from the_tale.game.quests.conf import quests_settings
 
 
 class Environment(BaseEnvironment):
@@ -41,15 +42,33 @@ class Environment(BaseEnvironment):
         self.workers.market_manager = market_manager.Worker(name='market_manager')
 
         self.workers.supervisor = supervisor.Worker(name='supervisor')
-        self.workers.logic_1 = logic.Worker(name='logic_1')
-        self.workers.logic_2 = logic.Worker(name='logic_2')
+
+        for logic_worker_name in self.logic_workers_names():
+            setattr(self.workers, logic_worker_name, logic.Worker(name=logic_worker_name))
+
         self.workers.highlevel = highlevel.Worker(name='highlevel')# if game_settings.ENABLE_WORKER_HIGHLEVEL else None
         self.workers.turns_loop = turns_loop.Worker(name='turns_loop')# if game_settings.ENABLE_WORKER_TURNS_LOOP else None
         self.workers.game_long_commands = game_long_commands.Worker(name='game_long_commands')
         self.workers.pvp_balancer = balancer.Worker(name='pvp_balancer')# if game_settings.ENABLE_PVP else None
-        self.workers.quests_generator = quests_generator.Worker(name='quests_generator')
+
+        for quests_generator_name in self.quests_generators_names():
+            setattr(self.workers, quests_generator_name, quests_generator.Worker(name=quests_generator_name))
 
         super(Environment, self).initialize()
 
+    def logic_workers_names(self):
+        return ['logic_%d' % (i + 1) for i in range(game_settings.LOGIC_WORKERS_NUMBER)]
+
+    def logic_workers(self):
+        return [getattr(self.workers, logic_worker_name) for logic_worker_name in self.logic_workers_names()]
+
+    def quests_generators_names(self):
+        return ['quests_generator_%d' % (i + 1) for i in range(quests_settings.GENERATORS_NUMBER)]
+
+    def quests_generator(self, account_id):
+        # all requests of account go to the same generator, so it can merge them
+        names = self.quests_generators_names()
+        return getattr(self.workers, names[account_id % len(names)])
+
 
 environment = Environment()
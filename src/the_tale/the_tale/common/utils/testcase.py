@@ -26,6 +26,7 @@ def setUp(self):
     settings.refresh(force=True)
 
     heroes_storage.position_descriptions.clear()
+    heroes_storage.diary_versions.clear()
 
     places_storage.places.clear()
     places_storage.buildings.clear()
@@ -0,0 +1,49 @@
+# coding: utf-8
+import time
+
+from unittest import mock
+
+from tt_protocol.protocol import diary_pb2
+
+from the_tale.common.utils import testcase
+from the_tale.common.utils import tt_api
+
+
+class BatchSenderThreadTests(testcase.TestCase):
+
+    def setUp(self):
+        super(BatchSenderThreadTests, self).setUp()
+        self.thread = tt_api.BatchSenderThread(url='http://example.com/batch',
+                                               BatchType=diary_pb2.PushMessagesBatchRequest,
+                                               max_size=3,
+                                               max_delay=0.01)
+
+    def create_request(self, account_id):
+        return diary_pb2.PushMessageRequest(account_id=account_id, diary_size=10)
+
+    def test_collect_batch__max_size(self):
+        for i in range(5):
+            self.thread.queue.put(self.create_request(i))
+
+        self.assertEqual([request.account_id for request in self.thread.collect_batch()], [0, 1, 2])
+        self.assertEqual([request.account_id for request in self.thread.collect_batch()], [3, 4])
+
+    def test_collect_batch__max_delay(self):
+        self.thread.queue.put(self.create_request(1))
+
+        started_at = time.time()
+
+        self.assertEqual([request.account_id for request in self.thread.collect_batch()], [1])
+
+        self.assertTrue(time.time() - started_at < 1)
+
+    def test_async_batch_request(self):
+        with mock.patch('the_tale.common.utils.tt_api.BatchSenderThread.start') as start:
+            with mock.patch.dict(tt_api.BATCH_THREADS, {}):
+                tt_api.async_batch_request(url='http://example.com/batch', data=self.create_request(1), BatchType=diary_pb2.PushMessagesBatchRequest, max_size=3, max_delay=0.01)
+                tt_api.async_batch_request(url='http://example.com/batch', data=self.create_request(2), BatchType=diary_pb2.PushMessagesBatchRequest, max_size=3, max_delay=0.01)
+
+                thread = tt_api.BATCH_THREADS['http://example.com/batch']
+
+        self.assertEqual(start.call_count, 1)
+        self.assertEqual([request.account_id for request in thread.collect_batch()], [1, 2])
@@ -1,5 +1,6 @@
 
 import sys
+import time
 import queue
 import logging
 import threading
@@ -14,9 +15,21 @@ from . import exceptions
 THREAD = None
 QUEUE = queue.Queue()
 
+BATCH_THREADS = {}
+BATCH_THREADS_LOCK = threading.Lock()
+
+# requests sessions are not thread safe, so every thread uses its own session (and its own keep-alive connections)
+SESSIONS = threading.local()
+
+
+def get_session():
+    if not hasattr(SESSIONS, 'session'):
+        SESSIONS.session = requests.Session()
+    return SESSIONS.session
+
 
 def sync_request(url, data, AnswerType=None):
-    response = requests.post(url, data=data.SerializeToString())
+    response = get_session().post(url, data=data.SerializeToString())
 
     if response.status_code != 200:
         raise exceptions.TTAPIUnexpectedHTTPStatus(url=url, status=response.status_code)
@@ -46,6 +59,19 @@ def async_request(url, data, AnswerType=None, callback=lambda answer: None):
     QUEUE.put((url, data, AnswerType, callback))
 
 
+def async_batch_request(url, data, BatchType, max_size, max_delay):
+    '''
+    data are collected and sent to url as BatchType(requests=[data, ...])
+    batch is sent when it contains max_size requests or when max_delay seconds passed since its first request
+    '''
+    with BATCH_THREADS_LOCK:
+        if url not in BATCH_THREADS:
+            BATCH_THREADS[url] = BatchSenderThread(url=url, BatchType=BatchType, max_size=max_size, max_delay=max_delay)
+            BATCH_THREADS[url].start()
+
+    BATCH_THREADS[url].queue.put(data)
+
+
 
 class SenderThread(threading.Thread):
 
@@ -64,3 +90,45 @@ class SenderThread(threading.Thread):
                 self.logger.error('Exception tt_api_sender',
                                    exc_info=sys.exc_info(),
                                    extra={} )
+
+
+
+class BatchSenderThread(threading.Thread):
+
+    def __init__(self, url, BatchType, max_size, max_delay):
+        super().__init__(name='tt_api_batch_sender', daemon=True)
+        self.logger = logging.getLogger('the-tale.tt_api_sender')
+        self.url = url
+        self.BatchType = BatchType
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.queue = queue.Queue()
+
+    def collect_batch(self):
+        batch = [self.queue.get()]
+
+        deadline = time.time() + self.max_delay
+
+        while len(batch) < self.max_size:
+            timeout = deadline - time.time()
+
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(self.queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def run(self):
+        while True:
+            try:
+                batch = self.collect_batch()
+                self.logger.info('send {number} requests to url {url}'.format(number=len(batch), url=self.url))
+                sync_request(self.url, self.BatchType(requests=batch))
+            except Exception:
+                self.logger.error('Exception tt_api_batch_sender',
+                                   exc_info=sys.exc_info(),
+                                   extra={} )
@@ -1,4 +1,5 @@
 # coding: utf-8
+import bisect
 import random
 import itertools
 
@@ -22,12 +23,13 @@ class ArtifactsStorage(storage.CachedStorage):
         self.artifacts = []
         self.loot = []
         self._artifacts_by_types = { artifact_type: [] for artifact_type in relations.ARTIFACT_TYPE.records}
-        self._mob_artifacts = {}
-        self._mob_loot = {}
+        self._sampling_tables = None
 
     def _update_cached_data(self, item):
         self._artifacts_by_uuids[item.uuid] = item
 
+        self._sampling_tables = None
+
         if not item.state.is_ENABLED:
             return
 
@@ -38,9 +40,6 @@ class ArtifactsStorage(storage.CachedStorage):
 
         self._artifacts_by_types[item.type].append(item)
 
-        self._mob_artifacts = {}
-        self._mob_loot = {}
-
     def get_by_uuid(self, uuid):
         self.sync()
         return self._artifacts_by_uuids[uuid]
@@ -52,19 +51,36 @@ class ArtifactsStorage(storage.CachedStorage):
     def artifacts_for_type(self, types):
         return list(itertools.chain(*[self._artifacts_by_types[type_] for type_ in types] ))
 
-    def generate_artifact_from_list(self, artifacts_list, level, rarity):
+    def _create_sampling_tables(self):
+        tables = {}
 
-        artifact_choices = []
+        for record in self.all():
+            if not record.state.is_ENABLED:
+                continue
 
-        for artifact_record in artifacts_list:
-            if artifact_record.state.is_ENABLED and artifact_record.accepted_for_level(level):
-                artifact_choices.append(artifact_record)
+            if record.is_useless:
+                keys = [('loot', None), ('mob_loot', record.mob_id)]
+            else:
+                keys = [('artifacts', None), ('mob_artifacts', record.mob_id)]
 
-        if not artifact_choices:
-            return None
+            for key in keys:
+                tables.setdefault(key, []).append(record)
 
-        artifact_record = random.choice(artifact_choices)
+        for key, records in tables.items():
+            records.sort(key=lambda record: record.level)
+            tables[key] = ([record.level for record in records], records)
 
+        return tables
+
+    def _get_sampling_table(self, kind, mob_id=None):
+        self.sync()
+
+        if self._sampling_tables is None:
+            self._sampling_tables = self._create_sampling_tables()
+
+        return self._sampling_tables.get((kind, mob_id), ((), ()))
+
+    def _create_artifact(self, artifact_record, level, rarity):
         if artifact_record.is_useless:
             power = Power(0, 0)
         else:
@@ -75,20 +91,35 @@ class ArtifactsStorage(storage.CachedStorage):
                                                power=power,
                                                rarity=rarity)
 
+    def generate_artifact_from_list(self, artifacts_list, level, rarity):
 
-    def get_mob_artifacts(self, mob_id):
-        self.sync()
+        artifact_choices = []
 
-        if mob_id not in self._mob_artifacts:
-            self._mob_artifacts[mob_id] = [artifact for artifact in self.artifacts if artifact.mob_id == mob_id] # pylint: disable=W0110
-        return self._mob_artifacts[mob_id]
+        for artifact_record in artifacts_list:
+            if artifact_record.state.is_ENABLED and artifact_record.accepted_for_level(level):
+                artifact_choices.append(artifact_record)
 
-    def get_mob_loot(self, mob_id):
-        self.sync()
+        if not artifact_choices:
+            return None
+
+        return self._create_artifact(random.choice(artifact_choices), level, rarity)
 
-        if mob_id not in self._mob_loot:
-            self._mob_loot[mob_id] = [artifact for artifact in self.loot if artifact.mob_id == mob_id] # pylint: disable=W0110
-        return self._mob_loot[mob_id]
+    def generate_artifact_from_table(self, kind, level, rarity, mob_id=None):
+        levels, records = self._get_sampling_table(kind, mob_id)
+
+        # records sorted by level, so accepted for level records are prefix of list
+        records_number = bisect.bisect_right(levels, level)
+
+        if records_number == 0:
+            return None
+
+        return self._create_artifact(records[random.randrange(records_number)], level, rarity)
+
+    def get_mob_artifacts(self, mob_id):
+        return self._get_sampling_table('mob_artifacts', mob_id)[1]
+
+    def get_mob_loot(self, mob_id):
+        return self._get_sampling_table('mob_loot', mob_id)[1]
 
     def get_rarity_type(self, hero):
         choices = ( (relations.RARITY.NORMAL, relations.RARITY.NORMAL.probability),
@@ -99,10 +130,10 @@ class ArtifactsStorage(storage.CachedStorage):
     def generate_loot(self, hero, mob):
 
         if random.uniform(0, 1) < hero.artifacts_probability(mob):
-            return self.generate_artifact_from_list(self.get_mob_artifacts(mob.record.id), mob.level, rarity=self.get_rarity_type(hero))
+            return self.generate_artifact_from_table('mob_artifacts', mob.level, rarity=self.get_rarity_type(hero), mob_id=mob.record.id)
 
         if random.uniform(0, 1) < hero.loot_probability(mob):
-            return self.generate_artifact_from_list(self.get_mob_loot(mob.record.id), mob.record.level, rarity=relations.RARITY.NORMAL)
+            return self.generate_artifact_from_table('mob_loot', mob.record.level, rarity=relations.RARITY.NORMAL, mob_id=mob.record.id)
 
         return None
 
@@ -111,9 +142,9 @@ class ArtifactsStorage(storage.CachedStorage):
         artifact_level = random.randint(1, hero.level)
 
         if random.uniform(0, 1) < hero.artifacts_probability(None) * artifact_probability_multiplier:
-            return self.generate_artifact_from_list(self.artifacts, artifact_level, rarity=self.get_rarity_type(hero))
+            return self.generate_artifact_from_table('artifacts', artifact_level, rarity=self.get_rarity_type(hero))
 
-        return self.generate_artifact_from_list(self.loot, artifact_level, rarity=relations.RARITY.NORMAL)
+        return self.generate_artifact_from_table('loot', artifact_level, rarity=relations.RARITY.NORMAL)
 
 
 
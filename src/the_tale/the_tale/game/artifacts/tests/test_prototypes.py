@@ -176,6 +176,40 @@ class PrototypeTests(testcase.TestCase):
                 self.assertEqual(artifacts_storage.generate_loot(self.hero, mob), None)
 
 
+    def test_generate_artifact_from_table(self):
+        high_level_helmet = ArtifactRecordPrototype.create_random('high_level_helmet', level=3, type_=relations.ARTIFACT_TYPE.HELMET)
+
+        for i in range(100):
+            artifact = artifacts_storage.generate_artifact_from_table('artifacts', 2, rarity=relations.RARITY.NORMAL)
+            self.assertFalse(artifact.type.is_USELESS)
+            self.assertNotEqual(artifact.record.id, high_level_helmet.id)
+
+        for i in range(100):
+            artifact = artifacts_storage.generate_artifact_from_table('loot', 2, rarity=relations.RARITY.NORMAL)
+            self.assertTrue(artifact.type.is_USELESS)
+
+        self.assertEqual(artifacts_storage.generate_artifact_from_table('artifacts', 0, rarity=relations.RARITY.NORMAL), None)
+        self.assertEqual(artifacts_storage.generate_artifact_from_table('mob_loot', 666, rarity=relations.RARITY.NORMAL, mob_id=666), None)
+
+    def test_generate_artifact_from_table__reset_on_save(self):
+        helmet = ArtifactRecordPrototype.create_random('helmet_2', type_=relations.ARTIFACT_TYPE.HELMET)
+
+        self.assertIn(helmet, artifacts_storage._get_sampling_table('artifacts')[1])
+
+        helmet.state = relations.ARTIFACT_RECORD_STATE.DISABLED
+        helmet.save()
+
+        self.assertNotIn(helmet, artifacts_storage._get_sampling_table('artifacts')[1])
+
+    def test_sampling_tables__sorted_by_level(self):
+        ArtifactRecordPrototype.create_random('helmet_2', level=3, type_=relations.ARTIFACT_TYPE.HELMET)
+        ArtifactRecordPrototype.create_random('helmet_3', level=2, type_=relations.ARTIFACT_TYPE.HELMET)
+
+        levels, records = artifacts_storage._get_sampling_table('artifacts')
+
+        self.assertEqual(levels, sorted(levels))
+        self.assertEqual(levels, [record.level for record in records])
+
     @mock.patch('the_tale.game.heroes.objects.Hero.artifacts_probability', lambda self, mob: 1.0)
     def test_generate_artifact__rarity(self):
         from the_tale.game.mobs.prototypes import MobPrototype, MobRecordPrototype
@@ -13,7 +13,7 @@ from the_tale.game.cards import effects
 
 class CardsContainer(object):
 
-    __slots__ = ('_cards', '_hero', '_help_count', '_premium_help_count', '_next_uid')
+    __slots__ = ('_cards', '_hero', '_help_count', '_premium_help_count', '_next_uid', '_ui_info')
 
     def __init__(self):
         self._cards = {}
@@ -21,6 +21,10 @@ class CardsContainer(object):
         self._help_count = 0
         self._premium_help_count = 0
         self._next_uid = 0
+        self._ui_info = None
+
+    def mark_updated(self):
+        self._ui_info = None
 
     def _get_next_uid(self):
         self._next_uid += 1
@@ -50,9 +54,12 @@ class CardsContainer(object):
         return obj
 
     def ui_info(self):
-        return {'cards': [card.ui_info() for card in self._cards.values()],
-                'help_count': self._help_count,
-                'help_barrier': c.CARDS_HELP_COUNT_TO_NEW_CARD }
+        if self._ui_info is None:
+            self._ui_info = {'cards': [card.ui_info() for card in self._cards.values()],
+                             'help_count': self._help_count,
+                             'help_barrier': c.CARDS_HELP_COUNT_TO_NEW_CARD }
+
+        return self._ui_info
 
     @classmethod
     def ui_info_null(self):
@@ -61,6 +68,7 @@ class CardsContainer(object):
                 'help_barrier': c.CARDS_HELP_COUNT_TO_NEW_CARD }
 
     def add_card(self, card):
+        self.mark_updated()
         card.uid = self._get_next_uid()
         self._cards[card.uid] = card
         goods_types.cards_hero_good.sync_added_item(self._hero.account_id, card)
@@ -70,6 +78,8 @@ class CardsContainer(object):
         if card_uid not in self._cards:
             raise exceptions.RemoveUnexistedCardError(card_uid=card_uid)
 
+        self.mark_updated()
+
         goods_types.cards_hero_good.sync_removed_item(self._hero.account_id, self._cards[card_uid])
 
         del self._cards[card_uid]
@@ -89,6 +99,8 @@ class CardsContainer(object):
         if self._help_count + delta < 0:
             raise exceptions.HelpCountBelowZero(current_value=self._help_count, delta=delta)
 
+        self.mark_updated()
+
         self._help_count += delta
 
         if delta > 0 and self._hero.is_premium:
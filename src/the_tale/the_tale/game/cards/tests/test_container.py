@@ -139,6 +139,27 @@ class ContainerTests(testcase.TestCase):
         self.assertEqual(self.container._help_count, 0)
         self.assertEqual(self.container._premium_help_count, 0)
 
+    def test_ui_info__cached(self):
+        self.assertIs(self.container.ui_info(), self.container.ui_info())
+
+    def test_ui_info__reset_on_changes(self):
+        card = objects.Card(relations.CARD_TYPE.KEEPERS_GOODS_COMMON)
+
+        ui_info = self.container.ui_info()
+        self.container.add_card(card)
+        self.assertEqual(len(self.container.ui_info()['cards']), 1)
+        self.assertIsNot(ui_info, self.container.ui_info())
+
+        ui_info = self.container.ui_info()
+        self.container.change_help_count(1)
+        self.assertEqual(self.container.ui_info()['help_count'], 1)
+        self.assertIsNot(ui_info, self.container.ui_info())
+
+        ui_info = self.container.ui_info()
+        self.container.remove_card(card.uid)
+        self.assertEqual(self.container.ui_info()['cards'], [])
+        self.assertIsNot(ui_info, self.container.ui_info())
+
     def test_change_help_count__below_zero(self):
         self.assertRaises(exceptions.HelpCountBelowZero, self.container.change_help_count, -5)
 
@@ -1,6 +1,8 @@
 # coding: utf-8
 import os
 
+from django.conf import settings as project_settings
+
 from dext.common.utils.app_settings import app_settings
 
 from the_tale.game.balance import constants as c
@@ -19,6 +21,9 @@ game_settings = app_settings('GAME',
 
                              ENABLE_DATA_REFRESH=True,
 
+                             LOGIC_WORKERS_NUMBER=int(os.getenv('TT_LOGIC_WORKERS_NUMBER', 2)), # setupped by deploy from tt_logic_workers
+                             INITIALIZE_WAIT_LOGIC_TIMEOUT = 10*60,
+
                              PROCESS_TURN_WAIT_LOGIC_TIMEOUT = 5*60,
                              PROCESS_TURN_WAIT_HIGHLEVEL_TIMEOUT = 10*60,
 
@@ -35,8 +40,14 @@ game_settings = app_settings('GAME',
                              GAME_STATE_KEY='game state',
 
                              INFO_API_VERSION='1.7',
+                             INFO_CACHING_ENABLED=not project_settings.TESTS_RUNNING,
+                             INFO_CACHING_KEY='game_info_%s',
+                             INFO_CACHING_TIMEOUT=c.TURN_DELTA * 2,
                              DIARY_API_VERSION='1.0',
 
+                             TURN_UPDATES_PUSH_URL='http://localhost:10003/push-turns',
+                             TURN_UPDATES_WAIT_URL=None, # public url of turn updates long polling (proxied to service), None — push channel is turned off
+
                              SAVE_ON_EXCEPTION_TIMEOUT=60*60, # seconds
 
                              TEXTGEN_SOURCES_DIR=os.path.join(APP_DIR, 'fixtures', 'textgen', 'texts_src'),
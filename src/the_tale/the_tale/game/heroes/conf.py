@@ -16,12 +16,18 @@ heroes_settings = app_settings('HEROES',
                                MIN_PVP_BATTLES=25,
 
                                UI_CACHING_KEY='hero_ui_%d',
+                               UI_CACHING_STAMP_KEY='hero_ui_stamp_%d', # changed when hero ui info recached in the middle of turn
                                UI_CACHING_TIME=10*60, # not cache livetime, but time period after setupped ui_caching_started_at in which ui_caching is turned on
                                UI_CACHING_CONTINUE_TIME=60, # time before caching end, when we send next cache command
                                UI_CACHING_TIMEOUT=60, # cache livetime
+                               UI_CACHING_COMPRESSION=False, # store cached ui info as compressed json
+                               UI_CACHING_COMPRESSION_LEVEL=1,
+                               UI_CACHING_COMPRESSION_TAG='zui1:', # format version of compressed ui info
 
                                DUMP_CACHED_HEROES=False, # should we dump cached heroes to database
 
+                               BULK_SAVE_CHUNK_SIZE=500, # heroes number saved by one UPDATE request
+
                                START_ENERGY_BONUS=10,
                                MAX_HELPS_IN_TURN=10,
 
@@ -39,6 +45,11 @@ heroes_settings = app_settings('HEROES',
                                ACTIVE_BILLS_MAXIMUM=4,
 
                                DIARY_PUSH_MESSAGE_URL='http://localhost:10001/push-message',
+                               DIARY_PUSH_MESSAGES_BATCH_URL='http://localhost:10001/push-messages-batch',
+                               DIARY_PUSH_BATCH_SIZE=1000, # max messages number in one push request
+                               DIARY_PUSH_BATCH_DELAY=0.5, # max delay (in seconds) of message before push
                                DIARY_VERSION_URL='http://localhost:10001/version',
+                               DIARY_VERSIONS_URL='http://localhost:10001/versions',
+                               DIARY_VERSION_CACHE_TIMEOUT=c.TURN_DELTA, # max livetime of diary version in web process cache (versions are reset with every turn of hero's data)
                                DIARY_URL='http://localhost:10001/diary'
     )
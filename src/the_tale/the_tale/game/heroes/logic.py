@@ -1,10 +1,12 @@
 # coding: utf-8
 import random
+import hashlib
 import datetime
 
 from utg import words as utg_words
 
 from django.db import models as django_models
+from django.db import connection
 
 from dext.common.utils import s11n
 
@@ -36,17 +38,94 @@ from . import statistics
 from . import preferences
 from . import relations
 from . import messages
+from . import storage
 from . import places_help_statistics
 from . import habilities
 from . import bag
 from . import conf
 from . import habits
+from . import exceptions
 
 
 def live_query():
     return models.Hero.objects.filter(is_fast=False, is_bot=False)
 
 
+def _pvp_victories_percents(battles_number, victories):
+    return int(float(victories) / battles_number * 100)
+
+
+def _achievement_type_columns(achievement_type):
+    '''
+    returns (query, columns, value_getter) for calculation of Hero.get_achievement_type_value without loading heroes
+    value_getter is None for values stored in single column
+    '''
+
+    query = models.Hero.objects.all()
+
+    if achievement_type.is_TIME:
+        return (query,
+                ('last_rare_operation_at_turn', 'created_at_turn'),
+                lambda last_rare_operation_at_turn, created_at_turn: f.turns_to_game_time(last_rare_operation_at_turn - created_at_turn)[0])
+    elif achievement_type.is_MONEY:
+        return (query,
+                ('stat_money_earned_from_loot',
+                 'stat_money_earned_from_artifacts',
+                 'stat_money_earned_from_quests',
+                 'stat_money_earned_from_help',
+                 'stat_money_earned_from_habits',
+                 'stat_money_earned_from_companions',
+                 'stat_money_earned_from_masters'),
+                lambda *money: sum(money))
+    elif achievement_type.is_MOBS:
+        return query, ('stat_pve_kills',), None
+    elif achievement_type.is_ARTIFACTS:
+        return query, ('stat_artifacts_had',), None
+    elif achievement_type.is_QUESTS:
+        return query, ('stat_quests_done',), None
+    elif achievement_type.is_DEATHS:
+        return query, ('stat_pve_deaths',), None
+    elif achievement_type.is_PVP_BATTLES_1X1:
+        return query, ('stat_pvp_battles_1x1_number',), None
+    elif achievement_type.is_PVP_VICTORIES_1X1:
+        return (query.filter(stat_pvp_battles_1x1_number__gte=conf.heroes_settings.MIN_PVP_BATTLES),
+                ('stat_pvp_battles_1x1_number', 'stat_pvp_battles_1x1_victories'),
+                _pvp_victories_percents)
+    elif achievement_type.is_KEEPER_HELP_COUNT:
+        return query, ('stat_help_count',), None
+    elif achievement_type.is_HABITS_HONOR:
+        return query, ('habit_honor',), None
+    elif achievement_type.is_HABITS_PEACEFULNESS:
+        return query, ('habit_peacefulness',), None
+    elif achievement_type.is_KEEPER_CARDS_USED:
+        return query, ('stat_cards_used',), None
+    elif achievement_type.is_KEEPER_CARDS_COMBINED:
+        return query, ('stat_cards_combined',), None
+
+    raise exceptions.UnkwnownAchievementTypeError(achievement_type=achievement_type)
+
+
+def achievement_type_values(achievement_type, barrier=None):
+    '''
+    yields (account_id, value) pairs, where value equals to hero.get_achievement_type_value(achievement_type)
+    heroes with too few pvp battles are skipped for PVP_VICTORIES_1X1, since their value is 0
+    if barrier specified, heroes which can not reach it are skipped (where it can be done in database)
+    '''
+    query, columns, value_getter = _achievement_type_columns(achievement_type)
+
+    if value_getter is None and barrier:
+        if barrier > 0:
+            query = query.filter(**{'%s__gte' % columns[0]: barrier})
+        else:
+            query = query.filter(**{'%s__lte' % columns[0]: barrier})
+
+    for row in query.values_list('account_id', *columns).iterator():
+        if value_getter is None:
+            yield row[0], row[1]
+        else:
+            yield row[0], value_getter(*row[1:])
+
+
 def get_minimum_created_time_of_active_quests():
     created_at = models.Hero.objects.all().aggregate(django_models.Min('quest_created_time'))['quest_created_time__min']
     return created_at if created_at is not None else datetime.datetime.now()
@@ -175,7 +254,20 @@ def load_hero(hero_id=None, account_id=None, hero_model=None):
                         utg_name=utg_words.Word.deserialize(data['name']))
 
 
-def save_hero(hero, new=False):
+BLOB_FIELDS = ('data', 'abilities', 'cards', 'actions', 'preferences')
+
+
+def blobs_hashes(arguments):
+    return {field: hashlib.md5(arguments[field].encode('utf-8')).digest() for field in BLOB_FIELDS}
+
+
+def remove_unchanged_blobs(hero, arguments, hashes):
+    for field in BLOB_FIELDS:
+        if hero.saved_blobs_hashes.get(field) == hashes[field]:
+            del arguments[field]
+
+
+def save_arguments(hero):
     data = {'companion': hero.companion.serialize() if hero.companion else None,
             'name': hero.utg_name.serialize(),
             'quests': hero.quests.serialize(),
@@ -184,100 +276,171 @@ def save_hero(hero, new=False):
             'bag': hero.bag.serialize(),
             'actual_bills': hero.actual_bills}
 
-    arguments = dict(saved_at_turn=TimePrototype.get_current_turn_number(),
-                     saved_at=datetime.datetime.now(),
-                     data=s11n.to_json(data),
-                     abilities=s11n.to_json(hero.abilities.serialize()),
-                     cards=s11n.to_json(hero.cards.serialize()),
-                     actions=s11n.to_json(hero.actions.serialize()),
-                     raw_power_physic=hero.power.physic,
-                     raw_power_magic=hero.power.magic,
-                     quest_created_time = hero.quests.min_quest_created_time,
-                     preferences=s11n.to_json(hero.preferences.serialize()),
-                     stat_politics_multiplier=hero.politics_power_multiplier() if hero.can_change_all_powers() else 0,
-
-                     pos_previous_place_id=hero.position.previous_place_id,
-                     pos_place_id=hero.position.place_id,
-                     pos_road_id=hero.position.road_id,
-                     pos_percents=hero.position.percents,
-                     pos_invert_direction=hero.position.invert_direction,
-                     pos_from_x=hero.position.from_x,
-                     pos_from_y=hero.position.from_y,
-                     pos_to_x=hero.position.to_x,
-                     pos_to_y=hero.position.to_y,
-
-                     stat_pve_deaths=hero.statistics.pve_deaths,
-                     stat_pve_kills=hero.statistics.pve_kills,
-
-                     stat_money_earned_from_loot=hero.statistics.money_earned_from_loot,
-                     stat_money_earned_from_artifacts=hero.statistics.money_earned_from_artifacts,
-                     stat_money_earned_from_quests=hero.statistics.money_earned_from_quests,
-                     stat_money_earned_from_help=hero.statistics.money_earned_from_help,
-                     stat_money_earned_from_habits=hero.statistics.money_earned_from_habits,
-                     stat_money_earned_from_companions=hero.statistics.money_earned_from_companions,
-                     stat_money_earned_from_masters=hero.statistics.money_earned_from_masters,
-
-                     stat_money_spend_for_heal=hero.statistics.money_spend_for_heal,
-                     stat_money_spend_for_artifacts=hero.statistics.money_spend_for_artifacts,
-                     stat_money_spend_for_sharpening=hero.statistics.money_spend_for_sharpening,
-                     stat_money_spend_for_useless=hero.statistics.money_spend_for_useless,
-                     stat_money_spend_for_impact=hero.statistics.money_spend_for_impact,
-                     stat_money_spend_for_experience=hero.statistics.money_spend_for_experience,
-                     stat_money_spend_for_repairing=hero.statistics.money_spend_for_repairing,
-                     stat_money_spend_for_tax=hero.statistics.money_spend_for_tax,
-                     stat_money_spend_for_companions=hero.statistics.money_spend_for_companions,
-
-                     stat_artifacts_had=hero.statistics.artifacts_had,
-                     stat_loot_had=hero.statistics.loot_had,
-
-                     stat_help_count=hero.statistics.help_count,
-
-                     stat_quests_done=hero.statistics.quests_done,
-
-                     stat_companions_count=hero.statistics.companions_count,
-
-                     stat_pvp_battles_1x1_number=hero.statistics.pvp_battles_1x1_number,
-                     stat_pvp_battles_1x1_victories=hero.statistics.pvp_battles_1x1_victories,
-                     stat_pvp_battles_1x1_draws=hero.statistics.pvp_battles_1x1_draws,
-
-                     stat_cards_used=hero.statistics.cards_used,
-                     stat_cards_combined=hero.statistics.cards_combined,
-
-                     stat_gifts_returned=hero.statistics.gifts_returned,
-
-                     health=hero.health,
-                     level=hero.level,
-                     experience=hero.experience,
-                     energy=hero.energy,
-                     energy_bonus=hero.energy_bonus,
-                     money=hero.money,
-                     next_spending=hero.next_spending,
-                     habit_honor=hero.habit_honor.raw_value,
-                     habit_peacefulness=hero.habit_peacefulness.raw_value,
-                     created_at_turn=hero.created_at_turn,
-                     is_bot=hero.is_bot,
-                     is_alive=hero.is_alive,
-                     is_fast=hero.is_fast,
-                     gender=hero.gender,
-                     race=hero.race,
-                     last_energy_regeneration_at_turn=hero.last_energy_regeneration_at_turn,
-                     might=hero.might,
-                     ui_caching_started_at=hero.ui_caching_started_at,
-                     active_state_end_at=hero.active_state_end_at,
-                     premium_state_end_at=hero.premium_state_end_at,
-                     ban_state_end_at=hero.ban_state_end_at,
-                     last_rare_operation_at_turn=hero.last_rare_operation_at_turn,
-                     settings_approved=hero.settings_approved)
+    return dict(saved_at_turn=TimePrototype.get_current_turn_number(),
+                saved_at=datetime.datetime.now(),
+                data=s11n.to_json(data),
+                abilities=s11n.to_json(hero.abilities.serialize()),
+                cards=s11n.to_json(hero.cards.serialize()),
+                actions=s11n.to_json(hero.actions.serialize()),
+                raw_power_physic=hero.power.physic,
+                raw_power_magic=hero.power.magic,
+                quest_created_time = hero.quests.min_quest_created_time,
+                preferences=s11n.to_json(hero.preferences.serialize()),
+                stat_politics_multiplier=hero.politics_power_multiplier() if hero.can_change_all_powers() else 0,
+
+                pos_previous_place_id=hero.position.previous_place_id,
+                pos_place_id=hero.position.place_id,
+                pos_road_id=hero.position.road_id,
+                pos_percents=hero.position.percents,
+                pos_invert_direction=hero.position.invert_direction,
+                pos_from_x=hero.position.from_x,
+                pos_from_y=hero.position.from_y,
+                pos_to_x=hero.position.to_x,
+                pos_to_y=hero.position.to_y,
+
+                stat_pve_deaths=hero.statistics.pve_deaths,
+                stat_pve_kills=hero.statistics.pve_kills,
+
+                stat_money_earned_from_loot=hero.statistics.money_earned_from_loot,
+                stat_money_earned_from_artifacts=hero.statistics.money_earned_from_artifacts,
+                stat_money_earned_from_quests=hero.statistics.money_earned_from_quests,
+                stat_money_earned_from_help=hero.statistics.money_earned_from_help,
+                stat_money_earned_from_habits=hero.statistics.money_earned_from_habits,
+                stat_money_earned_from_companions=hero.statistics.money_earned_from_companions,
+                stat_money_earned_from_masters=hero.statistics.money_earned_from_masters,
+
+                stat_money_spend_for_heal=hero.statistics.money_spend_for_heal,
+                stat_money_spend_for_artifacts=hero.statistics.money_spend_for_artifacts,
+                stat_money_spend_for_sharpening=hero.statistics.money_spend_for_sharpening,
+                stat_money_spend_for_useless=hero.statistics.money_spend_for_useless,
+                stat_money_spend_for_impact=hero.statistics.money_spend_for_impact,
+                stat_money_spend_for_experience=hero.statistics.money_spend_for_experience,
+                stat_money_spend_for_repairing=hero.statistics.money_spend_for_repairing,
+                stat_money_spend_for_tax=hero.statistics.money_spend_for_tax,
+                stat_money_spend_for_companions=hero.statistics.money_spend_for_companions,
+
+                stat_artifacts_had=hero.statistics.artifacts_had,
+                stat_loot_had=hero.statistics.loot_had,
+
+                stat_help_count=hero.statistics.help_count,
+
+                stat_quests_done=hero.statistics.quests_done,
+
+                stat_companions_count=hero.statistics.companions_count,
+
+                stat_pvp_battles_1x1_number=hero.statistics.pvp_battles_1x1_number,
+                stat_pvp_battles_1x1_victories=hero.statistics.pvp_battles_1x1_victories,
+                stat_pvp_battles_1x1_draws=hero.statistics.pvp_battles_1x1_draws,
+
+                stat_cards_used=hero.statistics.cards_used,
+                stat_cards_combined=hero.statistics.cards_combined,
+
+                stat_gifts_returned=hero.statistics.gifts_returned,
+
+                health=hero.health,
+                level=hero.level,
+                experience=hero.experience,
+                energy=hero.energy,
+                energy_bonus=hero.energy_bonus,
+                money=hero.money,
+                next_spending=hero.next_spending,
+                habit_honor=hero.habit_honor.raw_value,
+                habit_peacefulness=hero.habit_peacefulness.raw_value,
+                created_at_turn=hero.created_at_turn,
+                is_bot=hero.is_bot,
+                is_alive=hero.is_alive,
+                is_fast=hero.is_fast,
+                gender=hero.gender,
+                race=hero.race,
+                last_energy_regeneration_at_turn=hero.last_energy_regeneration_at_turn,
+                might=hero.might,
+                ui_caching_started_at=hero.ui_caching_started_at,
+                active_state_end_at=hero.active_state_end_at,
+                premium_state_end_at=hero.premium_state_end_at,
+                ban_state_end_at=hero.ban_state_end_at,
+                last_rare_operation_at_turn=hero.last_rare_operation_at_turn,
+                settings_approved=hero.settings_approved)
+
+
+def save_hero(hero, new=False):
+    arguments = save_arguments(hero)
+
+    hashes = blobs_hashes(arguments)
 
     if new:
         models.Hero.objects.create(id=hero.id,
                                    account_id=hero.account_id,
                                    **arguments)
     else:
+        remove_unchanged_blobs(hero, arguments, hashes)
         models.Hero.objects.filter(id=hero.id).update(**arguments)
 
     hero.saved_at_turn = arguments['saved_at_turn']
     hero.saved_at = arguments['saved_at']
+    hero.saved_blobs_hashes = hashes
+
+
+def save_heroes(heroes):
+    heroes = list(heroes)
+
+    for i in range(0, len(heroes), conf.heroes_settings.BULK_SAVE_CHUNK_SIZE):
+        _save_heroes_chunk(heroes[i:i+conf.heroes_settings.BULK_SAVE_CHUNK_SIZE])
+
+
+def _save_heroes_chunk(heroes):
+    if not heroes:
+        return
+
+    if len(heroes) == 1:
+        save_hero(heroes[0])
+        return
+
+    heroes_arguments = [save_arguments(hero) for hero in heroes]
+    heroes_hashes = [blobs_hashes(arguments) for arguments in heroes_arguments]
+
+    fields = [models.Hero._meta.get_field(name) for name in heroes_arguments[0].keys()]
+
+    for hero, arguments, hashes in zip(heroes, heroes_arguments, heroes_hashes):
+        remove_unchanged_blobs(hero, arguments, hashes)
+
+    row_template = '(%%s::%s, %s)' % (models.Hero._meta.pk.rel_db_type(connection),
+                                      ', '.join('%%s::%s' % field.db_type(connection) for field in fields))
+
+    values = []
+
+    for hero, arguments in zip(heroes, heroes_arguments):
+        values.append(hero.id)
+        values.extend(field.get_db_prep_save(arguments.get(field.attname), connection) for field in fields)
+
+    # unchanged blobs are passed as NULL and keep their current values
+    assignments = []
+
+    for field in fields:
+        if field.attname in BLOB_FIELDS:
+            assignments.append('%(column)s=COALESCE(new_values.%(column)s, %(heroes)s.%(column)s)' % {'column': field.column,
+                                                                                                     'heroes': models.Hero._meta.db_table})
+        else:
+            assignments.append('%(column)s=new_values.%(column)s' % {'column': field.column})
+
+    sql_request = '''
+UPDATE %(heroes)s SET %(assignments)s
+FROM (VALUES %(rows)s) AS new_values (%(pk)s, %(columns)s)
+WHERE %(heroes)s.%(pk)s=new_values.%(pk)s
+'''
+
+    sql_request = sql_request % {'heroes': models.Hero._meta.db_table,
+                                 'pk': models.Hero._meta.pk.column,
+                                 'assignments': ', '.join(assignments),
+                                 'rows': ', '.join([row_template] * len(heroes)),
+                                 'columns': ', '.join(field.column for field in fields)}
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql_request, values)
+
+    for hero, arguments, hashes in zip(heroes, heroes_arguments, heroes_hashes):
+        hero.saved_at_turn = arguments['saved_at_turn']
+        hero.saved_at = arguments['saved_at']
+        hero.saved_blobs_hashes = hashes
 
 
 def dress_new_hero(hero):
@@ -395,18 +558,56 @@ def push_message_to_diary(account_id, message, is_premium):
                                       message=message.message,
                                       variables=message.get_variables())
 
-    tt_api.async_request(url=conf.heroes_settings.DIARY_PUSH_MESSAGE_URL,
-                         data=diary_pb2.PushMessageRequest(account_id=account_id,
-                                                           message=diary_message,
-                                                           diary_size=diary_size))
+    tt_api.async_batch_request(url=conf.heroes_settings.DIARY_PUSH_MESSAGES_BATCH_URL,
+                               data=diary_pb2.PushMessageRequest(account_id=account_id,
+                                                                 message=diary_message,
+                                                                 diary_size=diary_size),
+                               BatchType=diary_pb2.PushMessagesBatchRequest,
+                               max_size=conf.heroes_settings.DIARY_PUSH_BATCH_SIZE,
+                               max_delay=conf.heroes_settings.DIARY_PUSH_BATCH_DELAY)
 
 
 def diary_version(account_id):
-    answer = tt_api.sync_request(url=conf.heroes_settings.DIARY_VERSION_URL,
-                                 data=diary_pb2.VersionRequest(account_id=account_id),
-                                 AnswerType=diary_pb2.VersionResponse)
+    return diary_versions([account_id])[account_id]
+
+
+def diary_versions(accounts_ids, turns=None):
+    '''
+    turns: {account_id: turn of hero's data (actual_on_turn)}, current turn by default
+
+    diary messages of turn reach tt_diary after hero's data is saved,
+    so version is cached only for the turn of hero's data, with which it was requested
+    '''
+    current_turn_number = TimePrototype.get_current_turn_number()
+
+    if turns is None:
+        turns = {}
+
+    accounts_turns = [(account_id, turns.get(account_id, current_turn_number)) for account_id in accounts_ids]
+
+    versions = {}
+
+    for account_id, turn_number in accounts_turns:
+        version = storage.diary_versions.get(account_id, turn_number)
+
+        if version is not None:
+            versions[account_id] = version
+
+    not_cached = [(account_id, turn_number) for account_id, turn_number in accounts_turns if account_id not in versions]
+
+    if not not_cached:
+        return versions
+
+    answer = tt_api.sync_request(url=conf.heroes_settings.DIARY_VERSIONS_URL,
+                                 data=diary_pb2.VersionsRequest(accounts_ids=[account_id for account_id, turn_number in not_cached]),
+                                 AnswerType=diary_pb2.VersionsResponse)
+
+    storage.diary_versions.set_versions({account_id: (turn_number, version)
+                                         for (account_id, turn_number), version in zip(not_cached, answer.versions)})
+
+    versions.update((account_id, version) for (account_id, turn_number), version in zip(not_cached, answer.versions))
 
-    return answer.version
+    return versions
 
 
 def get_diary(account_id):
@@ -115,15 +115,21 @@ def _message_key(m): return (m.turn_number, m.timestamp)
 
 class MessagesContainer(object):
 
-    __slots__ = ('messages',)
+    __slots__ = ('messages', '_ui_info', '_ui_info_has_delayed')
 
     MESSAGES_LOG_LENGTH = None
 
     def __init__(self):
         self.messages = collections.deque(maxlen=self.MESSAGES_LOG_LENGTH)
+        self.mark_updated()
 
+    def mark_updated(self):
+        self._ui_info = None
+        self._ui_info_has_delayed = False
 
     def push_message(self, msg):
+        self.mark_updated()
+
         self.messages.append(msg)
 
         if len(self.messages) > 1 and (self.messages[-1].turn_number < self.messages[-2].turn_number or self.messages[-1].timestamp < self.messages[-2].timestamp):
@@ -137,12 +143,24 @@ class MessagesContainer(object):
     def clear(self):
         if self.messages:
             self.messages.clear()
+            self.mark_updated()
 
 
     def __len__(self): return len(self.messages)
 
 
     def ui_info(self, with_info=False):
+        if with_info:
+            return self._ui_info_for_turn(with_info=True)
+
+        # messages from future turns become visible without container changes, so info with them is rebuilt every time
+        if self._ui_info is None or self._ui_info_has_delayed:
+            self._ui_info = self._ui_info_for_turn(with_info=False)
+            self._ui_info_has_delayed = len(self._ui_info) < len(self.messages)
+
+        return self._ui_info
+
+    def _ui_info_for_turn(self, with_info):
         current_turn = TimePrototype.get_current_turn_number()
 
         messages = []
@@ -1,6 +1,10 @@
 # coding: utf-8
 import math
 import time
+import json
+import zlib
+import base64
+import binascii
 import random
 
 from dext.common.utils import cache
@@ -60,6 +64,7 @@ class Hero(logic_accessors.LogicAccessorsMixin,
                  'settings_approved',
 
                  'force_save_required',
+                 'saved_blobs_hashes',
                  'last_help_on_turn',
                  'helps_in_turn',
                  'level',
@@ -142,6 +147,9 @@ class Hero(logic_accessors.LogicAccessorsMixin,
 
         self.force_save_required = False
 
+        # hashes of serialized hero parts, which were written to database by last save
+        self.saved_blobs_hashes = {}
+
         self.last_help_on_turn = 0
         self.helps_in_turn = 0
 
@@ -580,6 +588,8 @@ class Hero(logic_accessors.LogicAccessorsMixin,
     # ui info
     ##########################
 
+    UI_INFO_TRACKED_SECTIONS = frozenset(('messages', 'bag', 'equipment', 'cards', 'quests'))
+
     def ui_info(self, actual_guaranteed, old_info=None):
         from the_tale.game.map.generator.drawer import get_hero_sprite
 
@@ -633,7 +643,13 @@ class Hero(logic_accessors.LogicAccessorsMixin,
 
         if old_info:
             for key, value in new_info.items():
-                if old_info[key] != value:
+                old_value = old_info[key]
+
+                if old_value is value:
+                    continue
+
+                # tracked containers rebuild their info only after changes, so new object means changed section
+                if key in self.UI_INFO_TRACKED_SECTIONS or old_value != value:
                     changed_fields.append(key)
 
         new_info['changed_fields'] = changed_fields
@@ -664,11 +680,40 @@ class Hero(logic_accessors.LogicAccessorsMixin,
     def cached_ui_info_key(self):
         return self.cached_ui_info_key_for_hero(self.account_id)
 
+    @classmethod
+    def cached_ui_info_stamp_key_for_hero(cls, account_id):
+        return conf.heroes_settings.UI_CACHING_STAMP_KEY % account_id
+
+    @classmethod
+    def encode_cached_ui_info(cls, data):
+        if not conf.heroes_settings.UI_CACHING_COMPRESSION:
+            return data
+
+        # cache backend serializes values to json, so compressed data stored as text
+        packed_data = zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'),
+                                    conf.heroes_settings.UI_CACHING_COMPRESSION_LEVEL)
+
+        return conf.heroes_settings.UI_CACHING_COMPRESSION_TAG + base64.b64encode(packed_data).decode('ascii')
+
+    @classmethod
+    def decode_cached_ui_info(cls, data):
+        if not isinstance(data, str):
+            return data
+
+        if not data.startswith(conf.heroes_settings.UI_CACHING_COMPRESSION_TAG):
+            return None # unknown format, rebuild info
+
+        try:
+            packed_data = base64.b64decode(data[len(conf.heroes_settings.UI_CACHING_COMPRESSION_TAG):])
+            return json.loads(zlib.decompress(packed_data).decode('utf-8'))
+        except (binascii.Error, zlib.error, ValueError):
+            return None # corrupted data, rebuild info
+
     @classmethod
     def cached_ui_info_for_hero(cls, account_id, recache_if_required, patch_turns, for_last_turn):
         from . import logic
 
-        data = cache.get(cls.cached_ui_info_key_for_hero(account_id))
+        data = cls.decode_cached_ui_info(cache.get(cls.cached_ui_info_key_for_hero(account_id)))
 
         if data is None:
             hero = logic.load_hero(account_id=account_id)
@@ -199,16 +199,7 @@ class Position(object):
             return map_info_storage.item.get_dominant_place(*self.cell_coordinates)
 
     def get_nearest_place(self):
-        x, y = self.cell_coordinates
-        best_distance = 999999999999999
-        best_place = None
-        for place in places_storage.places.all():
-            distance = math.hypot(place.x-x, place.y-y)
-            if distance < best_distance:
-                best_distance = distance
-                best_place = place
-
-        return best_place
+        return places_storage.places.get_nearest_place(*self.cell_coordinates)
 
     def get_nearest_dominant_place(self):
         place = self.get_dominant_place()
@@ -1,10 +1,13 @@
 # coding: utf-8
+import time
 
 from utg import words as utg_words
 from utg import relations as utg_relations
 
 from the_tale.game.places import storage as places_storage
 
+from . import conf
+
 
 class PositionDescriptionsStorage(object):
 
@@ -54,3 +57,48 @@ class PositionDescriptionsStorage(object):
 
 
 position_descriptions = PositionDescriptionsStorage()
+
+
+class DiaryVersionsStorage(object):
+    '''
+    local cache of diaries versions: {account_id: (turn_number, expire_at, version)}
+    version is actual only for turn of hero's data, with which it was loaded,
+    timeout only limits its livetime if turn is not changed (for example, when game is stopped)
+    expired versions are removed not often than once in timeout
+    '''
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.clear()
+
+    def clear(self):
+        self._versions = {}
+        self._cleaned_at = time.time()
+
+    def get(self, account_id, turn_number):
+        cached = self._versions.get(account_id)
+
+        if cached is None or cached[0] != turn_number or cached[1] < time.time():
+            return None
+
+        return cached[2]
+
+    def set_versions(self, versions):
+        '''
+        versions: {account_id: (turn_number, version)}
+        '''
+        current_time = time.time()
+
+        if self._cleaned_at + self.timeout < current_time:
+            self._versions = {account_id: cached
+                              for account_id, cached in self._versions.items()
+                              if current_time <= cached[1]}
+            self._cleaned_at = current_time
+
+        expire_at = current_time + self.timeout
+
+        for account_id, (turn_number, version) in versions.items():
+            self._versions[account_id] = (turn_number, expire_at, version)
+
+
+diary_versions = DiaryVersionsStorage(timeout=conf.heroes_settings.DIARY_VERSION_CACHE_TIMEOUT)
@@ -78,3 +78,47 @@ class MessagesContainerTest(testcase.TestCase):
         self.messages.push_message(self.create_message('1'))
         self.messages.push_message(self.create_message('2', time_delta=-10))
         self.assertEqual([msg.message for msg in self.messages.messages], ['2', '1'])
+
+    def test_ui_info__cached(self):
+        self.messages.push_message(self.create_message('1'))
+
+        ui_info = self.messages.ui_info()
+
+        self.assertIs(self.messages.ui_info(), ui_info)
+
+        TimePrototype.get_current_time().increment_turn()
+
+        self.assertIs(self.messages.ui_info(), ui_info)
+
+    def test_ui_info__reset_on_push_message(self):
+        self.messages.push_message(self.create_message('1'))
+
+        ui_info = self.messages.ui_info()
+
+        self.messages.push_message(self.create_message('2'))
+
+        self.assertIsNot(self.messages.ui_info(), ui_info)
+        self.assertEqual([msg[2] for msg in self.messages.ui_info()], ['1', '2'])
+
+    def test_ui_info__reset_on_clear(self):
+        self.messages.push_message(self.create_message('1'))
+
+        ui_info = self.messages.ui_info()
+
+        self.messages.clear()
+
+        self.assertEqual(self.messages.ui_info(), [])
+        self.assertIsNot(self.messages.ui_info(), ui_info)
+
+    def test_ui_info__delayed_messages(self):
+        self.messages.push_message(self.create_message('1'))
+        self.messages.push_message(self.create_message('2', turn_delta=1))
+
+        self.assertEqual([msg[2] for msg in self.messages.ui_info()], ['1'])
+
+        TimePrototype.get_current_time().increment_turn()
+
+        ui_info = self.messages.ui_info()
+
+        self.assertEqual([msg[2] for msg in ui_info], ['1', '2'])
+        self.assertIs(self.messages.ui_info(), ui_info)
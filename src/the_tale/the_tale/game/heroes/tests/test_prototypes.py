@@ -84,6 +84,112 @@ class HeroTest(testcase.TestCase, pm_helpers.Mixin):
         self.assertEqual(models.HeroPreferences.objects.get(hero_id=self.hero.id).energy_regeneration_type, self.hero.preferences.energy_regeneration_type)
         self.assertEqual(models.HeroPreferences.objects.get(hero_id=self.hero.id).risk_level, self.hero.preferences.risk_level)
 
+    def test_save_hero__unchanged_blobs(self):
+        logic.save_hero(self.hero)
+
+        self.assertEqual(set(self.hero.saved_blobs_hashes.keys()), set(logic.BLOB_FIELDS))
+
+        self.hero.actual_bills.append(time.time())
+
+        with mock.patch('django.db.models.query.QuerySet.update') as update:
+            logic.save_hero(self.hero)
+
+        arguments = update.call_args[1]
+
+        self.assertIn('data', arguments)
+
+        for field in ('abilities', 'cards', 'actions', 'preferences'):
+            self.assertNotIn(field, arguments)
+
+    def test_save_hero__blobs_hashes_updated(self):
+        logic.save_hero(self.hero)
+
+        self.hero.actual_bills.append(time.time())
+
+        logic.save_hero(self.hero)
+
+        self.assertEqual(logic.load_hero(hero_id=self.hero.id).actual_bills, self.hero.actual_bills)
+
+        self.hero.actual_bills.append(time.time())
+
+        logic.save_hero(self.hero)
+
+        self.assertEqual(logic.load_hero(hero_id=self.hero.id).actual_bills, self.hero.actual_bills)
+
+    def test_save_heroes__unchanged_blobs(self):
+        account_2 = self.accounts_factory.create_account()
+        self.storage.load_account_data(account_2)
+        hero_2 = self.storage.accounts_to_heroes[account_2.id]
+
+        logic.save_heroes([self.hero, hero_2])
+
+        self.hero.actual_bills.append(time.time())
+        hero_2.health = 2
+
+        logic.save_heroes([self.hero, hero_2])
+
+        loaded_hero_1 = logic.load_hero(hero_id=self.hero.id)
+        loaded_hero_2 = logic.load_hero(hero_id=hero_2.id)
+
+        self.assertEqual(loaded_hero_1.actual_bills, self.hero.actual_bills)
+        self.assertEqual(loaded_hero_1.actions.serialize(), self.hero.actions.serialize())
+        self.assertEqual(loaded_hero_2.health, 2)
+        self.assertEqual(loaded_hero_2.actions.serialize(), hero_2.actions.serialize())
+        self.assertEqual(loaded_hero_2.preferences.serialize(), hero_2.preferences.serialize())
+
+    def test_save_heroes(self):
+        account_2 = self.accounts_factory.create_account()
+        self.storage.load_account_data(account_2)
+        hero_2 = self.storage.accounts_to_heroes[account_2.id]
+
+        self.hero.health = 1
+        self.hero.money = 666
+        self.hero.position.set_place(self.place_2)
+        self.hero.next_spending = relations.ITEMS_OF_EXPENDITURE.EXPERIENCE
+
+        hero_2.health = 2
+        hero_2.money = 777
+        hero_2.position.set_coordinates(0, 0, 1, 1, 0.5)
+
+        old_saved_at = self.hero.saved_at
+
+        with mock.patch('the_tale.game.heroes.logic.save_hero') as save_hero:
+            logic.save_heroes([self.hero, hero_2])
+
+        self.assertEqual(save_hero.call_count, 0)
+        self.assertTrue(old_saved_at < self.hero.saved_at)
+
+        loaded_hero_1 = logic.load_hero(hero_id=self.hero.id)
+        loaded_hero_2 = logic.load_hero(hero_id=hero_2.id)
+
+        self.assertEqual(loaded_hero_1.health, 1)
+        self.assertEqual(loaded_hero_1.money, 666)
+        self.assertEqual(loaded_hero_1.position.place_id, self.place_2.id)
+        self.assertTrue(loaded_hero_1.next_spending.is_EXPERIENCE)
+        self.assertEqual(loaded_hero_1.saved_at, self.hero.saved_at)
+        self.assertEqual(loaded_hero_1.actions.serialize(), self.hero.actions.serialize())
+        self.assertEqual(loaded_hero_1.bag.serialize(), self.hero.bag.serialize())
+
+        self.assertEqual(loaded_hero_2.health, 2)
+        self.assertEqual(loaded_hero_2.money, 777)
+        self.assertEqual(loaded_hero_2.position.place_id, None)
+        self.assertEqual(loaded_hero_2.position.percents, 0.5)
+
+    @mock.patch('the_tale.game.heroes.conf.heroes_settings.BULK_SAVE_CHUNK_SIZE', 1)
+    def test_save_heroes__chunks(self):
+        account_2 = self.accounts_factory.create_account()
+        self.storage.load_account_data(account_2)
+        hero_2 = self.storage.accounts_to_heroes[account_2.id]
+
+        with mock.patch('the_tale.game.heroes.logic.save_hero') as save_hero:
+            logic.save_heroes([self.hero, hero_2])
+
+        self.assertEqual(save_hero.call_args_list, [mock.call(self.hero), mock.call(hero_2)])
+
+    def test_save_heroes__no_heroes(self):
+        with self.check_not_changed(lambda: models.Hero.objects.get(id=self.hero.id).saved_at):
+            logic.save_heroes([])
+
     def test_helps_number_restriction(self):
         self.assertEqual(self.hero.last_help_on_turn, 0)
         self.assertEqual(self.hero.helps_in_turn, 0)
@@ -507,6 +613,28 @@ class HeroTest(testcase.TestCase, pm_helpers.Mixin):
                 continue
             self.hero.get_achievement_type_value(achievement_type)
 
+    def test_achievement_type_values(self):
+        self.hero.statistics.change_money(relations.MONEY_SOURCE.EARNED_FROM_LOOT, 10)
+        self.hero.statistics.change_pve_deaths(3)
+        self.hero.statistics.change_pvp_battles_1x1_draws(heroes_settings.MIN_PVP_BATTLES)
+        self.hero.statistics.change_pvp_battles_1x1_victories(2)
+        self.hero.habit_honor.change(100)
+        logic.save_hero(self.hero)
+
+        for achievement_type in ACHIEVEMENT_TYPE.records:
+            if not achievement_type.source.is_GAME_OBJECT:
+                continue
+
+            values = dict(logic.achievement_type_values(achievement_type))
+            self.assertEqual(values.get(self.hero.account_id, 0), self.hero.get_achievement_type_value(achievement_type))
+
+    def test_achievement_type_values__barrier(self):
+        self.hero.statistics.change_pve_deaths(3)
+        logic.save_hero(self.hero)
+
+        self.assertEqual(dict(logic.achievement_type_values(ACHIEVEMENT_TYPE.DEATHS, barrier=3)), {self.hero.account_id: 3})
+        self.assertEqual(dict(logic.achievement_type_values(ACHIEVEMENT_TYPE.DEATHS, barrier=4)), {})
+
     def test_update_habits__premium(self):
         self.assertEqual(self.hero.habit_honor.raw_value, 0)
         self.assertFalse(self.hero.is_premium)
@@ -1077,6 +1205,77 @@ class HeroUiInfoTest(testcase.TestCase):
         self.assertFalse(self.hero.is_ui_caching_required)
 
 
+    def test_ui_info__changed_fields(self):
+        old_info = self.hero.ui_info(actual_guaranteed=True)
+
+        self.hero.money += 1
+
+        new_info = self.hero.ui_info(actual_guaranteed=True, old_info=old_info)
+
+        self.assertIs(new_info['bag'], old_info['bag'])
+        self.assertIs(new_info['cards'], old_info['cards'])
+
+        self.assertIn('base', new_info['changed_fields'])
+        self.assertNotIn('bag', new_info['changed_fields'])
+        self.assertNotIn('cards', new_info['changed_fields'])
+        self.assertNotIn('equipment', new_info['changed_fields'])
+        self.assertNotIn('messages', new_info['changed_fields'])
+
+    def test_ui_info__changed_fields__journal(self):
+        old_info = self.hero.ui_info(actual_guaranteed=True)
+
+        self.hero.journal.push_message(messages.MessageSurrogate(turn_number=TimePrototype.get_current_turn_number(),
+                                                                 timestamp=time.time(),
+                                                                 key=None,
+                                                                 externals=None,
+                                                                 message='message',
+                                                                 position='position'))
+
+        new_info = self.hero.ui_info(actual_guaranteed=True, old_info=old_info)
+
+        self.assertIn('messages', new_info['changed_fields'])
+        self.assertNotIn('bag', new_info['changed_fields'])
+
+    def test_encode_cached_ui_info__without_compression(self):
+        data = self.hero.ui_info(actual_guaranteed=True)
+        self.assertIs(objects.Hero.encode_cached_ui_info(data), data)
+
+    @mock.patch('the_tale.game.heroes.conf.heroes_settings.UI_CACHING_COMPRESSION', True)
+    def test_encode_cached_ui_info__with_compression(self):
+        data = {'id': self.hero.id, 'bag': {'1': [1, 2, 3]}, 'changed_fields': ['bag']}
+
+        encoded_data = objects.Hero.encode_cached_ui_info(data)
+
+        self.assertTrue(encoded_data.startswith(heroes_settings.UI_CACHING_COMPRESSION_TAG))
+        self.assertEqual(objects.Hero.decode_cached_ui_info(encoded_data), data)
+
+    def test_decode_cached_ui_info__not_compressed(self):
+        data = {'id': self.hero.id}
+        self.assertIs(objects.Hero.decode_cached_ui_info(data), data)
+        self.assertEqual(objects.Hero.decode_cached_ui_info(None), None)
+
+    def test_decode_cached_ui_info__unknown_format(self):
+        self.assertEqual(objects.Hero.decode_cached_ui_info('zui0:abcd'), None)
+
+    def test_decode_cached_ui_info__corrupted_data(self):
+        tag = heroes_settings.UI_CACHING_COMPRESSION_TAG
+
+        self.assertEqual(objects.Hero.decode_cached_ui_info(tag + 'abc'), None) # wrong base64 padding
+        self.assertEqual(objects.Hero.decode_cached_ui_info(tag + 'YWJjZA=='), None) # not zlib data
+        self.assertEqual(objects.Hero.decode_cached_ui_info(tag + 'eJzLyy9RyCrOzwMADiYDLA=='), None) # not json data
+
+    @mock.patch('the_tale.game.heroes.conf.heroes_settings.UI_CACHING_COMPRESSION', True)
+    def test_cached_ui_info_for_hero__compressed(self):
+        data = get_simple_cache_data(ui_caching_started_at=time.time())
+        data['money'] = 666
+
+        with mock.patch('dext.common.utils.cache.get', lambda key: objects.Hero.encode_cached_ui_info(data)):
+            with mock.patch('the_tale.game.heroes.objects.Hero.ui_info') as ui_info:
+                info = objects.Hero.cached_ui_info_for_hero(self.hero.account_id, recache_if_required=False, patch_turns=None, for_last_turn=False)
+
+        self.assertEqual(ui_info.call_count, 0)
+        self.assertEqual(info['money'], 666)
+
     ########################
     # recache required
     ########################
@@ -2,13 +2,17 @@
 
 from unittest import mock
 
+from tt_protocol.protocol import diary_pb2
+
 from the_tale.common.utils import testcase
 
 from the_tale.game.logic import create_test_map
+from the_tale.game.prototypes import TimePrototype
 
 from the_tale.game.places import storage as places_storage
 
 from the_tale.game.heroes import storage
+from the_tale.game.heroes import logic
 
 
 class PositionDescriptionsStorageTests(testcase.TestCase):
@@ -55,3 +59,99 @@ class PositionDescriptionsStorageTests(testcase.TestCase):
 
     def text_in_wild_lands(self, place_id):
         self.assertEqual(storage.position_descriptions.text_in_wild_lands(), 'дикие земли')
+
+
+class DiaryVersionsStorageTests(testcase.TestCase):
+
+    def setUp(self):
+        super(DiaryVersionsStorageTests, self).setUp()
+        self.storage = storage.DiaryVersionsStorage(timeout=10)
+
+    def test_get__no_version(self):
+        self.assertEqual(self.storage.get(1, 100), None)
+
+    def test_set_versions(self):
+        self.storage.set_versions({1: (100, 10), 2: (101, 0)})
+
+        self.assertEqual(self.storage.get(1, 100), 10)
+        self.assertEqual(self.storage.get(2, 101), 0)
+        self.assertEqual(self.storage.get(3, 100), None)
+
+    def test_get__other_turn(self):
+        self.storage.set_versions({1: (100, 10)})
+
+        self.assertEqual(self.storage.get(1, 101), None)
+        self.assertEqual(self.storage.get(1, 99), None)
+
+    def test_get__expired(self):
+        with mock.patch('time.time', mock.Mock(return_value=1000)):
+            self.storage.set_versions({1: (100, 10)})
+
+        with mock.patch('time.time', mock.Mock(return_value=1010)):
+            self.assertEqual(self.storage.get(1, 100), 10)
+
+        with mock.patch('time.time', mock.Mock(return_value=1011)):
+            self.assertEqual(self.storage.get(1, 100), None)
+
+    def test_set_versions__remove_outdated(self):
+        with mock.patch('time.time', mock.Mock(return_value=1000)):
+            self.storage.clear()
+            self.storage.set_versions({1: (100, 10)})
+
+        with mock.patch('time.time', mock.Mock(return_value=1005)):
+            self.storage.set_versions({2: (100, 20)})
+
+        with mock.patch('time.time', mock.Mock(return_value=1011)):
+            self.storage.set_versions({3: (101, 30)})
+
+        self.assertEqual(set(self.storage._versions), {2, 3})
+
+    def test_clear(self):
+        self.storage.set_versions({1: (100, 10)})
+        self.storage.clear()
+        self.assertEqual(self.storage._versions, {})
+
+
+class DiaryVersionsLogicTests(testcase.TestCase):
+
+    def test_diary_versions(self):
+        storage.diary_versions.set_versions({1: (TimePrototype.get_current_turn_number(), 10)})
+
+        with mock.patch('the_tale.common.utils.tt_api.sync_request',
+                        mock.Mock(return_value=diary_pb2.VersionsResponse(versions=[30, 0]))) as sync_request:
+            self.assertEqual(logic.diary_versions([1, 3, 2]), {1: 10, 2: 0, 3: 30})
+
+        self.assertEqual(sync_request.call_count, 1)
+        self.assertEqual(list(sync_request.call_args[1]['data'].accounts_ids), [3, 2])
+
+        with mock.patch('the_tale.common.utils.tt_api.sync_request') as sync_request:
+            self.assertEqual(logic.diary_versions([1, 2, 3]), {1: 10, 2: 0, 3: 30})
+            self.assertEqual(logic.diary_version(3), 30)
+
+        self.assertEqual(sync_request.call_count, 0)
+
+    def test_diary_versions__new_turn(self):
+        storage.diary_versions.set_versions({1: (TimePrototype.get_current_turn_number(), 10)})
+
+        TimePrototype.get_current_time().increment_turn()
+
+        with mock.patch('the_tale.common.utils.tt_api.sync_request',
+                        mock.Mock(return_value=diary_pb2.VersionsResponse(versions=[11]))) as sync_request:
+            self.assertEqual(logic.diary_versions([1]), {1: 11})
+
+        self.assertEqual(sync_request.call_count, 1)
+
+    def test_diary_versions__heroes_turns(self):
+        turn_number = TimePrototype.get_current_turn_number()
+
+        storage.diary_versions.set_versions({1: (turn_number - 1, 10),
+                                             2: (turn_number, 20)})
+
+        with mock.patch('the_tale.common.utils.tt_api.sync_request',
+                        mock.Mock(return_value=diary_pb2.VersionsResponse(versions=[21]))) as sync_request:
+            self.assertEqual(logic.diary_versions([1, 2], turns={1: turn_number - 1, 2: turn_number + 1}), {1: 10, 2: 21})
+
+        self.assertEqual(list(sync_request.call_args[1]['data'].accounts_ids), [2])
+
+        self.assertEqual(storage.diary_versions.get(2, turn_number + 1), 21)
+        self.assertEqual(storage.diary_versions.get(2, turn_number), None)
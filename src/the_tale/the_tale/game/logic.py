@@ -1,12 +1,18 @@
 # coding: utf-8
 import os
 import time
+import hashlib
 import datetime
 
 from django.conf import settings as project_settings
 
+from dext.common.utils import cache
 from dext.common.utils.urls import url
 
+from tt_protocol.protocol import turn_updates_pb2
+
+from the_tale.common.utils import tt_api
+
 from the_tale.accounts.conf import accounts_settings
 
 from the_tale.linguistics import logic as linguistics_logic
@@ -126,7 +132,7 @@ def _form_game_account_info(game_time, account, in_pvp_queue, is_own, client_tur
                                                       patch_turns=client_turns,
                                                       for_last_turn=(not is_own))
     data['hero'] = hero_data
-    data['hero']['diary'] = heroes_logic.diary_version(account.id)
+    data['hero']['diary'] = None # diary version will be setupped by fill_diary_versions
 
     data['is_old'] = (data['hero']['actual_on_turn'] < game_time.turn_number)
 
@@ -158,13 +164,16 @@ def form_game_info(account=None, is_own=False, client_turns=None):
 
     if account:
         battle = Battle1x1Prototype.get_by_account_id(account.id)
+
+        in_pvp = battle is not None and battle.state.is_PROCESSING
+
         data['account'] = _form_game_account_info(game_time,
                                                   account,
                                                   in_pvp_queue=False if battle is None else battle.state.is_WAITING,
                                                   is_own=is_own,
                                                   client_turns=client_turns)
 
-        if battle and battle.state.is_PROCESSING:
+        if in_pvp:
             data['mode'] = 'pvp'
             data['enemy'] = _form_game_account_info(game_time,
                                                     AccountPrototype.get_by_id(battle.enemy_id),
@@ -175,6 +184,59 @@ def form_game_info(account=None, is_own=False, client_turns=None):
     return data
 
 
+def fill_diary_versions(data):
+    accounts_infos = [account_info for account_info in (data.get('account'), data.get('enemy')) if account_info is not None]
+
+    if not accounts_infos:
+        return data
+
+    # request diaries versions of all heroes at once,
+    # version is requested for turn of hero's data, since diary messages of turn reach tt_diary after hero's data is saved
+    diary_versions = heroes_logic.diary_versions([account_info['id'] for account_info in accounts_infos],
+                                                 turns={account_info['id']: account_info['hero']['actual_on_turn'] for account_info in accounts_infos})
+
+    for account_info in accounts_infos:
+        account_info['hero']['diary'] = diary_versions[account_info['id']]
+
+    return data
+
+
+def game_info_cache_key(account_id, turn_number, api_version, is_own, client_turns):
+    stamp = None
+
+    if account_id is not None:
+        stamp = cache.get(heroes_objects.Hero.cached_ui_info_stamp_key_for_hero(account_id))
+
+    signature = '{account_id}|{turn_number}|{api_version}|{is_own}|{stamp}|{client_turns}'.format(account_id=account_id,
+                                                                                                 turn_number=turn_number,
+                                                                                                 api_version=api_version,
+                                                                                                 is_own=is_own,
+                                                                                                 stamp=stamp,
+                                                                                                 client_turns=','.join(str(turn) for turn in sorted(set(client_turns or ()))))
+
+    return conf.game_settings.INFO_CACHING_KEY % hashlib.md5(signature.encode('utf-8')).hexdigest()
+
+
+def is_game_info_cacheable(data):
+    # old info will be updated by workers in current turn
+    for account_info in (data.get('account'), data.get('enemy')):
+        if account_info is not None and account_info['is_old']:
+            return False
+
+    return True
+
+
+def push_turn_updates(accounts_ids, turn_number):
+    if conf.game_settings.TURN_UPDATES_WAIT_URL is None or not accounts_ids:
+        return
+
+    turns = [turn_updates_pb2.AccountTurn(account_id=account_id, turn_number=turn_number)
+             for account_id in accounts_ids]
+
+    tt_api.async_request(url=conf.game_settings.TURN_UPDATES_PUSH_URL,
+                         data=turn_updates_pb2.PushTurnsRequest(turns=turns))
+
+
 def game_info_url(account_id=None, client_turns=None):
     arguments = {'api_version': conf.game_settings.INFO_API_VERSION,
                  'api_client': project_settings.API_CLIENT}
@@ -12,9 +12,11 @@ from the_tale.game.heroes.conf import heroes_settings
 
 from the_tale.game import exceptions
 from the_tale.game import conf
+from the_tale.game import logic as game_logic
 from the_tale.game.prototypes import TimePrototype
 
 from the_tale.game.heroes import logic as heroes_logic
+from the_tale.game.heroes import objects as heroes_objects
 
 
 class LogicStorage(object):
@@ -70,15 +72,29 @@ class LogicStorage(object):
 
         self.process_cache_queue()
 
+        self._update_ui_info_stamps(self.bundles_to_accounts[bundle_id])
+
     def recache_bundle(self, bundle_id, force_full_data=False):
         for account_id in self.bundles_to_accounts[bundle_id]:
             self.cache_queue.add(self.accounts_to_heroes[account_id].id)
 
         self.process_cache_queue(force_full_data=force_full_data)
 
+        self._update_ui_info_stamps(self.bundles_to_accounts[bundle_id])
+
+    def _update_ui_info_stamps(self, accounts_ids):
+        # heroes recached in the middle of turn, so cached game info of their accounts becomes obsolete
+        stamp = '%f' % time.time()
+        cache.set_many({heroes_objects.Hero.cached_ui_info_stamp_key_for_hero(account_id): stamp
+                        for account_id in accounts_ids},
+                       heroes_settings.UI_CACHING_TIMEOUT)
+
     def _save_hero_data(self, hero_id):
         heroes_logic.save_hero(self.heroes[hero_id])
 
+    def _save_heroes_data(self, heroes_ids):
+        heroes_logic.save_heroes(self.heroes[hero_id] for hero_id in heroes_ids)
+
     def _add_hero(self, hero):
 
         if hero.id in self.heroes:
@@ -251,6 +267,8 @@ class LogicStorage(object):
                 logger.info('[next_turn] ignore bundles: %r' % list(self.ignored_bundles))
 
     def _save_on_exception(self):
+        heroes_to_save = []
+
         for hero_id, hero in self.heroes.items():
             if hero.actions.current_action.bundle_id in self.ignored_bundles:
                 continue
@@ -258,20 +276,27 @@ class LogicStorage(object):
             time_border = datetime.datetime.now() - datetime.timedelta(seconds=conf.game_settings.SAVE_ON_EXCEPTION_TIMEOUT)
 
             if hero.saved_at < time_border:
-                self._save_hero_data(hero_id)
+                heroes_to_save.append(hero_id)
+
+        self._save_heroes_data(heroes_to_save)
 
     def save_all(self, logger=None):
         heroes = list(self.heroes.items())
         heroes.sort(key=lambda x: x[0])
 
+        heroes_to_save = []
+
         for hero_id, hero in heroes:
 
             if hero.actions.current_action.bundle_id in self.ignored_bundles:
                 continue
 
-            if logger:
-                logger.info('save hero %d' % hero_id)
-            self._save_hero_data(hero_id)
+            heroes_to_save.append(hero_id)
+
+        if logger:
+            logger.info('save heroes: %d' % len(heroes_to_save))
+
+        self._save_heroes_data(heroes_to_save)
 
     def _get_bundles_to_save(self):
         bundles = set()
@@ -304,6 +329,8 @@ class LogicStorage(object):
         if logger:
             logger.info('[save_changed_data] saved bundles number: %d' % len(saved_bundles))
 
+        heroes_to_save = []
+
         for hero_id, hero in self.heroes.items():
 
             bundle_id = hero.actions.current_action.bundle_id
@@ -315,7 +342,9 @@ class LogicStorage(object):
                 self.cache_queue.add(hero_id)
 
             if bundle_id in saved_bundles:
-                self._save_hero_data(hero_id)
+                heroes_to_save.append(hero_id)
+
+        self._save_heroes_data(heroes_to_save)
 
         cached_heroes_number = self.process_cache_queue(update_cache=True)
 
@@ -325,20 +354,26 @@ class LogicStorage(object):
 
     def process_cache_queue(self, update_cache=False, force_full_data=False):
         to_cache = {}
+        accounts_ids = []
 
         for hero_id in self.cache_queue:
             hero = self.heroes[hero_id]
+            accounts_ids.append(hero.account_id)
             cache_key = hero.cached_ui_info_key
             to_cache[cache_key] = hero.ui_info(actual_guaranteed=True,
                                                old_info=None if force_full_data else self.previous_cache.get(cache_key))
 
-        cache.set_many(to_cache, heroes_settings.UI_CACHING_TIMEOUT)
+        cache.set_many({cache_key: heroes_objects.Hero.encode_cached_ui_info(data) for cache_key, data in to_cache.items()},
+                       heroes_settings.UI_CACHING_TIMEOUT)
 
         self.cache_queue.clear()
 
         if update_cache:
             self.current_cache.update(to_cache)
 
+            # notify clients only after new data were cached, so they will not receive old info
+            game_logic.push_turn_updates(accounts_ids=accounts_ids, turn_number=TimePrototype.get_current_turn_number())
+
         return len(to_cache)
 
 
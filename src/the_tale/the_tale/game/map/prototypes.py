@@ -76,10 +76,7 @@ class MapInfoPrototype(BasePrototype):
     def race_cities(self): return self.statistics['race_cities']
 
     def get_dominant_place(self, x, y):
-        for place in places_storage.places.all():
-            if (x, y) in place.nearest_cells:
-                return place
-        return None
+        return places_storage.places.get_dominant_place(x, y)
 
     ######################
     # object operations
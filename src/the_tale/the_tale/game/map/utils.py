@@ -1,14 +1,15 @@
 # coding: utf-8
 
 from the_tale.game.relations import RACE
+from the_tale.game.politic_power import PowerFractions
 
 def get_person_race_percents(persons):
     race_powers = dict( (race.value, 0) for race in RACE.records)
 
-    powers = [person.politic_power for person in persons]
+    fractions = PowerFractions([person.politic_power for person in persons])
 
     for person in persons:
-        race_powers[person.race.value] += person.politic_power.total_politic_power_fraction(powers)
+        race_powers[person.race.value] += fractions.total(person.politic_power)
 
     return race_powers
 
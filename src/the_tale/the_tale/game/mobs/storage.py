@@ -1,8 +1,8 @@
 # coding: utf-8
+import bisect
 import random
 
 from the_tale.common.utils import storage
-from the_tale.common.utils.logic import random_value_by_priority
 
 from the_tale.game import relations as game_relations
 
@@ -16,15 +16,47 @@ class MobsStorage(storage.CachedStorage):
     PROTOTYPE = MobRecordPrototype
 
     def _update_cached_data(self, item):
+        # record can be saved with changed type, so remember type with which it was counted
+        if item.uuid in self._types_by_uuids:
+            self._types_count[self._types_by_uuids[item.uuid]] -= 1
+
         self._mobs_by_uuids[item.uuid] = item
-        self._types_count[item.type] = len([mob for mob in self.all() if mob.type == item.type])
-        self.mobs_number = len(self.all())
+        self._types_by_uuids[item.uuid] = item.type
+        self._types_count[item.type] += 1
+        self.mobs_number = len(self._mobs_by_uuids)
+
+        self._reset_candidates()
 
     def _reset_cache(self):
         self._mobs_by_uuids = {}
+        self._types_by_uuids = {}
         self._types_count = {mob_type: 0 for mob_type in game_relations.BEING_TYPE.records}
         self.mobs_number = 0
 
+        self._reset_candidates()
+
+    def _reset_candidates(self):
+        # {(terrain, mercenary): (levels, records)}, records sorted by level
+        self._candidates = {}
+        # {(terrain, mercenary, records_number): choice table}
+        self._choice_tables = {}
+
+    def _get_candidates(self, terrain, mercenary):
+        key = (terrain, mercenary)
+
+        if key not in self._candidates:
+            records = [record
+                       for record in self.all()
+                       if (record.state.is_ENABLED and
+                           (terrain is None or terrain in record.terrains) and
+                           (mercenary is None or record.is_mercenary == mercenary))]
+
+            records.sort(key=lambda record: record.level)
+
+            self._candidates[key] = ([record.level for record in records], records)
+
+        return self._candidates[key]
+
     def get_by_uuid(self, uuid):
         self.sync()
         return self._mobs_by_uuids.get(uuid)
@@ -38,43 +70,67 @@ class MobsStorage(storage.CachedStorage):
     def get_available_mobs_list(self, level, terrain=None, mercenary=None):
         self.sync()
 
-        mobs = (record
-                for record in self.all()
-                if record.state.is_ENABLED and record.level <= level and (terrain is None or terrain in record.terrains))
+        levels, records = self._get_candidates(terrain, mercenary)
 
-        if mercenary is not None:
-            mobs = (record for record in mobs if record.is_mercenary == mercenary)
+        return records[:bisect.bisect_right(levels, level)]
 
-        return list(mobs)
+    def _get_choice_table(self, level, terrain, mercenary):
+        self.sync()
 
+        levels, records = self._get_candidates(terrain, mercenary)
 
-    def choose_mob(self, mobs_choices):
-        global_actions_mobs = []
+        records_number = bisect.bisect_right(levels, level)
+
+        key = (terrain, mercenary, records_number)
+
+        if key not in self._choice_tables:
+            self._choice_tables[key] = self.create_choice_table(records[:records_number])
+
+        return self._choice_tables[key]
+
+    @staticmethod
+    def create_choice_table(mobs_choices):
         normal_mobs = []
+        global_actions_mobs = []
+        cumulative_probabilities = []
+
+        action_probability = 0
 
         for mob in mobs_choices:
             if mob.global_action_probability > 0:
+                action_probability += mob.global_action_probability
                 global_actions_mobs.append(mob)
+                cumulative_probabilities.append(action_probability)
             else:
                 normal_mobs.append(mob)
 
-        action_probability = sum(mob.global_action_probability for mob in global_actions_mobs if mob.global_action_probability)
+        return (normal_mobs, global_actions_mobs, cumulative_probabilities, action_probability)
+
+    @staticmethod
+    def choose_from_table(table):
+        normal_mobs, global_actions_mobs, cumulative_probabilities, action_probability = table
 
         if random.random() > action_probability:
             return random.choice(normal_mobs)
 
-        return random_value_by_priority((mob, mob.global_action_probability) for mob in global_actions_mobs)
+        index = bisect.bisect_left(cumulative_probabilities, random.uniform(0, action_probability))
 
+        return global_actions_mobs[min(index, len(global_actions_mobs) - 1)]
+
+    def choose_mob(self, mobs_choices):
+        return self.choose_from_table(self.create_choice_table(mobs_choices))
 
     def get_random_mob(self, hero, mercenary=None, is_boss=False):
         self.sync()
 
-        choices = self.get_available_mobs_list(level=hero.level, terrain=hero.position.get_terrain(), mercenary=mercenary)
+        table = self._get_choice_table(level=hero.level, terrain=hero.position.get_terrain(), mercenary=mercenary)
+
+        normal_mobs, global_actions_mobs = table[0], table[1]
 
-        if not choices:
+        if not normal_mobs and not global_actions_mobs:
             return None
 
-        mob_record = self.choose_mob(choices)
+        mob_record = self.choose_from_table(table)
 
         return MobPrototype(record_id=mob_record.id, level=hero.level, is_boss=is_boss, action_type=hero.actions.current_action.ui_type, terrain=hero.position.get_terrain())
 
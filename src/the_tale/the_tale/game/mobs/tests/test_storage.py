@@ -94,7 +94,55 @@ class MobsStorageTests(testcase.TestCase):
         mobs_in_forest = [mob.uuid for mob in mobs_storage.get_available_mobs_list(0, map_relations.TERRAIN.PLANE_SAND, mercenary=False)]
         self.assertEqual(frozenset(mobs_in_forest), frozenset())
 
-    @mock.patch('the_tale.game.mobs.storage.MobsStorage.get_available_mobs_list', mock.Mock(return_value=[]))
+    def test_types_count__type_changed(self):
+        self.mob_1.type = game_relations.BEING_TYPE.ANIMAL
+        self.mob_1.save()
+
+        self.assertEqual(mobs_storage.mobs_number, 5)
+        self.assertEqual(sum(mobs_storage._types_count.values()), 5)
+        self.assertEqual(mobs_storage._types_count[game_relations.BEING_TYPE.ANIMAL],
+                         len([mob for mob in mobs_storage.all() if mob.type.is_ANIMAL]))
+
+    def test_get_available_mobs_list__sorted_by_level(self):
+        self.mob_1.level = 3
+        self.mob_1.save()
+
+        levels = [mob.level for mob in mobs_storage.get_available_mobs_list(666)]
+
+        self.assertEqual(levels, sorted(levels))
+        self.assertNotIn(self.mob_1, mobs_storage.get_available_mobs_list(2))
+        self.assertIn(self.mob_1, mobs_storage.get_available_mobs_list(3))
+
+    def test_get_available_mobs_list__reset_on_save(self):
+        self.assertIn(self.mob_1, mobs_storage.get_available_mobs_list(1, map_relations.TERRAIN.PLANE_SAND))
+
+        self.mob_1.state = MOB_RECORD_STATE.DISABLED
+        self.mob_1.save()
+
+        self.assertNotIn(self.mob_1, mobs_storage.get_available_mobs_list(1, map_relations.TERRAIN.PLANE_SAND))
+
+    def test_get_choice_table__cached(self):
+        table = mobs_storage._get_choice_table(1, map_relations.TERRAIN.PLANE_SAND, None)
+
+        self.assertIs(table, mobs_storage._get_choice_table(1, map_relations.TERRAIN.PLANE_SAND, None))
+        self.assertIsNot(table, mobs_storage._get_choice_table(1, map_relations.TERRAIN.PLANE_GRASS, None))
+
+        self.mob_1.save()
+
+        self.assertIsNot(table, mobs_storage._get_choice_table(1, map_relations.TERRAIN.PLANE_SAND, None))
+
+    def test_create_choice_table(self):
+        self.mob_1.global_action_probability = 0.25
+        self.mob_3.global_action_probability = 0.5
+
+        normal_mobs, global_actions_mobs, cumulative_probabilities, action_probability = mobs_storage.create_choice_table([self.mob_1, self.mob_2, self.mob_3])
+
+        self.assertEqual(normal_mobs, [self.mob_2])
+        self.assertEqual(global_actions_mobs, [self.mob_1, self.mob_3])
+        self.assertEqual(cumulative_probabilities, [0.25, 0.75])
+        self.assertEqual(action_probability, 0.75)
+
+    @mock.patch('the_tale.game.mobs.storage.MobsStorage._get_candidates', mock.Mock(return_value=([], [])))
     def test_get_random_mob__no_mob(self):
         account = self.accounts_factory.create_account()
         hero = heroes_logic.load_hero(account_id=account.id)
@@ -149,17 +149,21 @@ class Person(names.ManageNameMixin2):
                 restrictions_storage.get_restriction(TEMPLATE_RESTRICTION_GROUP.RACE, self.race.value).id,
                 restrictions_storage.get_restriction(TEMPLATE_RESTRICTION_GROUP.PERSON_TYPE, self.type.value).id)
 
+    def power_fractions(self):
+        from . import storage
+        return storage.persons.power_fractions(self.place_id)
+
     @property
     def total_politic_power_fraction(self):
-        return self.politic_power.total_politic_power_fraction([person.politic_power for person in self.place.persons])
+        return self.power_fractions().total(self.politic_power)
 
     @property
     def inner_politic_power_fraction(self):
-        return self.politic_power.inner_power_fraction([person.politic_power for person in self.place.persons])
+        return self.power_fractions().inner(self.politic_power)
 
     @property
     def outer_politic_power_fraction(self):
-        return self.politic_power.outer_power_fraction([person.politic_power for person in self.place.persons])
+        return self.power_fractions().outer(self.politic_power)
 
     def get_job_power(self):
         return jobs_logic.job_power(power=self.total_politic_power_fraction,
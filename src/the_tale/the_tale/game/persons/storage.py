@@ -2,6 +2,8 @@
 
 from dext.common.utils import storage as dext_storage
 
+from the_tale.game import politic_power
+
 from the_tale.game.balance import constants as c
 
 from the_tale.game.persons import models
@@ -13,6 +15,9 @@ class PersonsStorage(dext_storage.Storage):
     SETTINGS_KEY = 'persons change time'
     EXCEPTION = exceptions.PersonsStorageError
 
+    _places_version = None
+    _power_fractions_version = None
+
     def _construct_object(self, model):
         from . import logic
         return logic.load_person(person_model=model)
@@ -24,6 +29,41 @@ class PersonsStorage(dext_storage.Storage):
     def _get_all_query(self):
         return models.Person.objects.all()
 
+    def _sync_places(self):
+        self.sync()
+
+        if self._places_version is not None and self._places_version == self._version:
+            return
+
+        self._persons_by_places = {}
+
+        for person in self.all():
+            self._persons_by_places.setdefault(person.place_id, []).append(person)
+
+        for place_persons in self._persons_by_places.values():
+            place_persons.sort(key=lambda p: p.created_at_turn) # fix persons order
+
+        self._places_version = self._version
+
+    def persons_for_place(self, place_id):
+        self._sync_places()
+        return list(self._persons_by_places.get(place_id, ()))
+
+    def power_fractions(self, place_id):
+        self._sync_places()
+
+        version = (self._version, politic_power.PoliticPower.version())
+
+        if self._power_fractions_version != version:
+            self._power_fractions = {}
+            self._power_fractions_version = version
+
+        if place_id not in self._power_fractions:
+            self._power_fractions[place_id] = politic_power.PowerFractions([person.politic_power
+                                                                            for person in self._persons_by_places.get(place_id, ())])
+
+        return self._power_fractions[place_id]
+
 
 persons = PersonsStorage()
 
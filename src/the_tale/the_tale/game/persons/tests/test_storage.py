@@ -10,6 +10,61 @@ from the_tale.game.persons import relations
 from the_tale.game.persons import logic
 
 
+class PersonsStorageTest(testcase.TestCase):
+
+    def setUp(self):
+        super(PersonsStorageTest, self).setUp()
+        self.place_1, self.place_2, self.place_3 = create_test_map()
+
+    def test_persons_for_place(self):
+        for place in (self.place_1, self.place_2, self.place_3):
+            persons = storage.persons.persons_for_place(place.id)
+
+            self.assertEqual(set(person.id for person in persons),
+                             set(person.id for person in storage.persons.all() if person.place_id == place.id))
+            self.assertEqual([person.created_at_turn for person in persons],
+                             sorted(person.created_at_turn for person in persons))
+
+    def test_persons_for_place__unknown_place(self):
+        self.assertEqual(storage.persons.persons_for_place(666), [])
+
+    def test_persons_for_place__copy(self):
+        storage.persons.persons_for_place(self.place_1.id).pop()
+        self.assertEqual(len(storage.persons.persons_for_place(self.place_1.id)),
+                         len([person for person in storage.persons.all() if person.place_id == self.place_1.id]))
+
+    def test_persons_for_place__version_changed(self):
+        person = storage.persons.persons_for_place(self.place_1.id)[0]
+
+        logic.move_person_to_place(person, self.place_2)
+
+        self.assertNotIn(person, storage.persons.persons_for_place(self.place_1.id))
+        self.assertIn(person, storage.persons.persons_for_place(self.place_2.id))
+
+    def test_power_fractions(self):
+        persons = self.place_1.persons
+
+        for i, person in enumerate(persons):
+            person.politic_power.inner_power = (i + 1) * 100
+            person.politic_power.outer_power = (len(persons) - i) * 100
+
+        fractions = storage.persons.power_fractions(self.place_1.id)
+
+        for person in persons:
+            self.assertEqual(fractions.total(person.politic_power),
+                             person.politic_power.total_politic_power_fraction([p.politic_power for p in persons]))
+            self.assertEqual(person.total_politic_power_fraction, fractions.total(person.politic_power))
+
+    def test_power_fractions__power_changed(self):
+        person = self.place_1.persons[0]
+
+        old_fraction = person.inner_politic_power_fraction
+
+        person.politic_power.inner_power += 1000
+
+        self.assertTrue(old_fraction < person.inner_politic_power_fraction)
+
+
 class SocialConnectionsStorageTest(testcase.TestCase):
 
     def setUp(self):
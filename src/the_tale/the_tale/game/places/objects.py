@@ -48,6 +48,7 @@ class Place(names.ManageNameMixin2):
                  'effects',
                  'job',
                  '_modifier',
+                 '_effects_cache',
 
                  # mames mixin
                  '_utg_name_form__lazy',
@@ -103,6 +104,7 @@ class Place(names.ManageNameMixin2):
         self.effects = effects
         self.job = job
         self._modifier = modifier
+        self._effects_cache = None
 
     @property
     def updated_at_game_time(self): return GameTime(*f.turns_to_game_time(self.updated_at_turn))
@@ -195,13 +197,11 @@ class Place(names.ManageNameMixin2):
     @property
     def persons(self):
         from the_tale.game.persons import storage as persons_storage
-        return sorted((person for person in persons_storage.persons.all() if person.place_id == self.id),
-                      key=lambda p: p.created_at_turn) # fix persons order
+        return persons_storage.persons.persons_for_place(self.id)
 
     @property
     def persons_by_power(self):
-        from the_tale.game.persons import storage as persons_storage
-        return sorted((person for person in persons_storage.persons.all() if person.place_id == self.id),
+        return sorted(self.persons,
                       key=lambda p: p.total_politic_power_fraction,
                       reverse=True) # fix persons order
 
@@ -243,10 +243,12 @@ class Place(names.ManageNameMixin2):
 
         yield effects.Effect(name='город', attribute=relations.ATTRIBUTE.STABILITY, value=1.0)
 
-        if len(self.persons) > c.PLACE_MAX_PERSONS:
+        persons = self.persons
+
+        if len(persons) > c.PLACE_MAX_PERSONS:
             yield effects.Effect(name='избыток Мастеров',
                                  attribute=relations.ATTRIBUTE.STABILITY,
-                                 value=c.PLACE_STABILITY_PENALTY_FOR_MASTER * (len(self.persons) - c.PLACE_MAX_PERSONS))
+                                 value=c.PLACE_STABILITY_PENALTY_FOR_MASTER * (len(persons) - c.PLACE_MAX_PERSONS))
 
         if self.is_wrong_race():
             dominant_race_power = self.races.get_race_percents(self.races.dominant_race)
@@ -323,7 +325,7 @@ class Place(names.ManageNameMixin2):
         yield effects.Effect(name='город', attribute=relations.ATTRIBUTE.CULTURE, value=1.0)
         yield effects.Effect(name='стабильность', attribute=relations.ATTRIBUTE.CULTURE, value=(1.0-self.attrs.stability) * c.PLACE_STABILITY_MAX_CULTURE_PENALTY)
 
-        for person in self.persons:
+        for person in persons:
             for effect in person.place_effects():
                 yield effect
 
@@ -370,7 +372,7 @@ class Place(names.ManageNameMixin2):
 
 
     def effects_for_attribute(self, attribute):
-        for effect in self.effects_generator(attribute.order):
+        for effect in self.all_effects():
             if effect.attribute == attribute:
                 yield effect
 
@@ -383,19 +385,39 @@ class Place(names.ManageNameMixin2):
         attribute = getattr(relations.ATTRIBUTE, attribute_name.upper())
         return (attribute, getattr(self.attrs, attribute_name.lower()))
 
-    def all_effects(self):
+    def _all_effects(self):
         for order in relations.ATTRIBUTE.EFFECTS_ORDER:
             for effect in self.effects_generator(order):
                 yield effect
 
+    def _effects_dependencies_version(self):
+        from the_tale.game.persons import storage as persons_storage
+        from . import storage
+
+        return (persons_storage.persons.version, storage.resource_exchanges.version)
+
+    def all_effects(self):
+        # effects are remembered by refresh_attributes, since attributes are changed only there
+        version = self._effects_dependencies_version()
+
+        if self._effects_cache is None or self._effects_cache[0] != version:
+            self._effects_cache = (version, list(self._all_effects()))
+
+        return self._effects_cache[1]
+
     def refresh_attributes(self):
         self.attrs.reset()
 
-        for effect in self.all_effects():
+        all_effects = []
+
+        for effect in self._all_effects():
             effect.apply_to(self.attrs)
+            all_effects.append(effect)
 
         self.attrs.sync()
 
+        self._effects_cache = (self._effects_dependencies_version(), all_effects)
+
     def effects_update_step(self):
         stability_delta = 0
         stability_effects = [effect for effect in self.effects.effects if effect.attribute.is_STABILITY]
@@ -417,17 +439,21 @@ class Place(names.ManageNameMixin2):
         from . import storage
         return [place for place in storage.places.all() if self.is_frontier == place.is_frontier]
 
+    def power_fractions(self):
+        from . import storage
+        return storage.places.power_fractions(self.is_frontier)
+
     @property
     def total_politic_power_fraction(self):
-        return self.politic_power.total_politic_power_fraction([place.politic_power for place in self.get_same_places()])
+        return self.power_fractions().total(self.politic_power)
 
     @property
     def inner_politic_power_fraction(self):
-        return self.politic_power.inner_power_fraction([place.politic_power for place in self.get_same_places()])
+        return self.power_fractions().inner(self.politic_power)
 
     @property
     def outer_politic_power_fraction(self):
-        return self.politic_power.outer_power_fraction([place.politic_power for place in self.get_same_places()])
+        return self.power_fractions().outer(self.politic_power)
 
     def get_job_power(self):
         return jobs_logic.job_power(power=self.total_politic_power_fraction,
@@ -1,10 +1,13 @@
 # coding: utf-8
+import math
 import random
 
 from dext.common.utils import storage as dext_storage
 
 from the_tale.common.utils import storage
 
+from the_tale.game import politic_power
+
 from .prototypes import ResourceExchangePrototype
 from .relations import BUILDING_STATE
 
@@ -16,6 +19,9 @@ class PlacesStorage(dext_storage.Storage):
     SETTINGS_KEY = 'places change time'
     EXCEPTION = exceptions.PlacesStorageError
 
+    _geometry_version = None
+    _power_fractions_version = None
+
     def _construct_object(self, model):
         from . import logic
         return logic.load_place(place_model=model)
@@ -43,6 +49,60 @@ class PlacesStorage(dext_storage.Storage):
 
         return None
 
+    def _sync_geometry(self):
+        self.sync()
+
+        if self._geometry_version is not None and self._geometry_version == self._version:
+            return
+
+        self._dominant_places = {}
+
+        for place in self.all():
+            for x, y in place.nearest_cells:
+                self._dominant_places.setdefault((x, y), place)
+
+        # filled on demand, since heroes visit small part of map cells
+        self._nearest_places = {}
+
+        self._geometry_version = self._version
+
+    def power_fractions(self, is_frontier):
+        self.sync()
+
+        version = (self._version, politic_power.PoliticPower.version())
+
+        if self._power_fractions_version != version:
+            self._power_fractions = {}
+            self._power_fractions_version = version
+
+        if is_frontier not in self._power_fractions:
+            self._power_fractions[is_frontier] = politic_power.PowerFractions([place.politic_power
+                                                                               for place in self.all()
+                                                                               if place.is_frontier == is_frontier])
+
+        return self._power_fractions[is_frontier]
+
+    def get_dominant_place(self, x, y):
+        self._sync_geometry()
+        return self._dominant_places.get((x, y))
+
+    def get_nearest_place(self, x, y):
+        self._sync_geometry()
+
+        if (x, y) not in self._nearest_places:
+            best_distance = 999999999999999
+            best_place = None
+
+            for place in self.all():
+                distance = math.hypot(place.x-x, place.y-y)
+                if distance < best_distance:
+                    best_distance = distance
+                    best_place = place
+
+            self._nearest_places[(x, y)] = best_place
+
+        return self._nearest_places[(x, y)]
+
     def shift_all(self, dx, dy):
         for place in self.all():
             place.shift(dx, dy)
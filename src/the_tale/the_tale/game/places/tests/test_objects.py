@@ -134,6 +134,26 @@ class PlaceTests(testcase.TestCase):
                                          bill=None)
 
 
+    def test_all_effects__cached_on_refresh(self):
+        self.p1.refresh_attributes()
+
+        with mock.patch('the_tale.game.places.objects.Place._effects_generator') as _effects_generator:
+            all_effects = self.p1.all_effects()
+            self.p1.tooltip_effects_for_attribute(relations.ATTRIBUTE.SAFETY)
+
+        self.assertEqual(_effects_generator.call_count, 0)
+        self.assertTrue(all_effects)
+
+    def test_all_effects__persons_changed(self):
+        all_effects = self.p1.all_effects()
+
+        persons_storage.persons.update_version()
+
+        self.assertIsNot(all_effects, self.p1.all_effects())
+        self.assertEqual([(effect.name, effect.attribute, effect.value) for effect in all_effects],
+                         [(effect.name, effect.attribute, effect.value) for effect in self.p1.all_effects()])
+
+
     @mock.patch('the_tale.game.balance.constants.PLACE_STABILITY_PENALTY_FOR_RACES', 0)
     @mock.patch('the_tale.game.places.objects.Place.is_modifier_active', lambda self: True)
     @mock.patch('the_tale.game.persons.objects.Person.get_economic_modifier', lambda obj, x: 10)
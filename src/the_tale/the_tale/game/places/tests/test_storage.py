@@ -92,6 +92,62 @@ class PlacesStorageTest(testcase.TestCase):
         self.assertTrue(self.p1.id in self.storage)
         self.assertFalse(666 in self.storage)
 
+    def test_get_dominant_place(self):
+        for place in (self.p1, self.p2, self.p3):
+            for x, y in place.nearest_cells:
+                self.assertEqual(self.storage.get_dominant_place(x, y).id, place.id)
+
+        self.assertEqual(self.storage.get_dominant_place(-1, -1), None)
+
+    def test_get_nearest_place(self):
+        for place in (self.p1, self.p2, self.p3):
+            self.assertEqual(self.storage.get_nearest_place(place.x, place.y).id, place.id)
+
+        self.assertEqual(self.storage.get_nearest_place(0, 0).id, self.p1.id)
+
+    def test_geometry__rebuild_on_version_change(self):
+        self.assertEqual(self.storage.get_nearest_place(1, 1).id, self.p1.id)
+
+        self.storage[self.p2.id].x = 1
+        self.storage[self.p2.id].y = 1
+        self.storage[self.p1.id].x = 5
+        self.storage[self.p1.id].nearest_cells = [(1, 1)]
+
+        self.assertEqual(self.storage.get_nearest_place(1, 1).id, self.p1.id)
+
+        self.storage.update_version()
+
+        self.assertEqual(self.storage.get_nearest_place(1, 1).id, self.p2.id)
+        self.assertEqual(self.storage.get_dominant_place(1, 1).id, self.p1.id)
+
+    def test_power_fractions(self):
+        places = [self.storage[place.id] for place in (self.p1, self.p2, self.p3)]
+
+        for i, place in enumerate(places):
+            place.politic_power.inner_power = (i + 1) * 100
+            place.politic_power.outer_power = (i + 1) * 200
+
+        fractions = self.storage.power_fractions(places[0].is_frontier)
+
+        same_powers = [place.politic_power for place in places if place.is_frontier == places[0].is_frontier]
+
+        self.assertEqual(fractions.total(places[0].politic_power),
+                         places[0].politic_power.total_politic_power_fraction(same_powers))
+
+    def test_power_fractions__cached(self):
+        fractions = self.storage.power_fractions(False)
+        self.assertIs(fractions, self.storage.power_fractions(False))
+
+        self.storage[self.p1.id].politic_power.inner_power += 100
+
+        self.assertIsNot(fractions, self.storage.power_fractions(False))
+
+        fractions = self.storage.power_fractions(False)
+
+        self.storage.update_version()
+
+        self.assertIsNot(fractions, self.storage.power_fractions(False))
+
 
 
 class ResourceExchangeStorageTests(testcase.TestCase):
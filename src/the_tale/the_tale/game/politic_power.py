@@ -5,11 +5,43 @@ from the_tale.game.balance import constants as c
 
 
 
+class PowerFractions(object):
+    __slots__ = ('inner_minimum', 'inner_total', 'outer_minimum', 'outer_total')
+
+    def __init__(self, all_powers):
+        # находим минимальное отрицательное влияние и компенсируем его при расчёте долей
+        self.inner_minimum = 0.0
+        self.outer_minimum = 0.0
+
+        for obj in all_powers:
+            self.inner_minimum = min(self.inner_minimum, obj.inner_power)
+            self.outer_minimum = min(self.outer_minimum, obj.outer_power)
+
+        self.inner_total = 0.0
+        self.outer_total = 0.0
+
+        for obj in all_powers:
+            self.inner_total += (obj.inner_power - self.inner_minimum)
+            self.outer_total += (obj.outer_power - self.outer_minimum)
+
+    def inner(self, power):
+        return ((power.inner_power - self.inner_minimum) / self.inner_total) if self.inner_total else 0
+
+    def outer(self, power):
+        return ((power.outer_power - self.outer_minimum) / self.outer_total) if self.outer_total else 0
+
+    def total(self, power):
+        return (self.inner(power) + self.outer(power)) / 2
+
+
 class PoliticPower(object):
-    __slots__ = ('outer_power', 'inner_power', 'inner_circle', '_inner_positive_heroes', '_inner_negative_heroes')
+    __slots__ = ('_outer_power', '_inner_power', 'inner_circle', '_inner_positive_heroes', '_inner_negative_heroes')
     INNER_CIRCLE_SIZE = None
     POWER_REMOVE_BARRIER = 1
 
+    # changed on every change of any power, used to invalidate cached power fractions
+    _version = 0
+
     def __init__(self, outer_power, inner_power, inner_circle):
         self.outer_power = outer_power
         self.inner_power = inner_power
@@ -22,6 +54,28 @@ class PoliticPower(object):
     def create(cls):
         return cls(outer_power=0, inner_power=0, inner_circle={})
 
+    @classmethod
+    def version(cls):
+        return PoliticPower._version
+
+    @property
+    def outer_power(self):
+        return self._outer_power
+
+    @outer_power.setter
+    def outer_power(self, value):
+        self._outer_power = value
+        PoliticPower._version += 1
+
+    @property
+    def inner_power(self):
+        return self._inner_power
+
+    @inner_power.setter
+    def inner_power(self, value):
+        self._inner_power = value
+        PoliticPower._version += 1
+
     def reset_cache(self):
         self._inner_positive_heroes = None
         self._inner_negative_heroes = None
@@ -60,11 +114,13 @@ class PoliticPower(object):
                    inner_circle={int(account_id): power for account_id, power in data['inner_circle'].items()})
 
     def ui_info(self, all_powers):
+        fractions = PowerFractions(all_powers)
+
         return {'power': {'inner': {'value': self.inner_power,
-                                    'fraction': self.inner_power_fraction(all_powers)},
+                                    'fraction': fractions.inner(self)},
                           'outer': {'value': self.outer_power,
-                                    'fraction': self.outer_power_fraction(all_powers)},
-                          'fraction': self.total_politic_power_fraction(all_powers)},
+                                    'fraction': fractions.outer(self)},
+                          'fraction': fractions.total(self)},
                 'heroes': {'positive': {hero_id: self.inner_circle[hero_id] for hero_id in self.inner_positive_heroes},
                            'negative': {hero_id: self.inner_circle[hero_id] for hero_id in self.inner_negative_heroes}}}
 
@@ -138,36 +194,13 @@ class PoliticPower(object):
         self._inner_negative_heroes = frozenset((hero_id for power, hero_id in negative_heroes[-self.INNER_CIRCLE_SIZE:]))
 
     def inner_power_fraction(self, all_powers):
-        # находим минимальное отрицательное влияние и компенсируем его при расчёте долей
-        minimum_power = 0.0
-
-        for obj in all_powers:
-            minimum_power = min(minimum_power, obj.inner_power)
-
-        total_power = 0.0
-
-        for obj in all_powers:
-            total_power += (obj.inner_power - minimum_power)
-
-        return ((self.inner_power - minimum_power) / total_power) if total_power else 0
+        return PowerFractions(all_powers).inner(self)
 
     def outer_power_fraction(self, all_powers):
-        # находим минимальное отрицательное влияние и компенсируем его при расчёте долей
-        minimum_power = 0.0
-
-        for obj in all_powers:
-            minimum_power = min(minimum_power, obj.outer_power)
-
-        total_power = 0.0
-
-        for obj in all_powers:
-            total_power += (obj.outer_power - minimum_power)
-
-        return ((self.outer_power - minimum_power) / total_power) if total_power else 0
-
+        return PowerFractions(all_powers).outer(self)
 
     def total_politic_power_fraction(self, all_powers):
-        return (self.inner_power_fraction(all_powers) + self.outer_power_fraction(all_powers)) / 2
+        return PowerFractions(all_powers).total(self)
 
 
     def __str__(self): return '{}, {}'.format(self.outer_power, self.inner_power)
@@ -9,4 +9,6 @@ APP_DIR = os.path.abspath(os.path.dirname(__file__))
 quests_settings = app_settings('QUESTS',
                                WRITERS_DIRECTORY=os.path.join(APP_DIR, 'fixtures', 'writers'),
                                MAX_QUEST_GENERATION_RETRIES=100,
-                               INTERFERED_PERSONS_LIVE_TIME=24*60*60)
+                               INTERFERED_PERSONS_LIVE_TIME=24*60*60,
+                               GENERATORS_NUMBER=int(os.getenv('TT_QUESTS_GENERATORS_NUMBER', 2)), # setupped by deploy from tt_quests_generators
+                               GENERATION_TIME_LIMIT=0.5)
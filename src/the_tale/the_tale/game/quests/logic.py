@@ -434,7 +434,7 @@ def create_hero_info(hero):
 
 def request_quest_for_hero(hero):
     hero_info = create_hero_info(hero)
-    amqp_environment.environment.workers.quests_generator.cmd_request_quest(hero.account_id, hero_info.serialize())
+    amqp_environment.environment.quests_generator(hero.account_id).cmd_request_quest(hero.account_id, hero_info.serialize())
 
 
 def setup_quest_for_hero(hero, knowledge_base_data):
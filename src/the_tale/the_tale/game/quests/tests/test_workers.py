@@ -15,6 +15,7 @@ from the_tale.game.logic_storage import LogicStorage
 from the_tale.game.logic import create_test_map
 
 from the_tale.game.quests import logic
+from the_tale.game.quests.conf import quests_settings
 from the_tale.game.quests.workers import quests_generator
 
 
@@ -68,21 +69,54 @@ class QuestsGeneratorWorkerTests(testcase.TestCase):
         self.worker.process_request_quest(self.hero_2.account_id, hero_2_info.serialize())
         self.worker.process_request_quest(self.hero_1.account_id, new_hero_1_info.serialize())
 
-        self.assertEqual(self.worker.requests_query, collections.deque([self.account_1.id, self.account_2.id]))
-        self.assertEqual(self.worker.requests_heroes_infos, {self.account_1.id: new_hero_1_info, self.account_2.id: hero_2_info})
+        self.assertEqual(list(self.worker.requests_heroes_infos.items()), [(self.account_1.id, new_hero_1_info),
+                                                                           (self.account_2.id, hero_2_info)])
 
         with mock.patch('the_tale.game.workers.supervisor.Worker.cmd_setup_quest') as cmd_setup_quest:
             self.worker.generate_quest()
 
         self.assertEqual(cmd_setup_quest.call_args_list[0][0][0], self.account_1.id)
 
-        self.assertEqual(self.worker.requests_query, collections.deque([self.account_2.id]))
-        self.assertEqual(self.worker.requests_heroes_infos, {self.account_2.id: hero_2_info})
+        self.assertEqual(list(self.worker.requests_heroes_infos.items()), [(self.account_2.id, hero_2_info)])
 
         with mock.patch('the_tale.game.workers.supervisor.Worker.cmd_setup_quest') as cmd_setup_quest:
             self.worker.generate_quest()
 
         self.assertEqual(cmd_setup_quest.call_args_list[0][0][0], self.account_2.id)
 
-        self.assertEqual(self.worker.requests_query, collections.deque())
-        self.assertEqual(self.worker.requests_heroes_infos, {})
+        self.assertEqual(self.worker.requests_heroes_infos, collections.OrderedDict())
+
+    def test_generate_quests(self):
+        self.worker.process_request_quest(self.hero_1.account_id, logic.create_hero_info(self.hero_1).serialize())
+        self.worker.process_request_quest(self.hero_2.account_id, logic.create_hero_info(self.hero_2).serialize())
+
+        with mock.patch('the_tale.game.workers.supervisor.Worker.cmd_setup_quest') as cmd_setup_quest:
+            self.worker.generate_quests()
+
+        self.assertEqual([call[0][0] for call in cmd_setup_quest.call_args_list], [self.account_1.id, self.account_2.id])
+        self.assertEqual(self.worker.requests_heroes_infos, collections.OrderedDict())
+
+    def test_generate_quests__empty_queue(self):
+        with mock.patch('the_tale.game.quests.workers.quests_generator.Worker.generate_quest') as generate_quest:
+            self.worker.generate_quests()
+
+        self.assertEqual(generate_quest.call_count, 0)
+
+    @mock.patch('the_tale.game.quests.conf.quests_settings.GENERATION_TIME_LIMIT', 0)
+    def test_generate_quests__time_limit(self):
+        self.worker.process_request_quest(self.hero_1.account_id, logic.create_hero_info(self.hero_1).serialize())
+
+        with mock.patch('the_tale.game.quests.workers.quests_generator.Worker.generate_quest') as generate_quest:
+            self.worker.generate_quests()
+
+        self.assertEqual(generate_quest.call_count, 0)
+        self.assertEqual(list(self.worker.requests_heroes_infos.keys()), [self.account_1.id])
+
+    def test_quests_generator__same_for_account(self):
+        generators = amqp_environment.environment.quests_generators_names()
+
+        self.assertEqual(len(generators), quests_settings.GENERATORS_NUMBER)
+
+        for account_id in range(10):
+            self.assertIs(amqp_environment.environment.quests_generator(account_id),
+                          amqp_environment.environment.quests_generator(account_id + len(generators)))
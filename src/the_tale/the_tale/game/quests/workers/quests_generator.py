@@ -1,5 +1,6 @@
 # coding: utf-8
 import sys
+import time
 import collections
 
 from the_tale import amqp_environment
@@ -7,6 +8,7 @@ from the_tale import amqp_environment
 from the_tale.common.utils.workers import BaseWorker
 
 from the_tale.game.quests import logic
+from the_tale.game.quests.conf import quests_settings
 
 
 class Worker(BaseWorker):
@@ -21,30 +23,44 @@ class Worker(BaseWorker):
 
         self.initialized = True
 
-        self.requests_query = collections.deque()
-        self.requests_heroes_infos = {}
+        # account_id -> hero_info, in order of first request
+        self.requests_heroes_infos = collections.OrderedDict()
 
         self.logger.info('QUEST GENERATOR INITIALIZED')
 
     def process_no_cmd(self):
         if self.initialized:
-            self.generate_quest()
+            self.generate_quests()
 
     def cmd_request_quest(self, account_id, hero_info):
         self.send_cmd('request_quest', {'account_id': account_id,
                                         'hero_info': hero_info})
 
     def process_request_quest(self, account_id, hero_info):
+        # newer request replaces older one, but keeps its place in queue
         self.requests_heroes_infos[account_id] = logic.HeroQuestInfo.deserialize(hero_info)
-        if account_id not in self.requests_query:
-            self.requests_query.append(account_id)
+
+    def generate_quests(self):
+        if not self.requests_heroes_infos:
+            return
+
+        started_at = time.time()
+
+        generated_number = 0
+
+        while self.requests_heroes_infos and time.time() - started_at < quests_settings.GENERATION_TIME_LIMIT:
+            self.generate_quest()
+            generated_number += 1
+
+        self.logger.info('generated {number} quests in {time:.3f} seconds, queue size: {queue_size}'.format(number=generated_number,
+                                                                                                           time=time.time() - started_at,
+                                                                                                           queue_size=len(self.requests_heroes_infos)))
 
     def generate_quest(self):
-        if not self.requests_query:
+        if not self.requests_heroes_infos:
             return
 
-        account_id = self.requests_query.popleft()
-        hero_info = self.requests_heroes_infos.pop(account_id)
+        account_id, hero_info = self.requests_heroes_infos.popitem(last=False)
 
         try:
             knowledge_base = logic.create_random_quest_for_hero(hero_info, logger=self.logger)
@@ -1,73 +1,92 @@
 # coding: utf-8
+import heapq
+
+from django.db import transaction
 
 from the_tale.game.places import storage as places_storage
 from the_tale.game.roads.storage import roads_storage, waymarks_storage
 from the_tale.game.roads.prototypes import WaymarkPrototype
+from the_tale.game.roads.models import Waymark
+
+
+# length of waymarks between places without path between them
+UNREACHABLE_LENGTH = 9999999999999999999999999999.0
+
+
+def get_roads_graph(places, roads):
+    graph = {place.id: [] for place in places}
+
+    for road in roads:
+        graph[road.point_1_id].append((road.point_2_id, road.length, road.id))
+        graph[road.point_2_id].append((road.point_1_id, road.length, road.id))
+
+    return graph
+
+
+def find_paths(graph, start_id):
+    '''
+    Dijkstra algorithm
+
+    returns {place_id: (length, first_road_id)}, first_road_id is None for start place
+    '''
 
+    paths = {}
 
-class Path(object):
+    queue = [(0, 0, start_id, None)]
 
-    def __init__(self):
-        self.road_id = -1
-        self.length = 9999999999999999999999999999
+    counter = 0
+
+    while queue:
+        length, _, place_id, first_road_id = heapq.heappop(queue)
+
+        if place_id in paths:
+            continue
+
+        paths[place_id] = (length, first_road_id)
+
+        for next_place_id, road_length, road_id in graph[place_id]:
+            if next_place_id in paths:
+                continue
+
+            counter += 1
+            heapq.heappush(queue, (length + road_length, counter, next_place_id, road_id if first_road_id is None else first_road_id))
+
+    return paths
 
-    def update_path(self, new_length, new_road_id):
-        if self.length > new_length:
-            self.road_id = new_road_id
-            self.length = new_length
 
 @waymarks_storage.postpone_version_update
-def update_waymarks(): # pylint: disable=R0912
+@transaction.atomic
+def update_waymarks():
 
     places = places_storage.places.all()
 
-    roads = roads_storage.all_exists_roads()
+    graph = get_roads_graph(places, roads_storage.all_exists_roads())
 
-    places_len = len(places)
+    new_waymarks = []
 
-    paths = [ [ Path() for place in range(places_len) ] for i in range(places_len)] # pylint: disable=W0612
+    for place_from in places:
+        paths = find_paths(graph, place_from.id)
 
-    p2i = dict( (place.id, i) for i, place in enumerate(places))
+        for place_to in places:
+            length, road_id = paths.get(place_to.id, (UNREACHABLE_LENGTH, None))
 
-    for i in range(len(places)):
-        paths[i][i].update_path(0, None)
+            waymark = waymarks_storage.look_for_road(point_from=place_from.id, point_to=place_to.id)
 
-    for road in roads:
-        i = p2i[road.point_1_id]
-        j = p2i[road.point_2_id]
-        paths[i][j].update_path(road.length, road.id)
-        paths[j][i].update_path(road.length, road.id)
-
-    for k in range(places_len):
-        for i in range(places_len):
-            for j in range(places_len):
-                new_len = min(paths[i][j].length,
-                              paths[i][k].length + paths[k][j].length)
-                paths[i][j].update_path(new_len, paths[i][k].road_id)
-
-    for row in paths:
-        res = []
-        for el in row:
-            res.append(el.road_id)
-
-
-    for i in range(places_len):
-        for j in range(places_len):
-            if paths[i][j].road_id is not None:
-                road = roads_storage[paths[i][j].road_id]
-            else:
-                road = None
-
-            waymark = waymarks_storage.look_for_road(point_from=places[i].id, point_to=places[j].id)
-
-            if waymark:
-                waymark.road = road
-                waymark.length = paths[i][j].length
-                waymark.save()
-            else:
-                waymark = WaymarkPrototype.create(point_from=places[i],
-                                                  point_to=places[j],
-                                                  road=road,
-                                                  length=paths[i][j].length)
+            if waymark is None:
+                new_waymarks.append(Waymark(point_from_id=place_from.id,
+                                            point_to_id=place_to.id,
+                                            road_id=road_id,
+                                            length=length))
+                continue
+
+            if waymark.road_id == road_id and waymark.length == length:
+                continue
+
+            waymark.road = roads_storage[road_id] if road_id is not None else None
+            waymark.length = length
+            waymark.save()
+
+    for model in Waymark.objects.bulk_create(new_waymarks):
+        waymarks_storage.add_item(model.id, WaymarkPrototype(model))
 
     waymarks_storage.update_version()
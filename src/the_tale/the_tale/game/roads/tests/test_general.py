@@ -1,4 +1,6 @@
 # coding: utf-8
+from unittest import mock
+
 from the_tale.common.utils import testcase
 
 from the_tale.game.logic import create_test_map
@@ -6,7 +8,7 @@ from the_tale.game.logic import create_test_map
 from the_tale.game.roads.models import Road, Waymark
 from the_tale.game.roads.prototypes import RoadPrototype
 from the_tale.game.roads.storage import roads_storage, waymarks_storage
-from the_tale.game.roads.logic import update_waymarks
+from the_tale.game.roads.logic import update_waymarks, find_paths, get_roads_graph, UNREACHABLE_LENGTH
 
 
 class GeneralTest(testcase.TestCase):
@@ -42,6 +44,83 @@ class GeneralTest(testcase.TestCase):
 
         self.assertNotEqual(r3.id, self.r1.id)
 
+    def test_update_waymarks__no_changes(self):
+        with mock.patch('the_tale.game.roads.prototypes.WaymarkPrototype.save') as save:
+            update_waymarks()
+
+        self.assertEqual(save.call_count, 0)
+        self.assertEqual(Waymark.objects.all().count(), 9)
+
+    def test_update_waymarks__new_waymarks(self):
+        Waymark.objects.all().delete()
+        waymarks_storage.refresh()
+
+        update_waymarks()
+
+        self.assertEqual(Waymark.objects.all().count(), 9)
+
+        waymark = waymarks_storage.look_for_road(point_from=self.p1.id, point_to=self.p3.id)
+        self.assertEqual(waymark.road.id, self.r1.id)
+        self.assertEqual(waymark.length, self.r1.length + self.r2.length)
+
+        waymark = waymarks_storage.look_for_road(point_from=self.p2.id, point_to=self.p2.id)
+        self.assertEqual(waymark.road, None)
+        self.assertEqual(waymark.length, 0)
+
+    def test_update_waymarks__isolated_place(self):
+        self.r2.exists = False
+        self.r2.save()
+
+        update_waymarks()
+
+        self.assertEqual(Waymark.objects.all().count(), 9)
+
+        for place_from, place_to in ((self.p1, self.p3), (self.p2, self.p3), (self.p3, self.p1), (self.p3, self.p2)):
+            waymark = waymarks_storage.look_for_road(point_from=place_from.id, point_to=place_to.id)
+            self.assertEqual(waymark.road, None)
+            self.assertEqual(waymark.length, UNREACHABLE_LENGTH)
+
+        waymark = waymarks_storage.look_for_road(point_from=self.p1.id, point_to=self.p2.id)
+        self.assertEqual(waymark.road.id, self.r1.id)
+        self.assertEqual(waymark.length, self.r1.length)
+
+        waymark = waymarks_storage.look_for_road(point_from=self.p3.id, point_to=self.p3.id)
+        self.assertEqual(waymark.road, None)
+        self.assertEqual(waymark.length, 0)
+
+    def test_update_waymarks__isolated_place__new_waymarks(self):
+        self.r2.exists = False
+        self.r2.save()
+
+        Waymark.objects.all().delete()
+        waymarks_storage.refresh()
+
+        update_waymarks()
+
+        self.assertEqual(Waymark.objects.all().count(), 9)
+
+        waymark = waymarks_storage.look_for_road(point_from=self.p1.id, point_to=self.p3.id)
+        self.assertEqual(waymark.road, None)
+        self.assertEqual(waymark.length, UNREACHABLE_LENGTH)
+
+    def test_find_paths(self):
+        graph = {1: [(2, 1.0, 10), (3, 5.0, 11)],
+                 2: [(1, 1.0, 10), (3, 1.0, 12)],
+                 3: [(1, 5.0, 11), (2, 1.0, 12)],
+                 4: []}
+
+        self.assertEqual(find_paths(graph, 1), {1: (0, None),
+                                                2: (1.0, 10),
+                                                3: (2.0, 10)})
+
+        self.assertEqual(find_paths(graph, 4), {4: (0, None)})
+
+    def test_get_roads_graph(self):
+        graph = get_roads_graph([self.p1, self.p2, self.p3], [self.r1, self.r2])
+
+        self.assertCountEqual(graph[self.p2.id], [(self.p1.id, self.r1.length, self.r1.id),
+                                                  (self.p3.id, self.r2.length, self.r2.id)])
+
     def test_roll_road(self):
         self.assertEqual(RoadPrototype._roll(5, 4, 13, 8), 'rdrrdrrdrrdr')
         self.assertEqual(RoadPrototype._roll(13, 8, 5, 4), 'llullullullu')
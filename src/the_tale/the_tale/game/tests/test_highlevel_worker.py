@@ -65,6 +65,60 @@ class HighlevelTest(testcase.TestCase):
         self.assertEqual(self.worker.places_politic_power, [])
         self.assertEqual(self.worker.persons_politic_power, [])
 
+    def test_power_changes(self):
+        changes = highlevel.PowerChanges()
+
+        changes.add(hero_id=666, has_place_in_preferences=True, has_person_in_preferences=False, person_id=1, place_id=None, power_delta=1)
+        changes.add(hero_id=666, has_place_in_preferences=True, has_person_in_preferences=False, person_id=1, place_id=None, power_delta=10)
+        changes.add(hero_id=666, has_place_in_preferences=True, has_person_in_preferences=False, person_id=1, place_id=None, power_delta=-100)
+        changes.add(hero_id=777, has_place_in_preferences=True, has_person_in_preferences=False, person_id=1, place_id=None, power_delta=1000)
+        changes.add(hero_id=None, has_place_in_preferences=False, has_person_in_preferences=False, person_id=None, place_id=2, power_delta=5)
+
+        self.assertEqual(len(changes), 4)
+
+        self.assertEqual(sorted(changes.pop_all(), key=lambda change: change[-1]),
+                         [[666, True, False, 1, None, -100],
+                          [None, False, False, None, 2, 5],
+                          [666, True, False, 1, None, 11],
+                          [777, True, False, 1, None, 1000]])
+
+        self.assertEqual(len(changes), 0)
+        self.assertEqual(changes.pop_all(), [])
+
+    def test_cmd_change_power__accumulated(self):
+        person = persons_storage.persons.all()[0]
+
+        with mock.patch('the_tale.game.workers.highlevel.Worker.send_cmd') as send_cmd:
+            self.worker.cmd_change_power(hero_id=666, has_place_in_preferences=False, has_person_in_preferences=True, person_id=person.id, place_id=None, power_delta=1)
+            self.worker.cmd_change_power(hero_id=666, has_place_in_preferences=False, has_person_in_preferences=True, person_id=person.id, place_id=None, power_delta=2)
+
+        self.assertEqual(send_cmd.call_count, 0)
+
+        with mock.patch('the_tale.game.workers.highlevel.Worker.send_cmd') as send_cmd:
+            self.worker.cmd_flush_power_changes()
+            self.worker.cmd_flush_power_changes()
+
+        self.assertEqual(send_cmd.call_args_list, [mock.call('change_power_batch', {'changes': [[666, False, True, person.id, None, 3]]})])
+
+    def test_process_change_power_batch(self):
+        person = persons_storage.persons.all()[0]
+
+        self.worker.process_change_power_batch([[666, False, True, person.id, None, 3],
+                                                [None, False, False, None, self.p1.id, -10]])
+
+        self.assertEqual(self.worker.persons_politic_power, [highlevel.PowerInfo(hero_id=666,
+                                                                                 has_place_in_preferences=False,
+                                                                                 has_person_in_preferences=True,
+                                                                                 person_id=person.id,
+                                                                                 place_id=None,
+                                                                                 power_delta=3)])
+        self.assertEqual(self.worker.places_politic_power, [highlevel.PowerInfo(hero_id=None,
+                                                                                has_place_in_preferences=False,
+                                                                                has_person_in_preferences=False,
+                                                                                person_id=None,
+                                                                                place_id=self.p1.id,
+                                                                                power_delta=-10)])
+
     def test_process_change_power__persons(self):
         self.assertEqual(self.worker.persons_politic_power, [])
 
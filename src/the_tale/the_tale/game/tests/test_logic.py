@@ -1,10 +1,12 @@
 # coding: utf-8
 from unittest import mock
 
+from tt_protocol.protocol import diary_pb2
+
 from the_tale.common.utils import testcase
 
 from the_tale.game.logic_storage import LogicStorage
-from the_tale.game.logic import remove_game_data, create_test_map, form_game_info
+from the_tale.game.logic import remove_game_data, create_test_map, form_game_info, fill_diary_versions, push_turn_updates
 from the_tale.game.prototypes import TimePrototype
 
 from the_tale.game.pvp.tests.helpers import PvPTestsMixin
@@ -35,6 +37,31 @@ class LogicTests(testcase.TestCase):
 
         self.assertEqual(heroes_models.Hero.objects.count(), 0)
 
+    def test_push_turn_updates__turned_off(self):
+        with mock.patch('the_tale.common.utils.tt_api.async_request') as async_request:
+            push_turn_updates(accounts_ids=[self.account.id], turn_number=666)
+
+        self.assertEqual(async_request.call_count, 0)
+
+    @mock.patch('the_tale.game.conf.game_settings.TURN_UPDATES_WAIT_URL', '/turn-updates/wait')
+    def test_push_turn_updates__no_accounts(self):
+        with mock.patch('the_tale.common.utils.tt_api.async_request') as async_request:
+            push_turn_updates(accounts_ids=[], turn_number=666)
+
+        self.assertEqual(async_request.call_count, 0)
+
+    @mock.patch('the_tale.game.conf.game_settings.TURN_UPDATES_WAIT_URL', '/turn-updates/wait')
+    def test_push_turn_updates(self):
+        with mock.patch('the_tale.common.utils.tt_api.async_request') as async_request:
+            push_turn_updates(accounts_ids=[self.account.id, 777], turn_number=666)
+
+        self.assertEqual(async_request.call_count, 1)
+
+        request = async_request.call_args[1]['data']
+
+        self.assertEqual([(turn.account_id, turn.turn_number) for turn in request.turns],
+                         [(self.account.id, 666), (777, 666)])
+
 
 
 class FormGameInfoTests(testcase.TestCase, PvPTestsMixin):
@@ -97,6 +124,59 @@ class FormGameInfoTests(testcase.TestCase, PvPTestsMixin):
         self.assertEqual(data['account']['id'], self.account_1.id)
         self.assertEqual(data['enemy']['id'], self.account_2.id)
 
+    def test_diary_versions(self):
+        self.pvp_create_battle(self.account_1, self.account_2, BATTLE_1X1_STATE.PROCESSING)
+        self.pvp_create_battle(self.account_2, self.account_1, BATTLE_1X1_STATE.PROCESSING)
+
+        with mock.patch('the_tale.game.heroes.logic.diary_versions',
+                        mock.Mock(return_value={self.account_1.id: 1, self.account_2.id: 2})) as diary_versions:
+            data = fill_diary_versions(form_game_info(self.account_1, is_own=True))
+
+        self.assertEqual(diary_versions.call_args_list,
+                         [mock.call([self.account_1.id, self.account_2.id],
+                                    turns={self.account_1.id: data['account']['hero']['actual_on_turn'],
+                                           self.account_2.id: data['enemy']['hero']['actual_on_turn']})])
+
+        self.assertEqual(data['account']['hero']['diary'], 1)
+        self.assertEqual(data['enemy']['hero']['diary'], 2)
+
+    def test_diary_versions__not_filled(self):
+        with mock.patch('the_tale.game.heroes.logic.diary_versions') as diary_versions:
+            data = form_game_info(self.account_1, is_own=True)
+
+        self.assertEqual(diary_versions.call_count, 0)
+        self.assertEqual(data['account']['hero']['diary'], None)
+
+    def test_fill_diary_versions__no_account(self):
+        with mock.patch('the_tale.game.heroes.logic.diary_versions') as diary_versions:
+            data = fill_diary_versions(form_game_info())
+
+        self.assertEqual(diary_versions.call_count, 0)
+        self.assertEqual(data['account'], None)
+
+    def test_diary_versions__old_hero_data(self):
+        TimePrototype(turn_number=666).save()
+
+        # hero's data is requested while turn is processed, diary messages of new turn are not pushed yet
+        with mock.patch('the_tale.common.utils.tt_api.sync_request',
+                        mock.Mock(return_value=diary_pb2.VersionsResponse(versions=[1]))):
+            data = fill_diary_versions(form_game_info(self.account_1, is_own=True))
+
+        self.assertTrue(data['account']['is_old'])
+        self.assertEqual(data['account']['hero']['diary'], 1)
+
+        # turn processed, diary messages pushed
+        heroes_logic.save_hero(heroes_logic.load_hero(account_id=self.account_1.id))
+
+        with mock.patch('the_tale.common.utils.tt_api.sync_request',
+                        mock.Mock(return_value=diary_pb2.VersionsResponse(versions=[2]))) as sync_request:
+            data = fill_diary_versions(form_game_info(self.account_1, is_own=True))
+
+        self.assertEqual(sync_request.call_count, 1)
+
+        self.assertFalse(data['account']['is_old'])
+        self.assertEqual(data['account']['hero']['diary'], 2)
+
     def test_own_hero_get_cached_data(self):
         hero = heroes_logic.load_hero(account_id=self.account_1.id)
 
@@ -8,9 +8,12 @@ from the_tale.game.actions import prototypes as actions_prototypes
 from the_tale.game.actions import meta_actions
 
 from the_tale.game.heroes import logic as heroes_logic
+from the_tale.game.heroes import objects as heroes_objects
+from the_tale.game.heroes.conf import heroes_settings
 
 from the_tale.game.logic import create_test_map
 from the_tale.game.logic_storage import LogicStorage
+from the_tale.game.prototypes import TimePrototype
 from the_tale.game import exceptions
 from the_tale.game import conf
 
@@ -217,6 +220,25 @@ class LogicStorageTests(testcase.TestCase):
         self.assertCountEqual(list(self.storage.current_cache.keys()), ())
         self.assertEqual(self.storage.cache_queue, set())
 
+    def test_process_cache_queue__push_turn_updates(self):
+        self.storage.cache_queue.add(self.hero_2.id)
+        self.storage.cache_queue.add(self.hero_1.id)
+
+        with mock.patch('the_tale.game.logic.push_turn_updates') as push_turn_updates:
+            self.storage.process_cache_queue(update_cache=False)
+
+        self.assertEqual(push_turn_updates.call_count, 0)
+
+        self.storage.cache_queue.add(self.hero_2.id)
+        self.storage.cache_queue.add(self.hero_1.id)
+
+        with mock.patch('the_tale.game.logic.push_turn_updates') as push_turn_updates:
+            self.storage.process_cache_queue(update_cache=True)
+
+        self.assertEqual(push_turn_updates.call_count, 1)
+        self.assertCountEqual(push_turn_updates.call_args[1]['accounts_ids'], [self.account_1.id, self.account_2.id])
+        self.assertEqual(push_turn_updates.call_args[1]['turn_number'], TimePrototype.get_current_turn_number())
+
     def test_process_cache_queue__update_cache__with_update(self):
         self.assertEqual(self.storage.cache_queue, set())
 
@@ -243,16 +265,37 @@ class LogicStorageTests(testcase.TestCase):
         self.assertEqual(self.storage.current_cache[self.hero_1.cached_ui_info_key], 1)
         self.assertEqual(self.storage.current_cache[self.hero_2.cached_ui_info_key], 2)
 
+    def test_recache_bundle(self):
+        bundle_id = self.hero_1.actions.current_action.bundle_id
+
+        with mock.patch('dext.common.utils.cache.set_many') as set_many:
+            self.storage.recache_bundle(bundle_id)
+
+        self.assertEqual(self.storage.cache_queue, set())
+        self.assertEqual(list(set_many.call_args_list[0][0][0].keys()), [self.hero_1.cached_ui_info_key])
+        self.assertEqual(list(set_many.call_args_list[1][0][0].keys()), [heroes_objects.Hero.cached_ui_info_stamp_key_for_hero(self.account_1.id)])
+
+    def test_save_bundle_data__update_ui_info_stamps(self):
+        bundle_id = self.hero_1.actions.current_action.bundle_id
+
+        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data'):
+            with mock.patch('dext.common.utils.cache.set_many') as set_many:
+                self.storage.save_bundle_data(bundle_id)
+
+        self.assertEqual(self.storage.cache_queue, set())
+        self.assertEqual(list(set_many.call_args_list[0][0][0].keys()), [self.hero_1.cached_ui_info_key])
+        self.assertEqual(list(set_many.call_args_list[1][0][0].keys()), [heroes_objects.Hero.cached_ui_info_stamp_key_for_hero(self.account_1.id)])
+
     @mock.patch('the_tale.game.heroes.conf.heroes_settings.DUMP_CACHED_HEROES', True)
     def test_process_turn(self):
         self.assertEqual(self.storage.skipped_heroes, set())
         self.storage.process_turn()
         self.assertEqual(self.storage.skipped_heroes, set())
 
-        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data') as save_hero_data:
+        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_heroes_data') as save_heroes_data:
             self.storage.save_changed_data()
 
-        self.assertEqual(save_hero_data.call_count, 2)
+        self.assertEqual(len(save_heroes_data.call_args[0][0]), 2)
 
     @mock.patch('the_tale.game.heroes.conf.heroes_settings.DUMP_CACHED_HEROES', True)
     def test_process_turn__switch_caches(self):
@@ -319,10 +362,10 @@ class LogicStorageTests(testcase.TestCase):
         self.storage.process_turn()
         self.assertEqual(self.storage.skipped_heroes, set())
 
-        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data') as save_hero_data:
+        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_heroes_data') as save_heroes_data:
             self.storage.save_changed_data()
 
-        self.assertEqual(save_hero_data.call_count, 1) # save only game_settings.SAVED_UNCACHED_HEROES_FRACTION bundles number
+        self.assertEqual(len(save_heroes_data.call_args[0][0]), 1) # save only game_settings.SAVED_UNCACHED_HEROES_FRACTION bundles number
 
 
     def test_process_turn__process_created_action(self):
@@ -349,10 +392,10 @@ class LogicStorageTests(testcase.TestCase):
 
         self.assertEqual(action_process_turn.call_count, 1)
 
-        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data') as save_hero_data:
+        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_heroes_data') as save_heroes_data:
             self.storage.save_changed_data()
 
-        self.assertEqual(save_hero_data.call_count, 2)
+        self.assertEqual(len(save_heroes_data.call_args[0][0]), 2)
 
     @mock.patch('the_tale.game.heroes.conf.heroes_settings.DUMP_CACHED_HEROES', False)
     def test_process_turn_with_skipped_hero__without_cache_dump(self):
@@ -364,10 +407,10 @@ class LogicStorageTests(testcase.TestCase):
 
         self.assertEqual(action_process_turn.call_count, 1)
 
-        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data') as save_hero_data:
+        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_heroes_data') as save_heroes_data:
             self.storage.save_changed_data()
 
-        self.assertEqual(save_hero_data.call_count, 1)
+        self.assertEqual(len(save_heroes_data.call_args[0][0]), 1)
 
     @mock.patch('the_tale.game.heroes.objects.Hero.can_process_turn', lambda self, turn: True)
     def test_process_turn__can_process_turn(self):
@@ -418,12 +461,12 @@ class LogicStorageTests(testcase.TestCase):
 
         saved_heroes = set()
 
-        def save_hero_data(storage, hero_id, **kwargs):
-            saved_heroes.add(hero_id)
+        def save_heroes_data(storage, heroes_ids, **kwargs):
+            saved_heroes.update(heroes_ids)
 
         self.storage.ignored_bundles.add(hero_3.actions.current_action.bundle_id)
 
-        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data', save_hero_data):
+        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_heroes_data', save_heroes_data):
             self.storage._save_on_exception()
 
         self.assertEqual(saved_heroes, set([self.hero_2.id, hero_4.id]))
@@ -449,12 +492,12 @@ class LogicStorageTests(testcase.TestCase):
 
         self.hero_2.saved_at = datetime.datetime.now() - datetime.timedelta(seconds=conf.game_settings.SAVE_ON_EXCEPTION_TIMEOUT+1)
 
-        def save_hero_data(storage, hero_id, **kwargs):
-            saved_heroes.add(hero_id)
+        def save_heroes_data(storage, heroes_ids, **kwargs):
+            saved_heroes.update(heroes_ids)
 
         self.storage.ignored_bundles.add(hero_3.actions.current_action.bundle_id)
 
-        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data', save_hero_data):
+        with mock.patch('the_tale.game.logic_storage.LogicStorage._save_heroes_data', save_heroes_data):
             self.storage._save_on_exception()
 
         self.assertEqual(saved_heroes, set([self.hero_2.id]))
@@ -472,6 +515,21 @@ class LogicStorageTests(testcase.TestCase):
         self.assertEqual(ui_info.call_args_list, [mock.call(actual_guaranteed=True, old_info=None), mock.call(actual_guaranteed=True, old_info=None)])
 
 
+    @mock.patch('the_tale.game.heroes.conf.heroes_settings.UI_CACHING_COMPRESSION', True)
+    def test_save_changed_data__compressed_cache(self):
+        self.storage.process_turn()
+
+        with mock.patch('dext.common.utils.cache.set_many') as set_many:
+            self.storage.save_changed_data()
+
+        cached_data = set_many.call_args[0][0]
+
+        self.assertEqual(set(cached_data.keys()), {self.hero_1.cached_ui_info_key, self.hero_2.cached_ui_info_key})
+
+        for key, value in cached_data.items():
+            self.assertTrue(value.startswith(heroes_settings.UI_CACHING_COMPRESSION_TAG))
+            self.assertEqual(self.storage.current_cache[key]['id'], heroes_objects.Hero.decode_cached_ui_info(value)['id'])
+
     def test_old_info(self):
         self.storage.process_turn()
 
@@ -515,13 +573,13 @@ class LogicStorageTests(testcase.TestCase):
         self.assertEqual(len(self.storage.heroes), 2)
 
         with mock.patch('the_tale.game.logic_storage.LogicStorage._get_bundles_to_save', lambda x: [self.bundle_2_id]):
-            with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data') as save_hero_data:
+            with mock.patch('the_tale.game.logic_storage.LogicStorage._save_heroes_data') as save_heroes_data:
                 with mock.patch('the_tale.game.heroes.objects.Hero.ui_info', mock.Mock(return_value={})) as ui_info:
                     self.storage.save_changed_data()
 
         self.assertEqual(ui_info.call_count, 2) # cache all heroes, since they are new
         self.assertEqual(ui_info.call_args_list, [mock.call(actual_guaranteed=True, old_info=None), mock.call(actual_guaranteed=True, old_info=None)])
-        self.assertEqual(save_hero_data.call_args, mock.call(self.hero_2.id))
+        self.assertEqual(save_heroes_data.call_args, mock.call([self.hero_2.id]))
 
     def test_save_changed_data__with_unsaved_bundles__without_dump(self):
         self.storage.process_turn()
@@ -531,13 +589,13 @@ class LogicStorageTests(testcase.TestCase):
         self.hero_2.ui_caching_started_at = datetime.datetime.fromtimestamp(0)
 
         with mock.patch('the_tale.game.logic_storage.LogicStorage._get_bundles_to_save', lambda x: [self.bundle_2_id]):
-            with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data') as save_hero_data:
+            with mock.patch('the_tale.game.logic_storage.LogicStorage._save_heroes_data') as save_heroes_data:
                 with mock.patch('the_tale.game.heroes.objects.Hero.ui_info', mock.Mock(return_value={})) as ui_info:
                     self.storage.save_changed_data()
 
         self.assertEqual(ui_info.call_count, 1) # cache only first hero
         self.assertEqual(ui_info.call_args, mock.call(actual_guaranteed=True, old_info=None))
-        self.assertEqual(save_hero_data.call_args, mock.call(self.hero_2.id))
+        self.assertEqual(save_heroes_data.call_args, mock.call([self.hero_2.id]))
 
     def test_remove_action__from_middle(self):
         actions_prototypes.ActionRegenerateEnergyPrototype.create(hero=self.hero_1)
@@ -710,12 +768,12 @@ class LogicStorageTests(testcase.TestCase):
         self.storage.process_turn()
 
         with mock.patch('dext.common.utils.cache.set_many') as set_many:
-            with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data') as save_hero_data:
+            with mock.patch('the_tale.game.logic_storage.LogicStorage._save_heroes_data') as save_heroes_data:
                 with mock.patch('the_tale.game.heroes.objects.Hero.ui_info') as ui_info:
                     self.storage.save_changed_data()
 
         self.assertEqual(set_many.call_count, 1)
-        self.assertEqual(save_hero_data.call_count, 3)
+        self.assertEqual(len(save_heroes_data.call_args[0][0]), 3)
         self.assertEqual(ui_info.call_count, 2)
         self.assertEqual(ui_info.call_args_list, [mock.call(actual_guaranteed=True, old_info=None), mock.call(actual_guaranteed=True, old_info=None)])
 
@@ -748,12 +806,12 @@ class LogicStorageTests(testcase.TestCase):
         self.storage.process_turn()
 
         with mock.patch('dext.common.utils.cache.set_many') as set_many:
-            with mock.patch('the_tale.game.logic_storage.LogicStorage._save_hero_data') as save_hero_data:
+            with mock.patch('the_tale.game.logic_storage.LogicStorage._save_heroes_data') as save_heroes_data:
                 with mock.patch('the_tale.game.heroes.objects.Hero.ui_info') as ui_info:
                     self.storage.save_changed_data()
 
         self.assertEqual(set_many.call_count, 1)
-        self.assertEqual(save_hero_data.call_count, 2)
+        self.assertEqual(len(save_heroes_data.call_args[0][0]), 2)
         self.assertEqual(ui_info.call_count, 1)
         self.assertEqual(ui_info.call_args, mock.call(actual_guaranteed=True, old_info=None))
 
@@ -103,8 +103,20 @@ class LogicWorkerTests(testcase.TestCase):
 
     def test_stop(self):
         with mock.patch('the_tale.game.logic_storage.LogicStorage.save_all') as save_all:
-            self.worker.process_stop()
+            with mock.patch('the_tale.game.workers.highlevel.Worker.cmd_flush_power_changes') as cmd_flush_power_changes:
+                self.worker.process_stop()
         self.assertEqual(save_all.call_count, 1)
+        self.assertEqual(cmd_flush_power_changes.call_count, 1)
+
+    def test_process_next_turn__flush_power_changes(self):
+        current_time = TimePrototype.get_current_time()
+        current_time.increment_turn()
+        current_time.save()
+
+        with mock.patch('the_tale.game.workers.highlevel.Worker.cmd_flush_power_changes') as cmd_flush_power_changes:
+            self.worker.process_next_turn(current_time.turn_number)
+
+        self.assertEqual(cmd_flush_power_changes.call_count, 1)
 
 
     def test_release_account(self):
@@ -157,6 +157,36 @@ class PoliticPowerTest(testcase.TestCase):
         self.assertEqual(self.power._inner_negative_heroes, frozenset((4, 5)))
 
 
+    def test_version(self):
+        with self.check_changed(politic_power.PoliticPower.version):
+            self.power.inner_power += 1
+
+        with self.check_changed(politic_power.PoliticPower.version):
+            self.power.outer_power = 10
+
+        with self.check_changed(politic_power.PoliticPower.version):
+            self.power.change_power(owner=self.owner, hero_id=None, has_in_preferences=False, power=1)
+
+    def test_power_fractions(self):
+        self.power.inner_power = 100  # -> 500
+        self.power.outer_power = -200 # -> 0
+
+        power_2 = FakePoliticPower.create()
+        power_2.inner_power = -400 # -> 0
+        power_2.outer_power = 200  # -> 400
+
+        fractions = politic_power.PowerFractions([self.power, power_2])
+
+        self.assertEqual(fractions.inner_minimum, -400)
+        self.assertEqual(fractions.outer_minimum, -200)
+        self.assertEqual(fractions.inner(self.power), 1)
+        self.assertEqual(fractions.outer(power_2), 1)
+        self.assertEqual(fractions.total(self.power), 0.5)
+
+    def test_power_fractions__no_powers(self):
+        fractions = politic_power.PowerFractions([])
+        self.assertEqual(fractions.total(self.power), 0)
+
     def test_total_politic_power_fraction(self):
         self.power.inner_power = 100
         self.power.outer_power = 200
@@ -1,4 +1,5 @@
 # coding: utf-8
+import copy
 import time
 import datetime
 
@@ -21,6 +22,7 @@ from the_tale.game.pvp.tests.helpers import PvPTestsMixin
 from the_tale.cms.news import logic as news_logic
 
 from the_tale.game.heroes import logic as heroes_logic
+from the_tale.game.heroes import objects as heroes_objects
 from the_tale.game.heroes import messages as heroes_messages
 
 from the_tale.game.prototypes import TimePrototype
@@ -54,6 +56,16 @@ class GamePageRequestTests(RequestTestsBase):
         response = self.client.get(reverse('game:'))
         self.assertEqual(response.status_code, 200)
 
+    def test_game_page__turn_updates_turned_off(self):
+        self.check_html_ok(self.request_html(reverse('game:')), texts=[('turnUpdatesUrl', 0),
+                                                                      ('updater.SetRefreshInterval', 1)])
+
+    @mock.patch('the_tale.game.conf.game_settings.TURN_UPDATES_WAIT_URL', '/turn-updates/wait')
+    def test_game_page__turn_updates(self):
+        self.check_html_ok(self.request_html(reverse('game:')), texts=['turnUpdatesUrl: "/turn-updates/wait"',
+                                                                      'turnUpdatesAccountId: %d' % self.account_1.id,
+                                                                      ('updater.SetRefreshInterval', 0)])
+
     def test_game_page_when_pvp_in_queue(self):
         self.pvp_create_battle(self.account_1, self.account_2)
         self.pvp_create_battle(self.account_2, self.account_1)
@@ -121,6 +133,118 @@ class InfoRequestTests(RequestTestsBase):
 
 
 
+@mock.patch('the_tale.game.conf.game_settings.INFO_CACHING_ENABLED', True)
+class InfoRequestCachingTests(RequestTestsBase):
+
+    def setUp(self):
+        super(InfoRequestCachingTests, self).setUp()
+
+        self.cache = {}
+
+        # cache stores copies of values, as real one does
+        self.cache_get_patcher = mock.patch('dext.common.utils.cache.get', lambda key: copy.deepcopy(self.cache.get(key)))
+        self.cache_set_patcher = mock.patch('dext.common.utils.cache.set', lambda key, value, timeout: self.cache.__setitem__(key, copy.deepcopy(value)))
+
+        self.fill_diary_versions_patcher = mock.patch('the_tale.game.logic.fill_diary_versions', lambda data: data)
+
+        self.cache_get_patcher.start()
+        self.cache_set_patcher.start()
+        self.fill_diary_versions_patcher.start()
+
+    def tearDown(self):
+        self.fill_diary_versions_patcher.stop()
+        self.cache_set_patcher.stop()
+        self.cache_get_patcher.stop()
+        super(InfoRequestCachingTests, self).tearDown()
+
+    def request_info(self, url, data=None):
+        if data is None:
+            data = {'account': {'is_old': False}, 'enemy': None}
+
+        with mock.patch('the_tale.game.logic.form_game_info', mock.Mock(return_value=data)) as form_game_info:
+            self.check_ajax_ok(self.client.get(url))
+
+        return form_game_info.call_count
+
+    def test_same_turn(self):
+        self.assertEqual(self.request_info(self.game_info_url_1), 1)
+        self.assertEqual(self.request_info(self.game_info_url_1), 0)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_cached_content(self):
+        self.request_info(self.game_info_url_1, data={'account': {'is_old': False}, 'enemy': None, 'turn': 666})
+
+        response = self.client.get(self.game_info_url_1)
+
+        self.assertEqual(s11n.from_json(response.content.decode('utf-8'))['data']['turn'], 666)
+
+    def test_diary_versions_not_cached(self):
+        def fill_diary_versions(data):
+            data['account']['hero']['diary'] = fill_diary_versions.version
+            return data
+
+        data = {'account': {'id': self.account_1.id, 'is_old': False, 'hero': {'diary': None}}, 'enemy': None}
+
+        with mock.patch('the_tale.game.logic.fill_diary_versions', fill_diary_versions):
+            fill_diary_versions.version = 1
+            self.assertEqual(self.request_info(self.game_info_url_1, data=data), 1)
+
+            fill_diary_versions.version = 2
+            response = self.client.get(self.game_info_url_1)
+
+        self.assertEqual(s11n.from_json(response.content.decode('utf-8'))['data']['account']['hero']['diary'], 2)
+
+        self.assertEqual([cached_data['account']['hero']['diary'] for cached_data in self.cache.values()], [None])
+
+    def test_new_turn(self):
+        self.assertEqual(self.request_info(self.game_info_url_1), 1)
+
+        TimePrototype.get_current_time().increment_turn()
+
+        self.assertEqual(self.request_info(self.game_info_url_1), 1)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_hero_recached_in_middle_of_turn(self):
+        self.assertEqual(self.request_info(self.game_info_url_1), 1)
+
+        self.cache[heroes_objects.Hero.cached_ui_info_stamp_key_for_hero(self.account_1.id)] = '666.0'
+
+        self.assertEqual(self.request_info(self.game_info_url_1), 1)
+        self.assertEqual(self.request_info(self.game_info_url_1), 0)
+
+    def test_old_info_not_cached(self):
+        self.assertEqual(self.request_info(self.game_info_url_1, data={'account': {'is_old': True}, 'enemy': None}), 1)
+        self.assertEqual(self.request_info(self.game_info_url_1, data={'account': {'is_old': True}, 'enemy': None}), 1)
+
+        self.assertEqual(self.request_info(self.game_info_url_1, data={'account': {'is_old': False}, 'enemy': {'is_old': True}}), 1)
+        self.assertEqual(self.request_info(self.game_info_url_1, data={'account': {'is_old': False}, 'enemy': {'is_old': True}}), 1)
+
+        self.assertEqual(self.cache, {})
+
+    def test_different_requests(self):
+        self.assertEqual(self.request_info(self.game_info_url_1), 1)
+        self.assertEqual(self.request_info(self.game_info_url_2), 1)
+        self.assertEqual(self.request_info(self.game_info_url_no_id), 0)
+        self.assertEqual(self.request_info(game_info_url(account_id=self.account_1.id, client_turns=[1, 2])), 1)
+        self.assertEqual(self.request_info(game_info_url(account_id=self.account_1.id, client_turns=[2, 1])), 0)
+        self.assertEqual(self.request_info(self.game_info_url_1.replace('api_version=1.7', 'api_version=1.6')), 1)
+
+        self.request_login(self.account_2.email)
+
+        self.assertEqual(self.request_info(self.game_info_url_2), 1)
+
+        self.request_logout()
+
+        self.assertEqual(self.request_info(self.game_info_url_no_id), 1)
+        self.assertEqual(self.request_info(self.game_info_url_no_id), 0)
+
+    @mock.patch('the_tale.game.conf.game_settings.INFO_CACHING_ENABLED', False)
+    def test_caching_disabled(self):
+        self.assertEqual(self.request_info(self.game_info_url_1), 1)
+        self.assertEqual(self.request_info(self.game_info_url_1), 1)
+        self.assertEqual(self.cache, {})
+
+
 class NewsAlertsTests(TestCase):
 
     def setUp(self):
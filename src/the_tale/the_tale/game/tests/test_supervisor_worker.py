@@ -16,7 +16,7 @@ from the_tale.game import exceptions
 from the_tale.game.pvp.prototypes import Battle1x1Prototype
 
 
-@mock.patch('the_tale.game.workers.supervisor.Worker.wait_answers_from', lambda self, name, workers: None)
+@mock.patch('the_tale.game.workers.supervisor.Worker.wait_answers_from', lambda self, name, workers, timeout=None: None)
 class SupervisorWorkerTests(testcase.TestCase):
 
     def setUp(self):
@@ -59,6 +59,32 @@ class SupervisorWorkerTests(testcase.TestCase):
         self.assertFalse(self.worker.wait_next_turn_answer)
         self.assertTrue(GameState.is_working())
 
+    @mock.patch('the_tale.game.conf.game_settings.LOGIC_WORKERS_NUMBER', 3)
+    def test_initialization__logic_workers_number(self):
+        environment.deinitialize()
+        environment.initialize()
+
+        self.worker = environment.workers.supervisor
+        self.worker.logger = mock.Mock()
+
+        self.worker.initialize()
+
+        self.assertEqual(set(self.worker.logic_workers.keys()), {'logic_1', 'logic_2', 'logic_3'})
+        self.assertEqual(self.worker.logic_accounts_number, {'logic_1': 1, 'logic_2': 1, 'logic_3': 0})
+
+    def test_initialization__logic_timeout(self):
+        from dext.common.amqp_queues import exceptions as amqp_exceptions
+
+        def wait_answers_from(worker, code, workers=(), timeout=60.0):
+            raise amqp_exceptions.WaitAnswerTimeoutError(code=code, workers=workers, timeout=timeout)
+
+        with mock.patch('the_tale.game.workers.supervisor.Worker.wait_answers_from', wait_answers_from):
+            with mock.patch('the_tale.game.workers.logic.Worker.cmd_stop') as logic_cmd_stop:
+                self.assertRaises(amqp_exceptions.WaitAnswerTimeoutError, self.worker.initialize)
+
+        self.assertEqual(logic_cmd_stop.call_count, 2)
+        self.assertFalse(GameState.is_working())
+
     def test_register_task(self):
         self.worker.initialize()
 
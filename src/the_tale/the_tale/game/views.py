@@ -1,5 +1,6 @@
 # coding: utf-8
 
+from dext.common.utils import cache
 from dext.common.utils import views as dext_views
 from dext.common.utils.urls import url
 
@@ -19,6 +20,7 @@ from the_tale.game.map.conf import map_settings
 from the_tale.game.map.storage import map_info_storage
 
 from the_tale.game.conf import game_settings
+from the_tale.game.prototypes import TimePrototype
 from the_tale.game.pvp.prototypes import Battle1x1Prototype
 from the_tale.game import logic as game_logic
 
@@ -319,8 +321,24 @@ def api_info(context):
     if account is None and context.account.is_authenticated:
         account = context.account
 
+    is_own = False if account is None else (context.account.id == account.id)
+
+    cache_key = None
+
+    if game_settings.INFO_CACHING_ENABLED:
+        cache_key = game_logic.game_info_cache_key(account_id=None if account is None else account.id,
+                                                   turn_number=TimePrototype.get_current_turn_number(),
+                                                   api_version=context.api_version,
+                                                   is_own=is_own,
+                                                   client_turns=context.client_turns)
+
+        data = cache.get(cache_key)
+
+        if data is not None:
+            return dext_views.AjaxOk(content=_fill_diary_versions(data, context.api_version))
+
     data = game_logic.form_game_info(account=account,
-                                     is_own=False if account is None else (context.account.id == account.id),
+                                     is_own=is_own,
                                      client_turns=context.client_turns)
 
     if context.api_version in ('1.6', '1.5', '1.4', '1.3', '1.2', '1.1', '1.0'):
@@ -344,7 +362,19 @@ def api_info(context):
     if context.api_version == '1.0':
         data = game_logic.game_info_from_1_1_to_1_0(data)
 
-    return dext_views.AjaxOk(content=data)
+    # diary versions are not cached: diary messages of turn can reach tt_diary after response is cached
+    if cache_key is not None and game_logic.is_game_info_cacheable(data):
+        cache.set(cache_key, data, game_settings.INFO_CACHING_TIMEOUT)
+
+    return dext_views.AjaxOk(content=_fill_diary_versions(data, context.api_version))
+
+
+def _fill_diary_versions(data, api_version):
+    # before 1.6 api version diary is passed as list of messages
+    if api_version in ('1.5', '1.4', '1.3', '1.2', '1.1', '1.0'):
+        return data
+
+    return game_logic.fill_diary_versions(data)
 
 
 @api.Processor(versions=(game_settings.DIARY_API_VERSION,))
@@ -5,6 +5,7 @@ from django.db import transaction
 from the_tale.amqp_environment import environment
 
 from the_tale.common.utils.workers import BaseWorker
+from the_tale.common.utils.decorators import lazy_property
 from the_tale.common.postponed_tasks.prototypes import PostponedTaskPrototype
 
 from the_tale.game.balance import constants as c
@@ -61,6 +62,26 @@ class PowerInfo(object):
         return not self.__eq__(other)
 
 
+class PowerChanges(object):
+    __slots__ = ('_changes',)
+
+    def __init__(self):
+        self._changes = {}
+
+    def add(self, hero_id, has_place_in_preferences, has_person_in_preferences, person_id, place_id, power_delta):
+        # positive and negative changes are not merged, since they go to different parts of job power
+        key = (hero_id, has_place_in_preferences, has_person_in_preferences, person_id, place_id, power_delta > 0)
+        self._changes[key] = self._changes.get(key, 0) + power_delta
+
+    def __len__(self):
+        return len(self._changes)
+
+    def pop_all(self):
+        changes = [[hero_id, has_place_in_preferences, has_person_in_preferences, person_id, place_id, power_delta]
+                   for (hero_id, has_place_in_preferences, has_person_in_preferences, person_id, place_id, is_positive), power_delta in self._changes.items()]
+        self._changes = {}
+        return changes
+
 
 
 class Worker(BaseWorker):
@@ -117,6 +138,9 @@ class Worker(BaseWorker):
             self.sync_data(sheduled=sync_data_sheduled)
             self.update_map()
 
+        # changes made by bills and other highlevel operations
+        self.cmd_flush_power_changes()
+
     def update_map(self):
         self.logger.info('initialize map update')
         environment.workers.game_long_commands.cmd_update_map()
@@ -258,13 +282,33 @@ class Worker(BaseWorker):
                         power_bad + (power_delta if power_delta < 0 else 0))
 
 
+    @lazy_property
+    def power_changes(self):
+        return PowerChanges()
+
     def cmd_change_power(self, hero_id, has_place_in_preferences, has_person_in_preferences, person_id, place_id, power_delta):
-        self.send_cmd('change_power', {'hero_id': hero_id,
-                                       'has_place_in_preferences': has_place_in_preferences,
-                                       'has_person_in_preferences': has_person_in_preferences,
-                                       'person_id': person_id,
-                                       'place_id': place_id,
-                                       'power_delta': power_delta})
+        # changes are accumulated in sender process and sent by cmd_flush_power_changes
+        self.power_changes.add(hero_id=hero_id,
+                               has_place_in_preferences=has_place_in_preferences,
+                               has_person_in_preferences=has_person_in_preferences,
+                               person_id=person_id,
+                               place_id=place_id,
+                               power_delta=power_delta)
+
+    def cmd_flush_power_changes(self):
+        if not self.power_changes:
+            return
+
+        self.send_cmd('change_power_batch', {'changes': self.power_changes.pop_all()})
+
+    def process_change_power_batch(self, changes):
+        for hero_id, has_place_in_preferences, has_person_in_preferences, person_id, place_id, power_delta in changes:
+            self.process_change_power(hero_id=hero_id,
+                                      has_place_in_preferences=has_place_in_preferences,
+                                      has_person_in_preferences=has_person_in_preferences,
+                                      person_id=person_id,
+                                      place_id=place_id,
+                                      power_delta=power_delta)
 
     def process_change_power(self, hero_id, has_place_in_preferences, has_person_in_preferences, person_id, place_id, power_delta):
         power_info = PowerInfo(hero_id=hero_id,
@@ -288,3 +332,5 @@ class Worker(BaseWorker):
         task = PostponedTaskPrototype.get_by_id(task_id)
         task.process(self.logger, highlevel=self)
         task.do_postsave_actions()
+
+        self.cmd_flush_power_changes()
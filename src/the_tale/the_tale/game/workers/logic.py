@@ -9,6 +9,8 @@ from the_tale.amqp_environment import environment
 from the_tale.common.utils import workers
 from the_tale.common.postponed_tasks.prototypes import PostponedTaskPrototype
 
+from the_tale.accounts.achievements.storage import achievements_storage
+
 from the_tale.game.prototypes import TimePrototype
 from the_tale.game.logic_storage import LogicStorage
 from the_tale.game.conf import game_settings
@@ -64,8 +66,11 @@ class Worker(workers.BaseWorker):
             raise LogicException('dessinchonization: workers turn number (%d) not equal to saved turn number (%d)' % (self.turn_number,
                                                                                                                       TimePrototype.get_current_turn_number()))
 
-        self.storage.process_turn(logger=self.logger)
-        self.storage.save_changed_data(logger=self.logger)
+        with achievements_storage.postpone_giving():
+            self.storage.process_turn(logger=self.logger)
+            self.storage.save_changed_data(logger=self.logger)
+
+        self.flush_power_changes()
 
         for hero_id in self.storage.skipped_heroes:
             hero = self.storage.heroes[hero_id]
@@ -80,6 +85,10 @@ class Worker(workers.BaseWorker):
             gc.collect()
             self.logger.info('GC: end')
 
+    def flush_power_changes(self):
+        if environment.workers.highlevel is not None:
+            environment.workers.highlevel.cmd_flush_power_changes()
+
     def release_account(self, account_id):
         if account_id not in self.storage.accounts_to_heroes:
             environment.workers.supervisor.cmd_account_released(account_id)
@@ -105,6 +114,7 @@ class Worker(workers.BaseWorker):
         # no need to save data, since they automaticaly saved on every turn
         self.initialized = False
         self.storage.save_all(logger=self.logger)
+        self.flush_power_changes()
         environment.workers.supervisor.cmd_answer('stop', self.worker_id)
         self.stop_required = True
         self.logger.info('LOGIC STOPPED')
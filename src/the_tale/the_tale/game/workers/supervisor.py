@@ -49,11 +49,22 @@ class Worker(BaseWorker):
 
         PostponedTaskPrototype.reset_all()
 
-        self.logic_workers = {worker.name: worker for worker in (environment.workers.logic_1, environment.workers.logic_2)}
+        self.logic_workers = {worker.name: worker for worker in environment.logic_workers()}
 
         self.logger.info('initialize logic')
 
-        self.logic_multicast('initialize', arguments=dict(turn_number=self.time.turn_number), worker_id=True, wait_answer=True)
+        self.logic_multicast('initialize', arguments=dict(turn_number=self.time.turn_number), worker_id=True)
+
+        try:
+            # logic worker, which is not started, never answers (if number of workers in settings and in deploy differ)
+            self.wait_answers_from('initialize',
+                                   workers=list(self.logic_workers.keys()),
+                                   timeout=conf.game_settings.INITIALIZE_WAIT_LOGIC_TIMEOUT)
+        except amqp_exceptions.WaitAnswerTimeoutError:
+            self.logger.error('initialization timeout while getting answer from logic workers %r, '
+                              'check that GAME_LOGIC_WORKERS_NUMBER equals to number of started logic workers' % sorted(self.logic_workers.keys()))
+            self._force_stop()
+            raise
 
         if conf.game_settings.ENABLE_WORKER_HIGHLEVEL:
             self.logger.info('initialize highlevel')
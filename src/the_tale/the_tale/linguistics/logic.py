@@ -2,7 +2,6 @@
 import re
 import sys
 import logging
-import itertools
 import collections
 
 from django.db import models as django_models
@@ -21,6 +20,7 @@ from the_tale.linguistics import prototypes
 
 from the_tale.linguistics.lexicon import keys
 from the_tale.linguistics.lexicon.relations import VARIABLE
+from the_tale.linguistics.lexicon.relations import VARIABLE_TYPE
 from the_tale.linguistics.lexicon.groups import relations as groups_relations
 
 from the_tale.linguistics.storage import game_dictionary
@@ -53,26 +53,92 @@ def get_templates_count():
     return groups_count, keys_count
 
 
-def get_word_restrictions(external, word_form):
+def get_word_restrictions_ids(word_form):
     if utg_relations.NUMBER in word_form.word.type.properties:
         if word_form.word.properties.is_specified(utg_relations.NUMBER):
             if word_form.word.properties.get(utg_relations.NUMBER).is_SINGULAR:
-                return ((external, restrictions_storage.get_restriction(relations.TEMPLATE_RESTRICTION_GROUP.PLURAL_FORM, relations.WORD_HAS_PLURAL_FORM.HAS_NO.value).id), )
+                return (restrictions_storage.get_restriction(relations.TEMPLATE_RESTRICTION_GROUP.PLURAL_FORM, relations.WORD_HAS_PLURAL_FORM.HAS_NO.value).id, )
+
+    return (restrictions_storage.get_restriction(relations.TEMPLATE_RESTRICTION_GROUP.PLURAL_FORM, relations.WORD_HAS_PLURAL_FORM.HAS.value).id, )
+
+
+def get_word_restrictions(external, word_form):
+    return tuple((external, restriction_id) for restriction_id in get_word_restrictions_ids(word_form))
+
+
+def construct_external(variable_type, value):
+    word_form, variable_restrictions = variable_type.constructor(value)
+    return word_form, tuple(variable_restrictions) + get_word_restrictions_ids(word_form)
+
+
+class ExternalsCache(object):
+    '''
+    word forms and restrictions of externals, which do not change during turn (places, persons, etc.)
+    cache is cleared on every new turn (and on restrictions changes), so changes of objects will be used from next turn
+    '''
+    STABLE_TYPES = frozenset((VARIABLE_TYPE.PLACE,
+                              VARIABLE_TYPE.PERSON,
+                              VARIABLE_TYPE.MODIFIER,
+                              VARIABLE_TYPE.RACE))
+
+    __slots__ = ('turn_number', 'restrictions_version', 'data')
+
+    def __init__(self):
+        self.turn_number = None
+        self.restrictions_version = None
+        self.data = {}
 
-    return ((external, restrictions_storage.get_restriction(relations.TEMPLATE_RESTRICTION_GROUP.PLURAL_FORM, relations.WORD_HAS_PLURAL_FORM.HAS.value).id), )
+    def sync(self, turn_number):
+        restrictions_storage.sync()
+
+        if self.turn_number != turn_number or self.restrictions_version != restrictions_storage.version:
+            self.turn_number = turn_number
+            self.restrictions_version = restrictions_storage.version
+            self.data = {}
+
+    def get(self, variable_type, value):
+        if variable_type not in self.STABLE_TYPES:
+            return construct_external(variable_type, value)
+
+        # objects are compared by identity, value is stored to prevent reusing of its id
+        key = (variable_type, id(value))
+
+        cached = self.data.get(key)
+
+        if cached is None or cached[0] is not value:
+            cached = (value,) + construct_external(variable_type, value)
+            self.data[key] = cached
+
+        return cached[1], cached[2]
+
+    def get_date(self):
+        from the_tale.game.prototypes import TimePrototype
+
+        if 'date' not in self.data:
+            self.data['date'] = construct_external(VARIABLE.DATE.type, TimePrototype(turn_number=self.turn_number).game_time)
+
+        return self.data['date']
+
+
+externals_cache = ExternalsCache()
 
 
 def _process_arguments(args):
     from the_tale.game.prototypes import TimePrototype
 
+    externals_cache.sync(TimePrototype.get_current_turn_number())
+
     externals = {}
     restrictions = set()
 
-    for k, v in itertools.chain(args.items(), ((VARIABLE.DATE.value, TimePrototype.get_current_time().game_time),)):
-        word_form, variable_restrictions = VARIABLE(k).type.constructor(v)
+    for k, v in args.items():
+        word_form, restrictions_ids = externals_cache.get(VARIABLE(k).type, v)
         externals[k] = word_form
-        restrictions.update((k, restriction_id) for restriction_id in variable_restrictions)
-        restrictions.update(get_word_restrictions(k, word_form))
+        restrictions.update((k, restriction_id) for restriction_id in restrictions_ids)
+
+    word_form, restrictions_ids = externals_cache.get_date()
+    externals[VARIABLE.DATE.value] = word_form
+    restrictions.update((VARIABLE.DATE.value, restriction_id) for restriction_id in restrictions_ids)
 
     return externals, frozenset(restrictions)
 
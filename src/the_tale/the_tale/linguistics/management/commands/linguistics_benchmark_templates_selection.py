@@ -0,0 +1,60 @@
+# coding: utf-8
+import time
+import random
+
+from django.core.management.base import BaseCommand
+
+from utg import lexicon as utg_lexicon
+from utg import exceptions as utg_exceptions
+
+from ... import storage
+
+
+class Command(BaseCommand):
+
+    help = 'compare templates selection speed of game lexicon and plain utg lexicon on in-game templates'
+
+    def add_arguments(self, parser):
+        super(Command, self).add_arguments(parser)
+        parser.add_argument('-n', '--number', action='store', type=int, dest='number', default=100000, help='how many templates must be selected')
+        parser.add_argument('-s', '--seed', action='store', type=int, dest='seed', default=0, help='random seed for requests generation')
+
+    def handle(self, *args, **options):
+        game_lexicon = storage.game_lexicon.item
+
+        plain_lexicon = utg_lexicon.Lexicon()
+
+        for template_id in sorted(storage.game_lexicon._templates_cache):
+            updated_at, key, template, restrictions = storage.game_lexicon._templates_cache[template_id]
+            plain_lexicon.add_template(key, template, restrictions=restrictions)
+
+        used_restrictions = sorted(game_lexicon._used_restrictions.items(), key=lambda item: item[0].value)
+
+        if not used_restrictions:
+            print('no templates in game lexicon')
+            return
+
+        randomizer = random.Random(options['seed'])
+
+        requests = []
+
+        for i in range(options['number']):
+            key, restrictions = randomizer.choice(used_restrictions)
+            restrictions = sorted(restrictions)
+            requests.append((key, frozenset(randomizer.sample(restrictions, randomizer.randint(0, len(restrictions))))))
+
+        print('keys: %d, templates: %d, requests: %d' % (len(used_restrictions), len(storage.game_lexicon._templates_cache), len(requests)))
+
+        for name, lexicon in (('utg lexicon', plain_lexicon),
+                              ('game lexicon', game_lexicon)):
+            errors = 0
+
+            started_at = time.time()
+
+            for key, restrictions in requests:
+                try:
+                    lexicon.get_random_template(key, restrictions=restrictions)
+                except utg_exceptions.UtgError:
+                    errors += 1
+
+            print('%s: %.3f seconds, %d without templates' % (name, time.time() - started_at, errors))
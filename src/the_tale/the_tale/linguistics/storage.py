@@ -19,10 +19,34 @@ from the_tale.linguistics import objects
 from the_tale.linguistics import models
 
 
+def changed_rows(query, cache):
+    '''
+    returns (actual_ids, changed_query)
+    changed_query selects rows, which are absent in cache or updated after caching
+    cache: {id: (updated_at, ...)}
+    '''
+    actual = dict(query.values_list('id', 'updated_at'))
+
+    changed_ids = [row_id for row_id, updated_at in actual.items()
+                   if row_id not in cache or cache[row_id][0] != updated_at]
+
+    if not changed_ids:
+        return actual, query.none()
+
+    if len(changed_ids) == len(actual):
+        return actual, query
+
+    return actual, query.filter(id__in=changed_ids)
+
+
 class BaseGameDictionaryStorage(storage.SingleStorage):
     SETTINGS_KEY = None
     EXCEPTION = exceptions.DictionaryStorageError
 
+    # deserialized words are cached between refreshes: {word_id: (updated_at, word)}
+    # only new or changed words are loaded from database
+    _words_cache = None
+
     def _words_query(self):
         raise NotImplementedError()
 
@@ -32,9 +56,18 @@ class BaseGameDictionaryStorage(storage.SingleStorage):
     def refresh(self):
         self.clear()
 
-        for forms in self._words_query().iterator():
-            word = utg_words.Word.deserialize(s11n.from_json(forms))
-            self._item.add_word(word)
+        if self._words_cache is None:
+            self._words_cache = {}
+
+        actual, changed_query = changed_rows(self._words_query(), self._words_cache)
+
+        for word_id, updated_at, forms in changed_query.values_list('id', 'updated_at', 'forms').iterator():
+            self._words_cache[word_id] = (updated_at, utg_words.Word.deserialize(s11n.from_json(forms)))
+
+        self._words_cache = {word_id: self._words_cache[word_id] for word_id in actual if word_id in self._words_cache}
+
+        for word_id in sorted(self._words_cache):
+            self._item.add_word(self._words_cache[word_id][1])
 
         self._version = settings.get(self.SETTINGS_KEY)
 
@@ -46,29 +79,74 @@ class GameDictionaryStorage(BaseGameDictionaryStorage):
     SETTINGS_KEY = 'game dictionary change time'
 
     def _words_query(self):
-        return prototypes.WordPrototype._db_filter(state=relations.WORD_STATE.IN_GAME).values_list('forms', flat=True)
+        return prototypes.WordPrototype._db_filter(state=relations.WORD_STATE.IN_GAME)
+
+
+class GameLexicon(utg_lexicon.Lexicon):
+    '''
+    lexicon with index for templates selection
+
+    only restrictions, used by templates of key, affect selection,
+    so candidates are memoized by (key, requested restrictions & used restrictions)
+    '''
+    __slots__ = ('_used_restrictions', '_candidates')
+
+    def __init__(self):
+        super(GameLexicon, self).__init__()
+        self._used_restrictions = {}
+        self._candidates = {}
+
+    def add_template(self, key, template, restrictions=frozenset()):
+        super(GameLexicon, self).add_template(key, template, restrictions=restrictions)
+        self._used_restrictions[key] = self._used_restrictions.get(key, frozenset()) | restrictions
+        self._candidates.clear()
+
+    def get_templates(self, key, restrictions):
+        signature = self._used_restrictions.get(key, frozenset()).intersection(restrictions)
+
+        candidates = self._candidates.get((key, signature))
+
+        if candidates is None:
+            candidates = super(GameLexicon, self).get_templates(key, signature)
+            self._candidates[(key, signature)] = candidates
+
+        return candidates
 
 
 class GameLexiconDictionaryStorage(storage.SingleStorage):
     SETTINGS_KEY = 'game lexicon change time'
     EXCEPTION = exceptions.LexiconStorageError
 
+    # {template_id: (updated_at, key, template, restrictions)}, see BaseGameDictionaryStorage._words_cache
+    _templates_cache = None
+
     def _templates_query(self):
         return prototypes.TemplatePrototype._db_filter(state=relations.TEMPLATE_STATE.IN_GAME,
-                                                       errors_status=relations.TEMPLATE_ERRORS_STATUS.NO_ERRORS).values_list('key', 'data')
+                                                       errors_status=relations.TEMPLATE_ERRORS_STATUS.NO_ERRORS)
 
     def _construct_zero_item(self):
-        return utg_lexicon.Lexicon()
+        return GameLexicon()
 
     def refresh(self):
         from the_tale.linguistics.lexicon.keys import LEXICON_KEY
 
         self.clear()
 
-        for key, data in self._templates_query().iterator():
+        if self._templates_cache is None:
+            self._templates_cache = {}
+
+        actual, changed_query = changed_rows(self._templates_query(), self._templates_cache)
+
+        for template_id, updated_at, key, data in changed_query.values_list('id', 'updated_at', 'key', 'data').iterator():
             data = s11n.from_json(data)
             template = utg_templates.Template.deserialize(data['template'])
-            restrictions = frozenset(tuple(key) for key in data.get('restrictions', ()))
+            restrictions = frozenset(tuple(restriction) for restriction in data.get('restrictions', ()))
+            self._templates_cache[template_id] = (updated_at, key, template, restrictions)
+
+        self._templates_cache = {template_id: self._templates_cache[template_id] for template_id in actual if template_id in self._templates_cache}
+
+        for template_id in sorted(self._templates_cache):
+            updated_at, key, template, restrictions = self._templates_cache[template_id]
             self._item.add_template(key, template, restrictions=restrictions)
 
         self._version = settings.get(self.SETTINGS_KEY)
@@ -508,6 +508,46 @@ class LogicTests(testcase.TestCase):
                          logic.fake_text(key.name, logic.prepair_get_text(key.name, args)[1]))
 
 
+    def test_externals_cache__stable_externals(self):
+        place_1, place_2, place_3 = create_test_map()
+
+        cache = logic.ExternalsCache()
+        cache.sync(turn_number=1)
+
+        with mock.patch('the_tale.linguistics.logic.construct_external', wraps=logic.construct_external) as construct_external:
+            self.assertEqual(cache.get(logic.VARIABLE_TYPE.PLACE, place_1), cache.get(logic.VARIABLE_TYPE.PLACE, place_1))
+            cache.get(logic.VARIABLE_TYPE.PLACE, place_2)
+
+        self.assertEqual(construct_external.call_count, 2)
+        self.assertEqual(cache.get(logic.VARIABLE_TYPE.PLACE, place_1), logic.construct_external(logic.VARIABLE_TYPE.PLACE, place_1))
+
+    def test_externals_cache__not_stable_externals(self):
+        cache = logic.ExternalsCache()
+        cache.sync(turn_number=1)
+
+        with mock.patch('the_tale.linguistics.logic.construct_external', wraps=logic.construct_external) as construct_external:
+            cache.get(logic.VARIABLE_TYPE.NUMBER, 1)
+            cache.get(logic.VARIABLE_TYPE.NUMBER, 1)
+
+        self.assertEqual(construct_external.call_count, 2)
+
+    def test_externals_cache__new_turn(self):
+        place_1, place_2, place_3 = create_test_map()
+
+        cache = logic.ExternalsCache()
+        cache.sync(turn_number=1)
+
+        cache.get(logic.VARIABLE_TYPE.PLACE, place_1)
+        date_1 = cache.get_date()
+
+        cache.sync(turn_number=1)
+        self.assertEqual(len(cache.data), 2)
+
+        cache.sync(turn_number=100500)
+        self.assertEqual(cache.data, {})
+
+        self.assertNotEqual(cache.get_date()[0].form, date_1[0].form)
+
     def test_get_word_restrictions(self):
 
         normal_noun = utg_words.WordForm(utg_words.Word.create_test_word(type=utg_relations.WORD_TYPE.NOUN, prefix='w-1-', only_required=True))
@@ -1,6 +1,8 @@
 # coding: utf-8
 import random
 
+from unittest import mock
+
 from utg import relations as utg_relations
 from utg import words as utg_words
 from utg import templates as utg_templates
@@ -57,6 +59,33 @@ class DictionaryStoragesTests(TestCase):
         self.check_word_in_dictionary(dictionary, self.utg_word_3, True)
         self.check_word_in_dictionary(dictionary, self.utg_word_2_2, False)
 
+    def test_refresh__only_changed_words(self):
+        storage.game_dictionary.refresh()
+
+        with mock.patch('utg.words.Word.deserialize', wraps=utg_words.Word.deserialize) as deserialize:
+            storage.game_dictionary.refresh()
+            self.word_3.save()
+            storage.game_dictionary.refresh()
+
+        self.assertEqual(deserialize.call_count, 1)
+
+        dictionary = storage.game_dictionary.item
+
+        self.check_word_in_dictionary(dictionary, self.utg_word_2_1, True)
+        self.check_word_in_dictionary(dictionary, self.utg_word_3, True)
+
+    def test_refresh__removed_words(self):
+        storage.game_dictionary.refresh()
+
+        prototypes.WordPrototype._db_filter(id=self.word_3.id).update(state=relations.WORD_STATE.ON_REVIEW)
+
+        storage.game_dictionary.refresh()
+
+        dictionary = storage.game_dictionary.item
+
+        self.check_word_in_dictionary(dictionary, self.utg_word_2_1, True)
+        self.check_word_in_dictionary(dictionary, self.utg_word_3, False)
+
 
 
 class LexiconStoragesTests(TestCase):
@@ -89,6 +118,76 @@ class LexiconStoragesTests(TestCase):
         self.assertEqual(storage.game_lexicon._templates_query().count(), 1)
 
 
+    def test_zero_item(self):
+        self.assertTrue(isinstance(storage.game_lexicon.item, storage.GameLexicon))
+
+
+class GameLexiconTests(TestCase):
+
+    def setUp(self):
+        super(GameLexiconTests, self).setUp()
+        self.key_1 = keys.LEXICON_KEY.HERO_COMMON_JOURNAL_LEVEL_UP
+        self.key_2 = keys.LEXICON_KEY.HERO_COMMON_JOURNAL_RETURN_CHILD_GIFT
+
+        self.lexicon = storage.GameLexicon()
+
+    def test_get_templates__equal_to_utg_lexicon(self):
+        from utg import lexicon as utg_lexicon
+
+        plain_lexicon = utg_lexicon.Lexicon()
+
+        all_restrictions = [('hero', i) for i in range(5)] + [('date', i) for i in range(3)]
+
+        for i in range(30):
+            key = random.choice((self.key_1, self.key_2))
+            restrictions = frozenset(random.sample(all_restrictions, random.randint(0, 3)))
+            self.lexicon.add_template(key, 'template-%d' % i, restrictions=restrictions)
+            plain_lexicon.add_template(key, 'template-%d' % i, restrictions=restrictions)
+
+        for i in range(200):
+            key = random.choice((self.key_1, self.key_2))
+            restrictions = frozenset(random.sample(all_restrictions, random.randint(0, len(all_restrictions))) + [('other', i)])
+            self.assertEqual(self.lexicon.get_templates(key, restrictions),
+                             plain_lexicon.get_templates(key, restrictions))
+
+    def test_get_templates__memoized_by_used_restrictions(self):
+        self.lexicon.add_template(self.key_1, 'template-1', restrictions=frozenset((('hero', 1),)))
+        self.lexicon.add_template(self.key_1, 'template-2', restrictions=frozenset())
+
+        self.assertEqual(self.lexicon.get_templates(self.key_1, frozenset((('hero', 1), ('date', 1)))), ('template-1', 'template-2'))
+
+        with mock.patch('utg.lexicon.Lexicon.get_templates') as get_templates:
+            self.assertEqual(self.lexicon.get_templates(self.key_1, frozenset((('hero', 1), ('date', 2)))), ('template-1', 'template-2'))
+            self.assertEqual(self.lexicon.get_templates(self.key_1, [('hero', 1)]), ('template-1', 'template-2'))
+
+        self.assertEqual(get_templates.call_count, 0)
+
+        self.assertEqual(self.lexicon._candidates, {(self.key_1, frozenset((('hero', 1),))): ('template-1', 'template-2')})
+
+    def test_get_templates__unknown_key(self):
+        self.assertEqual(self.lexicon.get_templates(self.key_1, frozenset((('hero', 1),))), ())
+
+    def test_add_template__reset_candidates(self):
+        self.lexicon.add_template(self.key_1, 'template-1', restrictions=frozenset())
+
+        self.assertEqual(self.lexicon.get_templates(self.key_1, frozenset((('hero', 1),))), ('template-1',))
+
+        self.lexicon.add_template(self.key_1, 'template-2', restrictions=frozenset((('hero', 1),)))
+
+        self.assertEqual(self.lexicon.get_templates(self.key_1, frozenset((('hero', 1),))), ('template-1', 'template-2'))
+        self.assertEqual(self.lexicon.get_templates(self.key_1, frozenset()), ('template-1',))
+
+    def test_get_random_template(self):
+        self.lexicon.add_template(self.key_1, 'template-1', restrictions=frozenset((('hero', 1),)))
+
+        self.assertEqual(self.lexicon.get_random_template(self.key_1, restrictions=frozenset((('hero', 1),))), 'template-1')
+
+        with mock.patch('utg.lexicon.Lexicon.get_templates') as get_templates:
+            self.assertEqual(self.lexicon.get_random_template(self.key_1, restrictions=frozenset((('hero', 1), ('hero', 2)))), 'template-1')
+
+        self.assertEqual(get_templates.call_count, 0)
+
+
 class RestrictionsStorageTests(TestCase):
 
     def setUp(self):
@@ -55,6 +55,9 @@ pgf.game.Updater = function(params) {
     var lastDiaryVersion = undefined;
     var diaryRefreshGoing = false;
 
+    var turnUpdatesWaiting = false;
+    var waitedTurn = undefined;
+
 
     instance.data = {};
 
@@ -74,6 +77,35 @@ pgf.game.Updater = function(params) {
     };
 
 
+    // long polling of turn updates channel: server answers, when new turn of hero processed
+    // if channel is unavailable, data are refreshed by timer
+    instance.WaitTurnUpdates = function() {
+        if (waitedTurn === undefined || currentTurn > waitedTurn) {
+            waitedTurn = currentTurn;
+        }
+
+        turnUpdatesWaiting = true;
+
+        jQuery.ajax({
+            dataType: 'json',
+            type: 'get',
+            url: params.turnUpdatesUrl,
+            data: {account_id: params.turnUpdatesAccountId, turn_number: waitedTurn},
+            success: function(data, request, status) {
+                if (data.turn_number > waitedTurn) {
+                    waitedTurn = data.turn_number;
+                    instance.Refresh();
+                }
+                instance.WaitTurnUpdates();
+            },
+            error: function() {
+                params.turnUpdatesUrl = undefined;
+                turnUpdatesWaiting = false;
+                instance.SetRefreshInterval(params.refreshInterval);
+            }
+        });
+    };
+
     instance.ApplyNewData = function(newData) {
 
         if (currentTurn > newData.turn.number) {
@@ -195,6 +227,10 @@ pgf.game.Updater = function(params) {
 
                 jQuery(document).trigger(pgf.game.events.DATA_REFRESHED, instance.data);
 
+                if (params.turnUpdatesUrl && !turnUpdatesWaiting) {
+                    instance.WaitTurnUpdates();
+                }
+
                 if (instance.data.account && instance.data.account.hero.diary != instance.lastDiaryVersion) {
                     instance.RefreshDiary();
                 }
@@ -1,15 +1,62 @@
 # coding: utf-8
+import bisect
 import datetime
 
 from django.db import models
 
 from the_tale.common.utils.logic import days_range
+from the_tale.common.utils.decorators import lazy_property
 
 from the_tale.statistics.prototypes import RecordPrototype
 from the_tale.statistics.conf import statistics_settings
 from the_tale.statistics.metrics import exceptions
 
 
+def to_datetime(date):
+    if isinstance(date, datetime.datetime):
+        return date
+    return datetime.datetime.combine(date, datetime.time())
+
+
+class DatedSeries(object):
+    '''
+    values, sorted by their dates, with prefix sums
+
+    intervals are strict: (after, before), as in BaseMetric.db_date_* filters
+    None means unbounded side of interval
+    '''
+
+    def __init__(self, records):
+        records = sorted(records, key=lambda record: record[0])
+
+        self.dates = [to_datetime(date) for date, value in records]
+        self.values = [value for date, value in records]
+
+    @lazy_property
+    def sums(self):
+        sums = [0]
+        for value in self.values:
+            sums.append(sums[-1] + value)
+        return sums
+
+    def _slice(self, after, before):
+        start = 0 if after is None else bisect.bisect_right(self.dates, to_datetime(after))
+        end = len(self.dates) if before is None else bisect.bisect_left(self.dates, to_datetime(before))
+        return start, max(start, end)
+
+    def count(self, after=None, before=None):
+        start, end = self._slice(after, before)
+        return end - start
+
+    def sum(self, after=None, before=None):
+        start, end = self._slice(after, before)
+        return self.sums[end] - self.sums[start]
+
+    def slice(self, after=None, before=None):
+        start, end = self._slice(after, before)
+        return self.values[start:end]
+
+
 class BaseMetric(object):
     TYPE = None
     FULL_CLEAR_RECUIRED = False
@@ -105,6 +152,23 @@ class BaseMetric(object):
             date = self.free_date
         return self.db_date_interval(field, date=date, days=0)
 
+    def date_interval(self, days, date=None):
+        '''
+        borders of db_date_interval for DatedSeries methods
+        '''
+        if date is None:
+            date = self.free_date
+
+        if days > 0:
+            return (date, date + datetime.timedelta(days=days))
+        elif days < 0:
+            return (date + datetime.timedelta(days=1+days), date + datetime.timedelta(days=1))
+        else:
+            return (date, date + datetime.timedelta(days=1))
+
+    def date_day(self, date=None):
+        return self.date_interval(days=0, date=date)
+
 
 
 class BaseCombination(BaseMetric):
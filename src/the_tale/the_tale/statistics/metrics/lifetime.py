@@ -5,22 +5,34 @@ import datetime
 from the_tale.accounts.prototypes import AccountPrototype
 from the_tale.accounts.conf import accounts_settings
 
-from the_tale.statistics.metrics.base import BaseMetric
+from the_tale.statistics.metrics.base import BaseMetric, DatedSeries
 from the_tale.statistics import relations
 from functools import reduce
 
 
-class AliveAfterBase(BaseMetric):
+class AccountsLifetimeBase(BaseMetric):
     TYPE = None
     FULL_CLEAR_RECUIRED = True
-    DAYS = None
 
-    def get_value(self, date):
-        query = AccountPrototype._db_filter(self.db_date_day('created_at', date),
+    def initialize(self):
+        super(AccountsLifetimeBase, self).initialize()
+        query = AccountPrototype._db_filter(self.db_date_gte('created_at'),
                                             is_fast=False,
                                             is_bot=False)
+        self.accounts = DatedSeries((created_at, (active_end_at, created_at))
+                                    for active_end_at, created_at in query.values_list('active_end_at', 'created_at'))
+
+    def accounts_in_day(self, date):
+        return self.accounts.slice(*self.date_day(date))
+
+
+class AliveAfterBase(AccountsLifetimeBase):
+    TYPE = None
+    DAYS = None
+
+    def get_value(self, date):
         return len([True
-                    for active_end_at, created_at in query.values_list('active_end_at', 'created_at')
+                    for active_end_at, created_at in self.accounts_in_day(date)
                     if (active_end_at - created_at - datetime.timedelta(seconds=accounts_settings.ACTIVE_STATE_TIMEOUT)).days >= self.DAYS])
 
     def _get_interval(self):
@@ -56,17 +68,12 @@ class AliveAfter0(AliveAfterBase):
     DAYS = 0
 
 
-class Lifetime(BaseMetric):
+class Lifetime(AccountsLifetimeBase):
     TYPE = relations.RECORD_TYPE.LIFETIME
-    FULL_CLEAR_RECUIRED = True
 
     def get_value(self, date):
-        query = AccountPrototype._db_filter(self.db_date_day('created_at', date=date),
-                                            is_fast=False,
-                                            is_bot=False)
-
         lifetimes = [active_end_at - created_at - datetime.timedelta(seconds=accounts_settings.ACTIVE_STATE_TIMEOUT-1)
-                     for active_end_at, created_at in query.values_list('active_end_at', 'created_at') ]
+                     for active_end_at, created_at in self.accounts_in_day(date) ]
 
         # filter «strange» lifetimes
         lifetimes = [lifetime for lifetime in lifetimes if lifetime > datetime.timedelta(seconds=0)]
@@ -78,16 +85,12 @@ class Lifetime(BaseMetric):
         return float(total_time.total_seconds() / (24*60*60)) / len(lifetimes)
 
 
-class LifetimePercent(BaseMetric):
+class LifetimePercent(AccountsLifetimeBase):
     TYPE = relations.RECORD_TYPE.LIFETIME_PERCENT
-    FULL_CLEAR_RECUIRED = True
 
     def get_value(self, date):
-        query = AccountPrototype._db_filter(self.db_date_day('created_at', date=date),
-                                            is_fast=False,
-                                            is_bot=False)
         lifetimes = [active_end_at - created_at - datetime.timedelta(seconds=accounts_settings.ACTIVE_STATE_TIMEOUT)
-                     for active_end_at, created_at in query.values_list('active_end_at', 'created_at') ]
+                     for active_end_at, created_at in self.accounts_in_day(date) ]
 
         if not lifetimes:
             return 0
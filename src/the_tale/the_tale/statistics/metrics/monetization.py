@@ -17,10 +17,9 @@ from the_tale.finances.market import conf as market_conf
 
 from the_tale.forum import models as forum_models
 
-from the_tale.statistics.metrics.base import BaseMetric, BasePercentsCombination, BaseFractionCombination, BasePercentsFromSumCombination
+from the_tale.statistics.metrics.base import BaseMetric, BasePercentsCombination, BaseFractionCombination, BasePercentsFromSumCombination, DatedSeries
 from the_tale.statistics import relations
 from the_tale.statistics.conf import statistics_settings
-from functools import reduce
 
 
 ACCEPTED_INVOICE_FILTER = models.Q(state=INVOICE_STATE.CONFIRMED)|models.Q(state=INVOICE_STATE.FORCED)
@@ -147,34 +146,49 @@ class DaysBeforePayment(BaseMetric):
     FULL_CLEAR_RECUIRED = True
     PERIOD = 30
 
-    def get_value(self, date):
-        query = AccountPrototype._db_filter(is_fast=False, is_bot=False)
+    def initialize(self):
+        super(DaysBeforePayment, self).initialize()
 
-        # do not use accounts registered before payments turn on
-        query = query.filter(self.db_date_interval('created_at', date=date, days=-self.PERIOD),
-                             self.db_date_gte('created_at', date=statistics_settings.PAYMENTS_START_DATE.date()))
-        accounts = dict(query.values_list('id', 'created_at'))
+        created_after = self.date_interval(days=-self.PERIOD)[0]
 
-        invoices = list(InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
-                                                    sender_type=ENTITY_TYPE.XSOLLA,
-                                                    currency=CURRENCY_TYPE.PREMIUM,
-                                                    recipient_id__in=list(accounts.keys())).values_list('created_at', 'recipient_id'))
+        accounts = dict(AccountPrototype._db_filter(self.db_date_gte('created_at', date=created_after),
+                                                    is_fast=False,
+                                                    is_bot=False).values_list('id', 'created_at'))
 
-        account_ids = [id_ for created_at, id_ in invoices]
+        invoices = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
+                                               self.db_date_gte('created_at', date=created_after),
+                                               sender_type=ENTITY_TYPE.XSOLLA,
+                                               currency=CURRENCY_TYPE.PREMIUM).values_list('created_at', 'recipient_id')
 
-        if not account_ids:
-            return 0
+        first_payments = {}
+        invoices_numbers = {}
 
-        delays = {account_id: min([(created_at - accounts[account_id])
-                                   for created_at, id_ in invoices
-                                   if id_==account_id])
-                  for account_id in account_ids}
+        for created_at, recipient_id in invoices:
+            if recipient_id not in accounts:
+                continue
 
-        total_time = reduce(lambda s, v: s+v, list(delays.values()), datetime.timedelta(seconds=0))
+            invoices_numbers[recipient_id] = invoices_numbers.get(recipient_id, 0) + 1
 
-        days = float(total_time.total_seconds()) / len(account_ids) / (24*60*60)
+            if recipient_id not in first_payments or created_at < first_payments[recipient_id]:
+                first_payments[recipient_id] = created_at
 
-        return days
+        self.delays = DatedSeries((accounts[account_id], (paid_at - accounts[account_id]).total_seconds())
+                                  for account_id, paid_at in first_payments.items())
+        self.invoices_numbers = DatedSeries((accounts[account_id], number)
+                                            for account_id, number in invoices_numbers.items())
+
+    def get_value(self, date):
+        after, before = self.date_interval(days=-self.PERIOD, date=date)
+
+        # do not use accounts registered before payments turn on
+        after = max(after, statistics_settings.PAYMENTS_START_DATE.date())
+
+        invoices_number = self.invoices_numbers.sum(after, before)
+
+        if not invoices_number:
+            return 0
+
+        return float(self.delays.sum(after, before)) / invoices_number / (24*60*60)
 
 
 class ARPNU(BaseMetric):
@@ -183,26 +197,42 @@ class ARPNU(BaseMetric):
     DAYS = None
     PERIOD = 30
 
+    def initialize(self):
+        super(ARPNU, self).initialize()
+
+        created_after = self.date_interval(days=-self.PERIOD)[0]
+
+        accounts = dict(AccountPrototype._db_filter(self.db_date_gte('created_at', date=created_after),
+                                                    is_fast=False,
+                                                    is_bot=False).values_list('id', 'created_at'))
+
+        invoices = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
+                                               self.db_date_gte('created_at', date=created_after),
+                                               sender_type=ENTITY_TYPE.XSOLLA,
+                                               currency=CURRENCY_TYPE.PREMIUM).values_list('created_at', 'recipient_id', 'amount')
+
+        incomes = {account_id: 0 for account_id in accounts}
+
+        for created_at, recipient_id, amount in invoices:
+            if recipient_id not in accounts:
+                continue
+
+            after, before = self.date_interval(days=self.DAYS, date=accounts[recipient_id])
+
+            if after < created_at < before:
+                incomes[recipient_id] += amount
+
+        self.incomes = DatedSeries((accounts[account_id], income) for account_id, income in incomes.items())
+
     def get_value(self, date):
-        query = AccountPrototype._db_filter(self.db_date_interval('created_at', date=date, days=-self.PERIOD),
-                                            is_fast=False,
-                                            is_bot=False)
-        accounts = list(query.values_list('id', 'created_at'))
+        after, before = self.date_interval(days=-self.PERIOD, date=date)
 
-        if not accounts:
-            return 0
+        accounts_number = self.incomes.count(after, before)
 
-        total_income = 0
-        for account_id, created_at in accounts:
-            income = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
-                                                 self.db_date_interval('created_at', date=created_at, days=self.DAYS),
-                                                 sender_type=ENTITY_TYPE.XSOLLA,
-                                                 currency=CURRENCY_TYPE.PREMIUM,
-                                                 recipient_id=account_id).aggregate(income=models.Sum('amount'))['income']
-            if income is not None:
-                total_income += income
+        if not accounts_number:
+            return 0
 
-        return float(total_income) / len(accounts)
+        return float(self.incomes.sum(after, before)) / accounts_number
 
     def _get_interval(self):
         return (self.free_date, (datetime.datetime.now()-datetime.timedelta(days=self.DAYS)).date())
@@ -226,24 +256,39 @@ class LTV(BaseMetric):
     FULL_CLEAR_RECUIRED = True
     PERIOD = 7
 
+    def initialize(self):
+        super(LTV, self).initialize()
+
+        created_after = self.date_interval(days=-self.PERIOD)[0]
+
+        accounts = dict(AccountPrototype._db_filter(self.db_date_gte('created_at', date=created_after),
+                                                    is_fast=False,
+                                                    is_bot=False).values_list('id', 'created_at'))
+
+        invoices = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
+                                               self.db_date_gte('created_at', date=created_after),
+                                               sender_type=ENTITY_TYPE.XSOLLA,
+                                               currency=CURRENCY_TYPE.PREMIUM).values_list('recipient_id', 'amount')
+
+        incomes = {account_id: 0 for account_id in accounts}
+
+        for recipient_id, amount in invoices:
+            if recipient_id in accounts:
+                incomes[recipient_id] += amount
+
+        self.incomes = DatedSeries((accounts[account_id], income) for account_id, income in incomes.items())
+
     def get_value(self, date):
-        query = AccountPrototype._db_filter(self.db_date_interval('created_at', date=date, days=-self.PERIOD),
-                                            is_fast=False,
-                                            is_bot=False)
-        accounts_ids = list(query.values_list('id', flat=True))
+        after, before = self.date_interval(days=-self.PERIOD, date=date)
 
-        if not accounts_ids:
-            return 0
+        accounts_number = self.incomes.count(after, before)
 
-        total_income = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
-                                                   sender_type=ENTITY_TYPE.XSOLLA,
-                                                   currency=CURRENCY_TYPE.PREMIUM,
-                                                   recipient_id__in=accounts_ids).aggregate(income=models.Sum('amount'))['income']
+        total_income = self.incomes.sum(after, before)
 
-        if total_income is None:
+        if not accounts_number or not total_income:
             return 0
 
-        return float(total_income) / len(accounts_ids)
+        return float(total_income) / accounts_number
 
 
 
@@ -255,18 +300,22 @@ class IncomeFromGroupsBase(BaseMetric):
     def filter_recipients(cls, ids):
         raise NotImplementedError
 
-    def get_value(self, date):
+    def initialize(self):
+        super(IncomeFromGroupsBase, self).initialize()
+
         invoices = list(InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
-                                                    self.db_date_interval('created_at', date=date, days=-self.PERIOD),
+                                                    self.db_date_gte('created_at', date=self.date_interval(days=-self.PERIOD)[0]),
                                                     sender_type=ENTITY_TYPE.XSOLLA,
-                                                    currency=CURRENCY_TYPE.PREMIUM).values_list('recipient_id', 'amount'))
+                                                    currency=CURRENCY_TYPE.PREMIUM).values_list('created_at', 'recipient_id', 'amount'))
 
-        if not invoices:
-            return 0
+        recipients = set(self.filter_recipients(list({recipient_id for created_at, recipient_id, amount in invoices}))) if invoices else set()
 
-        recipients = set(self.filter_recipients(next(zip(*invoices))))
+        self.invoices = DatedSeries((created_at, amount)
+                                    for created_at, recipient_id, amount in invoices
+                                    if recipient_id in recipients)
 
-        return sum([amount for recipient_id, amount in invoices if recipient_id in recipients], 0)
+    def get_value(self, date):
+        return self.invoices.sum(*self.date_interval(days=-self.PERIOD, date=date))
 
 
 class IncomeFromForum(IncomeFromGroupsBase):
@@ -308,17 +357,17 @@ class IncomeFromGoodsBase(BaseMetric):
     def selector(self):
         return models.Q(operation_uid__contains=self.GROUP_PREFIX)
 
-    def get_value(self, date):
-        income = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
-                                             self.selector(),
-                                             self.db_date_interval('created_at', date=date, days=-self.PERIOD),
-                                             sender_type=ENTITY_TYPE.GAME_LOGIC,
-                                             currency=CURRENCY_TYPE.PREMIUM).aggregate(income=models.Sum('amount'))['income']
-
-        if income is None:
-            return 0
+    def initialize(self):
+        super(IncomeFromGoodsBase, self).initialize()
+        query = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
+                                            self.selector(),
+                                            self.db_date_gte('created_at', date=self.date_interval(days=-self.PERIOD)[0]),
+                                            sender_type=ENTITY_TYPE.GAME_LOGIC,
+                                            currency=CURRENCY_TYPE.PREMIUM).values_list('created_at', 'amount')
+        self.invoices = DatedSeries(query)
 
-        return -income
+    def get_value(self, date):
+        return -self.invoices.sum(*self.date_interval(days=-self.PERIOD, date=date))
 
 
 class IncomeFromGoodsPremium(IncomeFromGoodsBase):
@@ -383,11 +432,15 @@ class IncomeFromGoodsOther(IncomeFromGoodsBase):
 class PU(BaseMetric):
     TYPE = relations.RECORD_TYPE.PU
 
+    def initialize(self):
+        super(PU, self).initialize()
+        query = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
+                                            sender_type=ENTITY_TYPE.XSOLLA,
+                                            currency=CURRENCY_TYPE.PREMIUM).values('recipient_id').annotate(first_payment=models.Min('created_at'))
+        self.first_payments = DatedSeries((first_payment, 1) for first_payment in query.values_list('first_payment', flat=True))
+
     def get_value(self, date):
-        return InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
-                                           self.db_date_lte('created_at', date=date),
-                                           sender_type=ENTITY_TYPE.XSOLLA,
-                                           currency=CURRENCY_TYPE.PREMIUM).values_list('recipient_id').order_by('recipient_id').distinct().count()
+        return self.first_payments.count(before=self.date_day(date)[1])
 
 
 class PUPercents(BasePercentsCombination):
@@ -400,19 +453,45 @@ class IncomeGroupBase(BaseMetric):
     TYPE = None
     BORDERS = (None, None)
 
-    def get_value(self, date):
-        incomes = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
-                                              self.db_date_lte('created_at', date=date),
-                                              sender_type=ENTITY_TYPE.XSOLLA,
-                                              currency=CURRENCY_TYPE.PREMIUM).values_list('recipient_id', 'amount')
+    def in_group(self, amount):
+        return self.BORDERS[0] < amount <= self.BORDERS[1]
+
+    def initialize(self):
+        super(IncomeGroupBase, self).initialize()
+        query = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
+                                            sender_type=ENTITY_TYPE.XSOLLA,
+                                            currency=CURRENCY_TYPE.PREMIUM).values_list('created_at', 'recipient_id', 'amount')
+        invoices = DatedSeries((created_at, (recipient_id, amount)) for created_at, recipient_id, amount in query)
 
         accounts_incomes = {}
-        for recipient_id, amount in incomes:
-            accounts_incomes[recipient_id] = accounts_incomes.get(recipient_id, 0) + amount
+        accounts_number = 0
+        group_income = 0
+        processed = 0
+
+        self.groups = {}
+
+        for date in days_range(*self._get_interval()):
+            border = invoices.count(before=self.date_day(date)[1])
 
-        return len([True
-                    for amount in accounts_incomes.values()
-                    if self.BORDERS[0] < amount <= self.BORDERS[1]])
+            for recipient_id, amount in invoices.values[processed:border]:
+                old_income = accounts_incomes.get(recipient_id, 0)
+                new_income = old_income + amount
+                accounts_incomes[recipient_id] = new_income
+
+                if self.in_group(old_income):
+                    accounts_number -= 1
+                    group_income -= old_income
+
+                if self.in_group(new_income):
+                    accounts_number += 1
+                    group_income += new_income
+
+            processed = border
+
+            self.groups[date] = (accounts_number, group_income)
+
+    def get_value(self, date):
+        return self.groups[date][0]
 
 
 class IncomeGroup0_500(IncomeGroupBase):
@@ -462,23 +541,12 @@ class IncomeGroup10000Percents(BasePercentsCombination):
                relations.RECORD_TYPE.PU]
 
 
-class IncomeGroupIncomeBase(BaseMetric):
+class IncomeGroupIncomeBase(IncomeGroupBase):
     TYPE = None
     BORDERS = (None, None)
 
     def get_value(self, date):
-        incomes = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
-                                              self.db_date_lte('created_at', date=date),
-                                              sender_type=ENTITY_TYPE.XSOLLA,
-                                              currency=CURRENCY_TYPE.PREMIUM).values_list('recipient_id', 'amount')
-
-        accounts_incomes = {}
-        for recipient_id, amount in incomes:
-            accounts_incomes[recipient_id] = accounts_incomes.get(recipient_id, 0) + amount
-
-        return sum([amount
-                    for amount in accounts_incomes.values()
-                    if self.BORDERS[0] < amount <= self.BORDERS[1]], 0)
+        return self.groups[date][1]
 
 
 class IncomeGroupIncome0_500(IncomeGroupIncomeBase):
@@ -530,19 +598,19 @@ class IncomeGroupIncome10000Percents(BasePercentsCombination):
 
 class Revenue(BaseMetric):
     TYPE = relations.RECORD_TYPE.REVENUE
-    FULL_CLEAR_RECUIRED = True # change to False after v0.3.18
     DAYS = None
     PERIOD = 30
 
-    def get_value(self, date):
-        income = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
-                                             self.db_date_interval('created_at', date=date, days=-self.PERIOD),
-                                             sender_type=ENTITY_TYPE.XSOLLA,
-                                             currency=CURRENCY_TYPE.PREMIUM).aggregate(income=models.Sum('amount'))['income']
-        if income is None:
-            return 0
+    def initialize(self):
+        super(Revenue, self).initialize()
+        query = InvoicePrototype._db_filter(ACCEPTED_INVOICE_FILTER,
+                                            self.db_date_gte('created_at', date=self.date_interval(days=-self.PERIOD)[0]),
+                                            sender_type=ENTITY_TYPE.XSOLLA,
+                                            currency=CURRENCY_TYPE.PREMIUM).values_list('created_at', 'amount')
+        self.invoices = DatedSeries(query)
 
-        return income
+    def get_value(self, date):
+        return self.invoices.sum(*self.date_interval(days=-self.PERIOD, date=date))
 
 _FORUM_GROUPS = [relations.RECORD_TYPE.INCOME_FROM_FORUM,
                  relations.RECORD_TYPE.INCOME_FROM_SILENT]
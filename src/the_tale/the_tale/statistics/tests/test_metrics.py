@@ -10,6 +10,7 @@ from the_tale.statistics.prototypes import RecordPrototype
 from the_tale.statistics import relations
 from the_tale.statistics.tests.helpers import TestMetric
 from the_tale.statistics.metrics import exceptions as metrics_exceptions
+from the_tale.statistics.metrics.base import DatedSeries
 
 
 class BaseMetricsTests(testcase.TestCase):
@@ -134,3 +135,47 @@ class BaseMetricsTests(testcase.TestCase):
         with mock.patch('the_tale.statistics.metrics.base.BaseMetric.db_date_interval') as db_date_interval:
             self.metric.db_date_day('x', date=self.date)
         self.assertEqual(db_date_interval.call_args_list, [mock.call('x', date=self.date, days=0)])
+
+    def test_date_interval(self):
+        self.assertEqual(self.metric.date_interval(days=10),
+                         (self.metric.free_date, self.metric.free_date + datetime.timedelta(days=10)))
+        self.assertEqual(self.metric.date_interval(days=-10),
+                         (self.metric.free_date + datetime.timedelta(days=-9), self.metric.free_date + datetime.timedelta(days=1)))
+        self.assertEqual(self.metric.date_interval(days=0),
+                         (self.metric.free_date, self.metric.free_date + datetime.timedelta(days=1)))
+
+    def test_date_day__with_date(self):
+        self.assertEqual(self.metric.date_day(date=self.date), (self.date, self.date + datetime.timedelta(days=1)))
+
+
+class DatedSeriesTests(testcase.TestCase):
+
+    def setUp(self):
+        super(DatedSeriesTests, self).setUp()
+        self.series = DatedSeries([(datetime.datetime(2016, 1, 3, 12), 3),
+                                   (datetime.datetime(2016, 1, 1), 1),
+                                   (datetime.datetime(2016, 1, 2, 12), 2),
+                                   (datetime.datetime(2016, 1, 4), 4)])
+
+    def test_sorted(self):
+        self.assertEqual(self.series.values, [1, 2, 3, 4])
+
+    def test_unbounded(self):
+        self.assertEqual(self.series.count(), 4)
+        self.assertEqual(self.series.sum(), 10)
+
+    def test_strict_borders(self):
+        self.assertEqual(self.series.slice(after=datetime.date(2016, 1, 1), before=datetime.date(2016, 1, 4)), [2, 3])
+        self.assertEqual(self.series.count(after=datetime.date(2016, 1, 1), before=datetime.date(2016, 1, 4)), 2)
+        self.assertEqual(self.series.sum(after=datetime.date(2016, 1, 1), before=datetime.date(2016, 1, 4)), 5)
+
+    def test_datetime_borders(self):
+        self.assertEqual(self.series.sum(after=datetime.datetime(2016, 1, 2, 11), before=datetime.datetime(2016, 1, 3, 13)), 5)
+
+    def test_one_side_borders(self):
+        self.assertEqual(self.series.sum(before=datetime.date(2016, 1, 3)), 3)
+        self.assertEqual(self.series.sum(after=datetime.date(2016, 1, 3)), 7)
+
+    def test_empty_interval(self):
+        self.assertEqual(self.series.count(after=datetime.date(2016, 1, 4), before=datetime.date(2016, 1, 1)), 0)
+        self.assertEqual(self.series.sum(after=datetime.date(2016, 1, 4), before=datetime.date(2016, 1, 1)), 0)
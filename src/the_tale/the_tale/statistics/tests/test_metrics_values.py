@@ -0,0 +1,205 @@
+# coding: utf-8
+
+import datetime
+
+from unittest import mock
+
+from the_tale.common.utils import testcase
+
+from the_tale.accounts.models import Account
+from the_tale.accounts.conf import accounts_settings
+
+from the_tale.finances.bank.models import Invoice
+from the_tale.finances.bank.relations import ENTITY_TYPE, CURRENCY_TYPE, INVOICE_STATE
+from the_tale.finances.bank.tests.helpers import BankTestsMixin
+
+from the_tale.game.logic import create_test_map
+
+from the_tale.statistics.prototypes import RecordPrototype
+from the_tale.statistics.metrics import monetization
+from the_tale.statistics.metrics import lifetime
+
+
+def _time(month, day, hour=0, minute=0):
+    return datetime.datetime(2016, month, day, hour, minute)
+
+def _date(month, day):
+    return datetime.date(2016, month, day)
+
+
+@mock.patch('the_tale.statistics.metrics.base.BaseMetric._last_datetime', lambda self: _time(3, 1))
+class MetricsValuesTests(testcase.TestCase, BankTestsMixin):
+    '''
+    expected values are calculated by hand with old per-day queries semantics
+    free date of all metrics is 2016.03.02
+    '''
+
+    def setUp(self):
+        super(MetricsValuesTests, self).setUp()
+
+        create_test_map()
+
+        timeout = datetime.timedelta(seconds=accounts_settings.ACTIVE_STATE_TIMEOUT)
+
+        self.account_1 = self.create_account(created_at=_time(3, 2, 23), active_end_at=_time(3, 2, 23) + timeout + datetime.timedelta(days=1))
+        self.account_2 = self.create_account(created_at=_time(3, 3, 1), active_end_at=_time(3, 3, 1) + timeout + datetime.timedelta(days=7, hours=2))
+        self.account_3 = self.create_account(created_at=_time(3, 3, 12), active_end_at=_time(3, 3, 12) + timeout + datetime.timedelta(hours=12))
+        self.account_4 = self.create_account(created_at=_time(2, 1, 10), active_end_at=_time(2, 1, 10) + timeout)
+        self.account_5 = self.create_account(created_at=_time(3, 4, 8), active_end_at=_time(3, 4, 8) + timeout - datetime.timedelta(hours=1))
+
+        self.create_account(created_at=_time(3, 3, 5), active_end_at=_time(3, 3, 5) + timeout + datetime.timedelta(days=30), is_bot=True)
+
+        self.create_payment(self.account_1, 100, _time(3, 3, 1))
+        self.create_payment(self.account_1, 450, _time(3, 4, 10))
+        self.create_payment(self.account_2, 600, _time(3, 3, 2))
+        self.create_payment(self.account_2, 1000, _time(3, 20))
+        self.create_payment(self.account_3, 300, _time(3, 4, 12), state=INVOICE_STATE.FORCED)
+        self.create_payment(self.account_3, 200, _time(3, 5, 0, 30))
+        self.create_payment(self.account_3, 150, _time(4, 20))
+        self.create_payment(self.account_4, 50, _time(2, 20, 12))
+
+        # not payments
+        self.create_payment(self.account_2, 5000, _time(3, 3, 3), state=INVOICE_STATE.REQUESTED)
+        self.create_payment(self.account_1, 700, _time(3, 3, 3), sender_type=ENTITY_TYPE.GAME_LOGIC)
+
+    def create_account(self, created_at, active_end_at, is_bot=False):
+        account = self.accounts_factory.create_account(is_bot=is_bot)
+        Account.objects.filter(id=account.id).update(created_at=created_at, active_end_at=active_end_at)
+        return account
+
+    def create_payment(self, account, amount, created_at, state=INVOICE_STATE.CONFIRMED, sender_type=ENTITY_TYPE.XSOLLA):
+        invoice = self.create_invoice(recipient_id=account.id,
+                                      sender_type=sender_type,
+                                      sender_id=0,
+                                      currency=CURRENCY_TYPE.PREMIUM,
+                                      amount=amount,
+                                      state=state)
+        Invoice.objects.filter(id=invoice.id).update(created_at=created_at)
+        return invoice
+
+    def get_metric(self, metric_class):
+        metric = metric_class()
+        metric.initialize()
+        return metric
+
+    def test_days_before_payment(self):
+        metric = self.get_metric(monetization.DaysBeforePayment)
+
+        # delays are summed by accounts, but divided by number of theirs invoices
+        self.assertAlmostEqual(metric.get_value(_date(3, 2)), 2.0 / 24 / 2)
+        self.assertAlmostEqual(metric.get_value(_date(3, 5)), (2.0 + 1 + 24) / 24 / 7)
+        self.assertEqual(metric.get_value(_date(4, 10)), 0)
+
+    def test_arpnu(self):
+        week = self.get_metric(monetization.ARPNUWeek)
+        month = self.get_metric(monetization.ARPNUMonth)
+        three_months = self.get_metric(monetization.ARPNU3Month)
+
+        self.assertEqual(week.get_value(_date(3, 2)), 550.0)
+        self.assertEqual(month.get_value(_date(3, 2)), 550.0)
+
+        self.assertEqual(week.get_value(_date(3, 5)), (550.0 + 600 + 500 + 0) / 4)
+        self.assertEqual(month.get_value(_date(3, 5)), (550.0 + 1600 + 500 + 0) / 4)
+        self.assertEqual(three_months.get_value(_date(3, 5)), (550.0 + 1600 + 650 + 0) / 4)
+
+        self.assertEqual(week.get_value(_date(5, 1)), 0)
+
+    def test_ltv(self):
+        metric = self.get_metric(monetization.LTV)
+
+        self.assertEqual(metric.get_value(_date(3, 2)), 550.0)
+        self.assertEqual(metric.get_value(_date(3, 5)), (550.0 + 1600 + 650 + 0) / 4)
+        self.assertEqual(metric.get_value(_date(3, 12)), 0)
+
+    def check_groups(self, metric_class, interval, expected_values):
+        with mock.patch('the_tale.statistics.metrics.monetization.IncomeGroupBase._get_interval', lambda self: interval):
+            metric = self.get_metric(metric_class)
+
+            with mock.patch('the_tale.statistics.metrics.base.BaseMetric.store_value') as store_value:
+                metric.complete_values()
+
+        self.assertEqual(store_value.call_args_list,
+                         [mock.call(date, value) for date, value in expected_values])
+
+    def test_income_groups(self):
+        interval = (_date(3, 2), _date(3, 6))
+
+        self.check_groups(monetization.IncomeGroup0_500, interval,
+                          [(_date(3, 2), 1), (_date(3, 3), 2), (_date(3, 4), 2), (_date(3, 5), 2)])
+        self.check_groups(monetization.IncomeGroupIncome0_500, interval,
+                          [(_date(3, 2), 50), (_date(3, 3), 150), (_date(3, 4), 350), (_date(3, 5), 550)])
+
+        self.check_groups(monetization.IncomeGroup500_1000, interval,
+                          [(_date(3, 2), 0), (_date(3, 3), 1), (_date(3, 4), 2), (_date(3, 5), 2)])
+        self.check_groups(monetization.IncomeGroupIncome500_1000, interval,
+                          [(_date(3, 2), 0), (_date(3, 3), 600), (_date(3, 4), 1150), (_date(3, 5), 1150)])
+
+    def test_income_groups__start_after_payments(self):
+        interval = (_date(3, 19), _date(3, 22))
+
+        self.check_groups(monetization.IncomeGroup500_1000, interval,
+                          [(_date(3, 19), 2), (_date(3, 20), 1), (_date(3, 21), 1)])
+        self.check_groups(monetization.IncomeGroupIncome500_1000, interval,
+                          [(_date(3, 19), 1150), (_date(3, 20), 550), (_date(3, 21), 550)])
+
+        self.check_groups(monetization.IncomeGroup1000_2500, interval,
+                          [(_date(3, 19), 0), (_date(3, 20), 1), (_date(3, 21), 1)])
+        self.check_groups(monetization.IncomeGroupIncome1000_2500, interval,
+                          [(_date(3, 19), 0), (_date(3, 20), 1600), (_date(3, 21), 1600)])
+
+    def test_revenue(self):
+        metric = self.get_metric(monetization.Revenue)
+
+        self.assertEqual(metric.get_value(_date(3, 2)), 50)
+        self.assertEqual(metric.get_value(_date(3, 3)), 750)
+        self.assertEqual(metric.get_value(_date(3, 4)), 1500)
+        self.assertEqual(metric.get_value(_date(3, 5)), 1700)
+        self.assertEqual(metric.get_value(_date(4, 1)), 2650)
+
+    @mock.patch('the_tale.statistics.metrics.base.BaseMetric._last_datetime',
+                lambda self: RecordPrototype._db_filter(type=self.TYPE).order_by('-date')[0].date)
+    def test_revenue__continue_from_last_record(self):
+        self.assertFalse(monetization.Revenue.FULL_CLEAR_RECUIRED)
+
+        monetization.Revenue().store_value(_date(3, 1), 0)
+
+        with mock.patch('the_tale.statistics.metrics.base.BaseMetric._get_interval', lambda self: (self.free_date, _date(3, 4))):
+            self.get_metric(monetization.Revenue).complete_values()
+
+        with mock.patch('the_tale.statistics.metrics.base.BaseMetric._get_interval', lambda self: (self.free_date, _date(3, 6))):
+            metric = self.get_metric(monetization.Revenue)
+            self.assertEqual(metric.free_date, _date(3, 4))
+            metric.complete_values()
+
+        values = RecordPrototype._db_filter(type=monetization.Revenue.TYPE).order_by('date').values_list('date', 'value_int')
+
+        self.assertEqual([(date.date(), value) for date, value in values],
+                         [(_date(3, 1), 0), (_date(3, 2), 50), (_date(3, 3), 750), (_date(3, 4), 1500), (_date(3, 5), 1700)])
+
+    def test_alive_after(self):
+        self.assertEqual(self.get_metric(lifetime.AliveAfter0).get_value(_date(3, 3)), 2)
+        self.assertEqual(self.get_metric(lifetime.AliveAfterDay).get_value(_date(3, 3)), 1)
+        self.assertEqual(self.get_metric(lifetime.AliveAfterWeek).get_value(_date(3, 3)), 1)
+        self.assertEqual(self.get_metric(lifetime.AliveAfterMonth).get_value(_date(3, 3)), 0)
+
+        self.assertEqual(self.get_metric(lifetime.AliveAfterDay).get_value(_date(3, 2)), 1)
+        self.assertEqual(self.get_metric(lifetime.AliveAfterWeek).get_value(_date(3, 2)), 0)
+
+        self.assertEqual(self.get_metric(lifetime.AliveAfter0).get_value(_date(3, 4)), 0)
+
+    def test_lifetime(self):
+        metric = self.get_metric(lifetime.Lifetime)
+
+        self.assertAlmostEqual(metric.get_value(_date(3, 3)), ((7*24 + 2 + 12) * 60 * 60 + 2.0) / (24*60*60) / 2)
+        self.assertAlmostEqual(metric.get_value(_date(3, 2)), (24 * 60 * 60 + 1.0) / (24*60*60))
+
+        # negative lifetimes are filtered
+        self.assertEqual(metric.get_value(_date(3, 4)), 0)
+
+    def test_lifetime_percent(self):
+        metric = self.get_metric(lifetime.LifetimePercent)
+
+        maximum = (datetime.datetime.now().date() - _date(3, 3)).total_seconds()
+
+        self.assertAlmostEqual(metric.get_value(_date(3, 3)), (7*24 + 2 + 12) * 60 * 60 / 2.0 / maximum * 100)
+        self.assertEqual(metric.get_value(_date(3, 20)), 0)
@@ -14,6 +14,12 @@ async def version(message, **kwargs):
     return diary_pb2.VersionResponse(version=version)
 
 
+@handlers.api(diary_pb2.VersionsRequest)
+async def versions(message, **kwargs):
+    return diary_pb2.VersionsResponse(versions=[operations.TIMESTAMPS_CACHE.get(account_id, 0)
+                                                for account_id in message.accounts_ids])
+
+
 @handlers.api(diary_pb2.PushMessageRequest)
 async def push_message(message, **kwargs):
     await operations.push_message(account_id=message.account_id,
@@ -22,6 +28,13 @@ async def push_message(message, **kwargs):
     return diary_pb2.PushMessageResponse()
 
 
+@handlers.api(diary_pb2.PushMessagesBatchRequest)
+async def push_messages_batch(message, **kwargs):
+    await operations.push_messages([(request.account_id, protobuf.to_message(request.message), request.diary_size)
+                                    for request in message.requests])
+    return diary_pb2.PushMessagesBatchResponse()
+
+
 @handlers.api(diary_pb2.DiaryRequest)
 async def diary(message, **kwargs):
     diary = await operations.load_diary(account_id=message.account_id)
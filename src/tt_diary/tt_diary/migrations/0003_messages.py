@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.2 on 2017-03-14 10:21
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+
+
+def move_messages(apps, schema_editor):
+    Diary = apps.get_model('tt_diary', 'Diary')
+    Message = apps.get_model('tt_diary', 'Message')
+
+    for diary in Diary.objects.all().iterator():
+        Message.objects.bulk_create([Message(account=diary.id,
+                                             turn_number=message['turn_number'],
+                                             timestamp=message['timestamp'],
+                                             data=message)
+                                     for message in diary.data.get('messages', ())])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tt_diary', '0002_diary_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Message',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('account', models.PositiveIntegerField()),
+                ('turn_number', models.BigIntegerField()),
+                ('timestamp', models.FloatField()),
+                ('data', django.contrib.postgres.fields.jsonb.JSONField(default='{}')),
+            ],
+            options={
+                'db_table': 'messages',
+            },
+        ),
+        migrations.AlterIndexTogether(
+            name='message',
+            index_together=set([('account', 'turn_number', 'timestamp', 'id')]),
+        ),
+        migrations.RunPython(move_messages, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='diary',
+            name='data',
+        ),
+    ]
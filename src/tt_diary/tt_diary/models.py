@@ -14,7 +14,24 @@ class Diary(models.Model):
 
     version = models.BigIntegerField(default=0)
 
+    class Meta:
+        db_table = 'diaries'
+
+
+class Message(models.Model):
+
+    id = models.BigAutoField(primary_key=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    account = models.PositiveIntegerField()
+
+    # ordering fields, duplicated from data
+    turn_number = models.BigIntegerField()
+    timestamp = models.FloatField()
+
     data = postgres_fields.JSONField(default='{}')
 
     class Meta:
-        db_table = 'diaries'
+        db_table = 'messages'
+        index_together = (('account', 'turn_number', 'timestamp', 'id'),)
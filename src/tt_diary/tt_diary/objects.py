@@ -1,4 +1,5 @@
 
+import bisect
 import datetime
 import itertools
 import collections
@@ -63,17 +64,20 @@ class Diary(object):
 
 
     def push_message(self, message, diary_size=None, increment_version=True):
-        self._messages.append((message.turn_number, message.timestamp, next(self._counter), message))
-        self._messages.sort()
+        bisect.insort(self._messages, (message.turn_number, message.timestamp, next(self._counter), message))
 
-        if diary_size is not None:
-            while len(self._messages) > diary_size:
-                self._messages.pop(0)
+        if diary_size is not None and len(self._messages) > diary_size:
+            del self._messages[:len(self._messages) - diary_size]
 
         if increment_version:
             self.version += 1
 
 
+    def extend_sorted(self, messages):
+        # messages must be already sorted by (turn_number, timestamp) and must not precede messages of diary
+        self._messages.extend((message.turn_number, message.timestamp, next(self._counter), message) for message in messages)
+
+
     def messages(self):
         for turn_number, timestamp, number, messages in self._messages:
             yield messages
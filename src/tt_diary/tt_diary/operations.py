@@ -4,7 +4,6 @@ from psycopg2.extras import Json as PGJson
 import asyncio
 
 from tt_web import postgresql as db
-from tt_web import utils
 
 from . import objects
 
@@ -12,36 +11,98 @@ from . import objects
 TIMESTAMPS_CACHE = {}
 
 
-CHANGE_DIARY_POINT = utils.SyncPoint()
-
-
 async def initialize_timestamps_cache():
     results = await db.sql('SELECT id, version FROM diaries')
     TIMESTAMPS_CACHE.update({row['id']: row['version'] for row in results})
 
 
+async def increment_version(execute, account_id, delta=1):
+    # locks diary row until the end of transaction, so changes of single diary are serialized
+    result = await execute('''INSERT INTO diaries (id, version, created_at, updated_at)
+                              VALUES (%(account_id)s, %(delta)s, NOW(), NOW())
+                              ON CONFLICT (id) DO UPDATE SET version=diaries.version + %(delta)s, updated_at=NOW()
+                              RETURNING version''',
+                           {'account_id': account_id, 'delta': delta})
+    return result[0]['version']
+
+
+async def insert_messages(execute, account_id, messages):
+    if not messages:
+        return
+
+    values = []
+    arguments = {'account_id': account_id}
+
+    for i, message in enumerate(messages):
+        values.append('(%(account_id)s, %(turn_number_{i})s, %(timestamp_{i})s, %(data_{i})s, NOW())'.format(i=i))
+        arguments['turn_number_{}'.format(i)] = message.turn_number
+        arguments['timestamp_{}'.format(i)] = message.timestamp
+        arguments['data_{}'.format(i)] = PGJson(message.serialize())
+
+    await execute('INSERT INTO messages (account, turn_number, timestamp, data, created_at) VALUES {}'.format(', '.join(values)),
+                  arguments)
+
+
+async def trim_diary(execute, account_id, diary_size):
+    await execute('''DELETE FROM messages
+                     WHERE id IN (SELECT id FROM messages
+                                  WHERE account=%(account_id)s
+                                  ORDER BY turn_number DESC, timestamp DESC, id DESC
+                                  OFFSET %(diary_size)s)''',
+                  {'account_id': account_id, 'diary_size': diary_size})
+
+
 async def push_message(account_id, message, diary_size):
-    async with CHANGE_DIARY_POINT.lock(account_id):
-        diary = await load_diary(account_id)
+    await push_messages([(account_id, message, diary_size)])
 
-        if diary is None:
-            diary = objects.Diary()
 
-        diary.push_message(message, diary_size=diary_size)
-        await save_diary(account_id, diary)
+async def push_messages(messages):
+    '''
+    messages: [(account_id, message, diary_size), ...]
+    '''
+    versions = await db.transaction(_push_messages, {'messages': messages})
+    TIMESTAMPS_CACHE.update(versions)
+
+
+async def _push_messages(execute, arguments):
+    diaries = {}
+
+    for account_id, message, diary_size in arguments['messages']:
+        messages, _ = diaries.get(account_id, ([], None))
+        messages.append(message)
+        # diary size of the last message is actual
+        diaries[account_id] = (messages, diary_size)
+
+    versions = {}
+
+    # diaries are locked in the same order by all transactions to prevent deadlocks
+    for account_id in sorted(diaries):
+        messages, diary_size = diaries[account_id]
+
+        versions[account_id] = await increment_version(execute, account_id, delta=len(messages))
+
+        await insert_messages(execute, account_id, messages)
+
+        await trim_diary(execute, account_id, diary_size)
+
+    return versions
 
 
 async def load_diary(account_id):
 
-    result = await db.sql('SELECT data, version FROM diaries WHERE id=%(account_id)s', {'account_id': account_id})
+    result = await db.sql('''SELECT d.version AS version, m.data AS data
+                             FROM diaries AS d
+                             LEFT OUTER JOIN messages AS m ON m.account = d.id
+                             WHERE d.id=%(account_id)s
+                             ORDER BY m.turn_number, m.timestamp, m.id''',
+                          {'account_id': account_id})
 
     if not result:
         return None
 
     diary = objects.Diary()
 
-    for message_data in result[0]['data']['messages']:
-        diary.push_message(objects.Message.deserialize(message_data), increment_version=False)
+    diary.extend_sorted(objects.Message.deserialize(row['data']) for row in result if row['data'] is not None)
 
     diary.version = result[0]['version']
 
@@ -49,21 +110,30 @@ async def load_diary(account_id):
 
 
 async def save_diary(account_id, diary):
+    version = await db.transaction(_save_diary, {'account_id': account_id,
+                                                 'diary': diary})
+    TIMESTAMPS_CACHE[account_id] = version
+
 
-    sql = '''INSERT INTO diaries (id, data, created_at, updated_at, version)
-             VALUES (%(account_id)s, %(data)s, NOW(), NOW(), %(version)s)
-             ON CONFLICT (id) DO UPDATE SET data=EXCLUDED.data, version=EXCLUDED.version, updated_at=EXCLUDED.updated_at
-             RETURNING version'''
+async def _save_diary(execute, arguments):
+    account_id = arguments['account_id']
+    diary = arguments['diary']
 
-    data = {'messages': [message.serialize() for message in diary.messages()]}
+    result = await execute('''INSERT INTO diaries (id, created_at, updated_at, version)
+                              VALUES (%(account_id)s, NOW(), NOW(), %(version)s)
+                              ON CONFLICT (id) DO UPDATE SET version=EXCLUDED.version, updated_at=EXCLUDED.updated_at
+                              RETURNING version''',
+                           {'account_id': account_id, 'version': diary.version})
 
-    result = await db.sql(sql, {'account_id': account_id, 'data': PGJson(data), 'version': diary.version})
+    await execute('DELETE FROM messages WHERE account=%(account_id)s', {'account_id': account_id})
 
-    TIMESTAMPS_CACHE[account_id] = result[0]['version']
+    await insert_messages(execute, account_id, list(diary.messages()))
 
+    return result[0]['version']
 
 
 async def clean_diaries():
+    await db.sql('DELETE FROM messages')
     await db.sql('DELETE FROM diaries')
 
 
@@ -21,7 +21,9 @@ def register_routers(app):
     from . import handlers
 
     app.router.add_post('/version', handlers.version)
+    app.router.add_post('/versions', handlers.versions)
     app.router.add_post('/push-message', handlers.push_message)
+    app.router.add_post('/push-messages-batch', handlers.push_messages_batch)
     app.router.add_post('/diary', handlers.diary)
 
 
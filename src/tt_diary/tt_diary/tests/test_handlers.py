@@ -68,6 +68,30 @@ class VersionHandlerTests(helpers.BaseTests, HandlersTestsMixin):
         self.assertGreater(data_2.version, data_1.version)
 
 
+class VersionsHandlerTests(helpers.BaseTests, HandlersTestsMixin):
+
+    @test_utils.unittest_run_loop
+    async def test_versions__not_exists(self):
+        request = await self.client.post('/versions', data=diary_pb2.VersionsRequest(accounts_ids=[1, 2]).SerializeToString())
+
+        data = await self.check_answer(request, diary_pb2.VersionsResponse)
+
+        self.assertEqual(list(data.versions), [0, 0])
+
+
+    @test_utils.unittest_run_loop
+    async def test_versions(self):
+        await operations.push_message(1, self.create_message(1), diary_size=100)
+        await operations.push_message(3, self.create_message(2), diary_size=100)
+        await operations.push_message(3, self.create_message(3), diary_size=100)
+
+        request = await self.client.post('/versions', data=diary_pb2.VersionsRequest(accounts_ids=[3, 2, 1]).SerializeToString())
+
+        data = await self.check_answer(request, diary_pb2.VersionsResponse)
+
+        self.assertEqual(list(data.versions), [2, 0, 1])
+
+
 class PushMessageTests(helpers.BaseTests, HandlersTestsMixin):
 
     @test_utils.unittest_run_loop
@@ -112,6 +136,28 @@ class PushMessageTests(helpers.BaseTests, HandlersTestsMixin):
         self.assertEqual(list(diary.messages()), messages[1:])
 
 
+class PushMessagesBatchTests(helpers.BaseTests, HandlersTestsMixin):
+
+    @test_utils.unittest_run_loop
+    async def test_push(self):
+        messages = [self.create_message(i) for i in range(5)]
+
+        requests = [diary_pb2.PushMessageRequest(account_id=1 + i % 2, message=protobuf.from_message(message), diary_size=2)
+                    for i, message in enumerate(messages)]
+
+        request = await self.client.post('/push-messages-batch', data=diary_pb2.PushMessagesBatchRequest(requests=requests).SerializeToString())
+        await self.check_answer(request, diary_pb2.PushMessagesBatchResponse)
+
+        diary_1 = await operations.load_diary(1)
+        diary_2 = await operations.load_diary(2)
+
+        self.assertEqual(list(diary_1.messages()), [messages[2], messages[4]])
+        self.assertEqual(diary_1.version, 3)
+
+        self.assertEqual(list(diary_2.messages()), [messages[1], messages[3]])
+        self.assertEqual(diary_2.version, 2)
+
+
 class DiaryTests(helpers.BaseTests, HandlersTestsMixin):
 
     @test_utils.unittest_run_loop
@@ -65,3 +65,24 @@ class DiaryTests(unittest.TestCase):
 
         self.assertEqual(list(message.message for message in self.diary.messages()),
                          ['1_1', '7_101', '8_99', '9_100', '10_100'])
+
+    def test_push_message__insert_in_middle(self):
+        self.diary.push_message(helpers.create_message(turn_number=1, message='1'))
+        self.diary.push_message(helpers.create_message(turn_number=3, message='3'))
+        self.diary.push_message(helpers.create_message(turn_number=2, message='2'), diary_size=2)
+
+        self.assertEqual(list(message.message for message in self.diary.messages()), ['2', '3'])
+
+
+    def test_extend_sorted(self):
+        self.diary.push_message(helpers.create_message(turn_number=1, timestamp=1, message='1_1'))
+
+        self.diary.extend_sorted([helpers.create_message(turn_number=1, timestamp=1, message='1_1_second'),
+                                  helpers.create_message(turn_number=2, timestamp=1, message='2_1')])
+
+        self.assertEqual(self.diary.version, 1)
+
+        self.diary.push_message(helpers.create_message(turn_number=1, timestamp=1, message='1_1_third'))
+
+        self.assertEqual(list(message.message for message in self.diary.messages()),
+                         ['1_1', '1_1_second', '1_1_third', '2_1'])
@@ -5,6 +5,7 @@ import asyncio
 from aiohttp import test_utils
 
 from tt_web import utils
+from tt_web import postgresql as db
 
 from tt_diary import objects
 from tt_diary import operations
@@ -99,6 +100,93 @@ class OperationsTests(helpers.BaseTests):
 
 
 
+    @test_utils.unittest_run_loop
+    async def test_push_message__trim_rows(self):
+
+        for i in range(11):
+            await operations.push_message(1, helpers.create_message(turn_number=i, message='message {}'.format(i)), diary_size=5)
+            await operations.push_message(2, helpers.create_message(turn_number=i, message='message {}'.format(i)), diary_size=3)
+
+        result = await db.sql('SELECT account, count(*) AS number FROM messages GROUP BY account')
+
+        self.assertEqual({row['account']: row['number'] for row in result}, {1: 5, 2: 3})
+
+
+    @test_utils.unittest_run_loop
+    async def test_push_message__diary_size_decreased(self):
+
+        for i in range(10):
+            await operations.push_message(1, helpers.create_message(turn_number=i, message='message {}'.format(i)), diary_size=10)
+
+        await operations.push_message(1, helpers.create_message(turn_number=5, message='message 5.5'), diary_size=3)
+
+        loaded_diary = await operations.load_diary(1)
+
+        self.assertEqual([message.message for message in loaded_diary.messages()],
+                         ['message 7', 'message 8', 'message 9'])
+
+
+    @test_utils.unittest_run_loop
+    async def test_push_message__equal_turns_order(self):
+
+        for i in range(5):
+            await operations.push_message(1, helpers.create_message(turn_number=1, timestamp=1, message='message {}'.format(i)), diary_size=10)
+
+        loaded_diary = await operations.load_diary(1)
+
+        self.assertEqual([message.message for message in loaded_diary.messages()],
+                         ['message {}'.format(i) for i in range(5)])
+
+
+    @test_utils.unittest_run_loop
+    async def test_push_messages(self):
+        await operations.push_message(2, helpers.create_message(turn_number=1, message='message 2.1'), diary_size=100)
+
+        await operations.push_messages([(1, helpers.create_message(turn_number=1, message='message 1.1'), 100),
+                                        (2, helpers.create_message(turn_number=2, message='message 2.2'), 100),
+                                        (1, helpers.create_message(turn_number=2, message='message 1.2'), 100),
+                                        (1, helpers.create_message(turn_number=3, message='message 1.3'), 2)])
+
+        self.assertEqual(operations.TIMESTAMPS_CACHE, {1: 3, 2: 2})
+
+        diary_1 = await operations.load_diary(1)
+        diary_2 = await operations.load_diary(2)
+
+        self.assertEqual(diary_1.version, 3)
+        self.assertEqual([message.message for message in diary_1.messages()], ['message 1.2', 'message 1.3'])
+
+        self.assertEqual(diary_2.version, 2)
+        self.assertEqual([message.message for message in diary_2.messages()], ['message 2.1', 'message 2.2'])
+
+
+    @test_utils.unittest_run_loop
+    async def test_push_messages__no_messages(self):
+        await operations.push_messages([])
+
+        self.assertEqual(operations.TIMESTAMPS_CACHE, {})
+
+        diaries_count = await operations.count_diaries()
+        self.assertEqual(diaries_count, 0)
+
+
+    @test_utils.unittest_run_loop
+    async def test_save_diary__remove_old_messages(self):
+        saved_diary = objects.Diary()
+        saved_diary.push_message(helpers.create_message('message 1'))
+        saved_diary.push_message(helpers.create_message('message 2'))
+
+        await operations.save_diary(1, saved_diary)
+
+        await operations.save_diary(1, objects.Diary())
+
+        loaded_diary = await operations.load_diary(1)
+
+        self.assertEqual(list(loaded_diary.messages()), [])
+
+        result = await db.sql('SELECT count(*) FROM messages')
+        self.assertEqual(result[0][0], 0)
+
+
     @test_utils.unittest_run_loop
     async def test_timestamps_cache__filled_and_initialized(self):
         await operations.save_diary(3, objects.Diary())
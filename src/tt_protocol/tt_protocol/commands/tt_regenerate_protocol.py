@@ -19,7 +19,8 @@ def main():
 
     files = ('base.proto',
              'diary.proto',
-             'personal_messages.proto')
+             'personal_messages.proto',
+             'turn_updates.proto')
 
     files = [os.path.join(SOURCE_DIR, filename) for filename in files]
 
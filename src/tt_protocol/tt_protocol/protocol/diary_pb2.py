@@ -19,7 +19,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='diary.proto',
   package='diary',
   syntax='proto3',
-  serialized_pb=_b('\n\x0b\x64iary.proto\x12\x05\x64iary\"\xec\x01\n\x07Message\x12\x11\n\ttimestamp\x18\x01 \x01(\x01\x12\x13\n\x0bturn_number\x18\x02 \x01(\x04\x12\x0c\n\x04type\x18\x03 \x01(\r\x12\x11\n\tgame_time\x18\x04 \x01(\t\x12\x11\n\tgame_date\x18\x05 \x01(\t\x12\x10\n\x08position\x18\x06 \x01(\t\x12\x0f\n\x07message\x18\x07 \x01(\t\x12\x30\n\tvariables\x18\x08 \x03(\x0b\x32\x1d.diary.Message.VariablesEntry\x1a\x30\n\x0eVariablesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\":\n\x05\x44iary\x12\x0f\n\x07version\x18\x01 \x01(\x04\x12 \n\x08messages\x18\x02 \x03(\x0b\x32\x0e.diary.Message\"$\n\x0eVersionRequest\x12\x12\n\naccount_id\x18\x01 \x01(\r\"\"\n\x0fVersionResponse\x12\x0f\n\x07version\x18\x01 \x01(\x04\"]\n\x12PushMessageRequest\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x12\n\ndiary_size\x18\x02 \x01(\r\x12\x1f\n\x07message\x18\x03 \x01(\x0b\x32\x0e.diary.Message\"\x15\n\x13PushMessageResponse\"\"\n\x0c\x44iaryRequest\x12\x12\n\naccount_id\x18\x01 \x01(\r\",\n\rDiaryResponse\x12\x1b\n\x05\x64iary\x18\x01 \x01(\x0b\x32\x0c.diary.Diaryb\x06proto3')
+  serialized_pb=_b('\n\x0b\x64iary.proto\x12\x05\x64iary\"\xec\x01\n\x07Message\x12\x11\n\ttimestamp\x18\x01 \x01(\x01\x12\x13\n\x0bturn_number\x18\x02 \x01(\x04\x12\x0c\n\x04type\x18\x03 \x01(\r\x12\x11\n\tgame_time\x18\x04 \x01(\t\x12\x11\n\tgame_date\x18\x05 \x01(\t\x12\x10\n\x08position\x18\x06 \x01(\t\x12\x0f\n\x07message\x18\x07 \x01(\t\x12\x30\n\tvariables\x18\x08 \x03(\x0b\x32\x1d.diary.Message.VariablesEntry\x1a\x30\n\x0eVariablesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\":\n\x05\x44iary\x12\x0f\n\x07version\x18\x01 \x01(\x04\x12 \n\x08messages\x18\x02 \x03(\x0b\x32\x0e.diary.Message\"$\n\x0eVersionRequest\x12\x12\n\naccount_id\x18\x01 \x01(\r\"\"\n\x0fVersionResponse\x12\x0f\n\x07version\x18\x01 \x01(\x04\"]\n\x12PushMessageRequest\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x12\n\ndiary_size\x18\x02 \x01(\r\x12\x1f\n\x07message\x18\x03 \x01(\x0b\x32\x0e.diary.Message\"\x15\n\x13PushMessageResponse\"\"\n\x0c\x44iaryRequest\x12\x12\n\naccount_id\x18\x01 \x01(\r\",\n\rDiaryResponse\x12\x1b\n\x05\x64iary\x18\x01 \x01(\x0b\x32\x0c.diary.Diary\"G\n\x18PushMessagesBatchRequest\x12+\n\x08requests\x18\x01 \x03(\x0b\x32\x19.diary.PushMessageRequest\"\x1b\n\x19PushMessagesBatchResponse\"\'\n\x0fVersionsRequest\x12\x14\n\x0c\x61\x63\x63ounts_ids\x18\x01 \x03(\r\"$\n\x10VersionsResponse\x12\x10\n\x08versions\x18\x01 \x03(\x04\x62\x06proto3')
 )
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
@@ -373,11 +373,129 @@ _DIARYRESPONSE = _descriptor.Descriptor(
   serialized_end=593,
 )
 
+
+_PUSHMESSAGESBATCHREQUEST = _descriptor.Descriptor(
+  name='PushMessagesBatchRequest',
+  full_name='diary.PushMessagesBatchRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='requests', full_name='diary.PushMessagesBatchRequest.requests', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=595,
+  serialized_end=666,
+)
+
+
+_PUSHMESSAGESBATCHRESPONSE = _descriptor.Descriptor(
+  name='PushMessagesBatchResponse',
+  full_name='diary.PushMessagesBatchResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=668,
+  serialized_end=695,
+)
+
+
+_VERSIONSREQUEST = _descriptor.Descriptor(
+  name='VersionsRequest',
+  full_name='diary.VersionsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='accounts_ids', full_name='diary.VersionsRequest.accounts_ids', index=0,
+      number=1, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=697,
+  serialized_end=736,
+)
+
+
+_VERSIONSRESPONSE = _descriptor.Descriptor(
+  name='VersionsResponse',
+  full_name='diary.VersionsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='versions', full_name='diary.VersionsResponse.versions', index=0,
+      number=1, type=4, cpp_type=4, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=738,
+  serialized_end=774,
+)
+
 _MESSAGE_VARIABLESENTRY.containing_type = _MESSAGE
 _MESSAGE.fields_by_name['variables'].message_type = _MESSAGE_VARIABLESENTRY
 _DIARY.fields_by_name['messages'].message_type = _MESSAGE
 _PUSHMESSAGEREQUEST.fields_by_name['message'].message_type = _MESSAGE
 _DIARYRESPONSE.fields_by_name['diary'].message_type = _DIARY
+_PUSHMESSAGESBATCHREQUEST.fields_by_name['requests'].message_type = _PUSHMESSAGEREQUEST
 DESCRIPTOR.message_types_by_name['Message'] = _MESSAGE
 DESCRIPTOR.message_types_by_name['Diary'] = _DIARY
 DESCRIPTOR.message_types_by_name['VersionRequest'] = _VERSIONREQUEST
@@ -386,6 +504,10 @@ DESCRIPTOR.message_types_by_name['PushMessageRequest'] = _PUSHMESSAGEREQUEST
 DESCRIPTOR.message_types_by_name['PushMessageResponse'] = _PUSHMESSAGERESPONSE
 DESCRIPTOR.message_types_by_name['DiaryRequest'] = _DIARYREQUEST
 DESCRIPTOR.message_types_by_name['DiaryResponse'] = _DIARYRESPONSE
+DESCRIPTOR.message_types_by_name['PushMessagesBatchRequest'] = _PUSHMESSAGESBATCHREQUEST
+DESCRIPTOR.message_types_by_name['PushMessagesBatchResponse'] = _PUSHMESSAGESBATCHRESPONSE
+DESCRIPTOR.message_types_by_name['VersionsRequest'] = _VERSIONSREQUEST
+DESCRIPTOR.message_types_by_name['VersionsResponse'] = _VERSIONSRESPONSE
 
 Message = _reflection.GeneratedProtocolMessageType('Message', (_message.Message,), dict(
 
@@ -451,6 +573,34 @@ DiaryResponse = _reflection.GeneratedProtocolMessageType('DiaryResponse', (_mess
   ))
 _sym_db.RegisterMessage(DiaryResponse)
 
+PushMessagesBatchRequest = _reflection.GeneratedProtocolMessageType('PushMessagesBatchRequest', (_message.Message,), dict(
+  DESCRIPTOR = _PUSHMESSAGESBATCHREQUEST,
+  __module__ = 'diary_pb2'
+  # @@protoc_insertion_point(class_scope:diary.PushMessagesBatchRequest)
+  ))
+_sym_db.RegisterMessage(PushMessagesBatchRequest)
+
+PushMessagesBatchResponse = _reflection.GeneratedProtocolMessageType('PushMessagesBatchResponse', (_message.Message,), dict(
+  DESCRIPTOR = _PUSHMESSAGESBATCHRESPONSE,
+  __module__ = 'diary_pb2'
+  # @@protoc_insertion_point(class_scope:diary.PushMessagesBatchResponse)
+  ))
+_sym_db.RegisterMessage(PushMessagesBatchResponse)
+
+VersionsRequest = _reflection.GeneratedProtocolMessageType('VersionsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _VERSIONSREQUEST,
+  __module__ = 'diary_pb2'
+  # @@protoc_insertion_point(class_scope:diary.VersionsRequest)
+  ))
+_sym_db.RegisterMessage(VersionsRequest)
+
+VersionsResponse = _reflection.GeneratedProtocolMessageType('VersionsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _VERSIONSRESPONSE,
+  __module__ = 'diary_pb2'
+  # @@protoc_insertion_point(class_scope:diary.VersionsResponse)
+  ))
+_sym_db.RegisterMessage(VersionsResponse)
+
 
 _MESSAGE_VARIABLESENTRY.has_options = True
 _MESSAGE_VARIABLESENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
@@ -0,0 +1,148 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: turn_updates.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='turn_updates.proto',
+  package='turn_updates',
+  syntax='proto3',
+  serialized_pb=_b('\n\x12turn_updates.proto\x12\x0cturn_updates\"6\n\x0b\x41\x63\x63ountTurn\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x13\n\x0bturn_number\x18\x02 \x01(\x04\"<\n\x10PushTurnsRequest\x12(\n\x05turns\x18\x01 \x03(\x0b\x32\x19.turn_updates.AccountTurn\"\x13\n\x11PushTurnsResponseb\x06proto3')
+)
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+
+
+
+_ACCOUNTTURN = _descriptor.Descriptor(
+  name='AccountTurn',
+  full_name='turn_updates.AccountTurn',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='account_id', full_name='turn_updates.AccountTurn.account_id', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='turn_number', full_name='turn_updates.AccountTurn.turn_number', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=36,
+  serialized_end=90,
+)
+
+
+_PUSHTURNSREQUEST = _descriptor.Descriptor(
+  name='PushTurnsRequest',
+  full_name='turn_updates.PushTurnsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='turns', full_name='turn_updates.PushTurnsRequest.turns', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=92,
+  serialized_end=152,
+)
+
+
+_PUSHTURNSRESPONSE = _descriptor.Descriptor(
+  name='PushTurnsResponse',
+  full_name='turn_updates.PushTurnsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=154,
+  serialized_end=173,
+)
+
+_PUSHTURNSREQUEST.fields_by_name['turns'].message_type = _ACCOUNTTURN
+DESCRIPTOR.message_types_by_name['AccountTurn'] = _ACCOUNTTURN
+DESCRIPTOR.message_types_by_name['PushTurnsRequest'] = _PUSHTURNSREQUEST
+DESCRIPTOR.message_types_by_name['PushTurnsResponse'] = _PUSHTURNSRESPONSE
+
+AccountTurn = _reflection.GeneratedProtocolMessageType('AccountTurn', (_message.Message,), dict(
+  DESCRIPTOR = _ACCOUNTTURN,
+  __module__ = 'turn_updates_pb2'
+  # @@protoc_insertion_point(class_scope:turn_updates.AccountTurn)
+  ))
+_sym_db.RegisterMessage(AccountTurn)
+
+PushTurnsRequest = _reflection.GeneratedProtocolMessageType('PushTurnsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _PUSHTURNSREQUEST,
+  __module__ = 'turn_updates_pb2'
+  # @@protoc_insertion_point(class_scope:turn_updates.PushTurnsRequest)
+  ))
+_sym_db.RegisterMessage(PushTurnsRequest)
+
+PushTurnsResponse = _reflection.GeneratedProtocolMessageType('PushTurnsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _PUSHTURNSRESPONSE,
+  __module__ = 'turn_updates_pb2'
+  # @@protoc_insertion_point(class_scope:turn_updates.PushTurnsResponse)
+  ))
+_sym_db.RegisterMessage(PushTurnsResponse)
+
+
+# @@protoc_insertion_point(module_scope)
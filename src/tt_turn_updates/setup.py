@@ -0,0 +1,21 @@
+# coding: utf-8
+import re
+import json
+import setuptools
+
+VERSION = '0.1'
+
+setuptools.setup(
+    name='TTTurnUpdates',
+    version=VERSION,
+    description='Turn updates push channel for The Tale',
+    long_description = 'Turn updates push channel for The Tale',
+    url='https://github.com/Tiendil/the-tale',
+    author='Aleksey Yeletsky <Tiendil>',
+    author_email='a.eletsky@gmail.com',
+    license='BSD',
+    packages=setuptools.find_packages(),
+    install_requires=[],
+    entry_points={'console_scripts': ['tt_turn_updates_benchmark=tt_turn_updates.commands.tt_turn_updates_benchmark:main']},
+    include_package_data=True,
+    test_suite = 'tests' )
@@ -0,0 +1,104 @@
+
+import time
+import argparse
+
+import asyncio
+
+import aiohttp
+
+from tt_protocol.protocol import turn_updates_pb2
+
+
+parser = argparse.ArgumentParser(description='Simulate concurrent long polling clients of running turn updates service')
+
+parser.add_argument('-u', '--url', metavar='url', type=str, default='http://localhost:10003', help='service url')
+parser.add_argument('-c', '--clients', metavar='clients', type=int, default=5000, help='number of concurrent clients (check open files limit of both processes)')
+parser.add_argument('-a', '--accounts', metavar='accounts', type=int, default=None, help='number of watched accounts, by default every client watches its own account')
+parser.add_argument('-t', '--turns', metavar='turns', type=int, default=10, help='number of turns to push')
+parser.add_argument('-d', '--turn-delay', metavar='turn_delay', type=float, default=2.0, help='delay between turns in seconds')
+
+
+class Statistics(object):
+    __slots__ = ('pushed_at', 'latencies', 'errors', 'requests')
+
+    def __init__(self):
+        self.pushed_at = {}
+        self.latencies = []
+        self.errors = 0
+        self.requests = 0
+
+    def report(self, clients, turns):
+        print('requests: {}, errors: {}'.format(self.requests, self.errors))
+        print('received turns: {} of {}'.format(len(self.latencies), clients * turns))
+
+        if not self.latencies:
+            return
+
+        latencies = sorted(self.latencies)
+
+        def percentile(value):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * value))]
+
+        print('latency (seconds): avg {:.4f}, median {:.4f}, 99% {:.4f}, max {:.4f}'.format(sum(latencies) / len(latencies),
+                                                                                           percentile(0.5),
+                                                                                           percentile(0.99),
+                                                                                           latencies[-1]))
+
+
+async def client(session, url, account_id, last_turn, statistics):
+    turn_number = 0
+
+    while turn_number < last_turn:
+        statistics.requests += 1
+
+        try:
+            async with session.get(url + '/wait', params={'account_id': account_id, 'turn_number': turn_number}) as response:
+                data = await response.json()
+        except Exception:
+            statistics.errors += 1
+            return
+
+        if data['turn_number'] > turn_number:
+            turn_number = data['turn_number']
+            statistics.latencies.append(time.time() - statistics.pushed_at[turn_number])
+
+
+async def pusher(session, url, accounts_ids, turns, turn_delay, statistics):
+    for turn_number in range(1, turns + 1):
+        await asyncio.sleep(turn_delay)
+
+        request = turn_updates_pb2.PushTurnsRequest(turns=[turn_updates_pb2.AccountTurn(account_id=account_id, turn_number=turn_number)
+                                                           for account_id in accounts_ids])
+
+        statistics.pushed_at[turn_number] = time.time()
+
+        async with session.post(url + '/push-turns', data=request.SerializeToString()) as response:
+            await response.read()
+
+        print('turn {} pushed in {:.4f} seconds'.format(turn_number, time.time() - statistics.pushed_at[turn_number]))
+
+
+async def run_command(args):
+    accounts_number = args.clients if args.accounts is None else args.accounts
+
+    statistics = Statistics()
+
+    connector = aiohttp.TCPConnector(limit=args.clients + 1)
+
+    session = aiohttp.ClientSession(connector=connector)
+
+    clients = [client(session, args.url, i % accounts_number + 1, args.turns, statistics)
+               for i in range(args.clients)]
+
+    try:
+        await asyncio.gather(pusher(session, args.url, list(range(1, accounts_number + 1)), args.turns, args.turn_delay, statistics),
+                             *clients)
+    finally:
+        session.close()
+
+    statistics.report(clients=args.clients, turns=args.turns)
+
+
+def main():
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(run_command(args))
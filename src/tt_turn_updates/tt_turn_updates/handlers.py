@@ -0,0 +1,31 @@
+from aiohttp import web
+
+from tt_web import handlers
+
+from tt_protocol.protocol import turn_updates_pb2
+
+from . import operations
+
+
+@handlers.api(turn_updates_pb2.PushTurnsRequest)
+async def push_turns(message, **kwargs):
+    operations.push_turns([(turn.account_id, turn.turn_number) for turn in message.turns])
+    return turn_updates_pb2.PushTurnsResponse()
+
+
+async def wait(request):
+    '''
+    long polling for browsers (json instead of protobuf)
+    '''
+    try:
+        account_id = int(request.GET['account_id'])
+        turn_number = int(request.GET['turn_number'])
+    except (KeyError, ValueError):
+        return web.json_response({'error': 'account_id and turn_number arguments must be integers'}, status=400)
+
+    turn_number = await operations.wait_turn(account_id=account_id,
+                                             turn_number=turn_number,
+                                             timeout=request.app['config']['wait_timeout'],
+                                             loop=request.app.loop)
+
+    return web.json_response({'turn_number': turn_number})
@@ -0,0 +1,70 @@
+import asyncio
+
+
+class TurnsHub(object):
+    __slots__ = ('_turns', '_waiters')
+
+    def __init__(self):
+        self._turns = {}
+        self._waiters = {}
+
+
+    def clear(self):
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                waiter.cancel()
+
+        self._turns.clear()
+        self._waiters.clear()
+
+
+    def turn(self, account_id):
+        return self._turns.get(account_id)
+
+
+    def waiters_number(self):
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+
+    def push(self, account_id, turn_number):
+        known_turn = self._turns.get(account_id)
+
+        if known_turn is not None and known_turn >= turn_number:
+            return
+
+        self._turns[account_id] = turn_number
+
+        for waiter in self._waiters.pop(account_id, ()):
+            if not waiter.done():
+                waiter.set_result(turn_number)
+
+
+    async def wait(self, account_id, turn_number, timeout, loop=None):
+        '''
+        returns number of account's turn, newer then turn_number,
+        or turn_number, if there were no new turns during timeout
+        '''
+        known_turn = self._turns.get(account_id)
+
+        if known_turn is not None and known_turn > turn_number:
+            return known_turn
+
+        waiter = asyncio.Future(loop=loop)
+
+        self._waiters.setdefault(account_id, set()).add(waiter)
+
+        try:
+            return await asyncio.wait_for(waiter, timeout=timeout, loop=loop)
+
+        except asyncio.TimeoutError:
+            return turn_number
+
+        finally:
+            # waiters set is removed by push, or by client disconnection, which cancels handler
+            waiters = self._waiters.get(account_id)
+
+            if waiters is not None:
+                waiters.discard(waiter)
+
+                if not waiters:
+                    del self._waiters[account_id]
@@ -0,0 +1,13 @@
+from . import objects
+
+
+TURNS = objects.TurnsHub()
+
+
+def push_turns(turns):
+    for account_id, turn_number in turns:
+        TURNS.push(account_id=account_id, turn_number=turn_number)
+
+
+async def wait_turn(account_id, turn_number, timeout, loop=None):
+    return await TURNS.wait(account_id=account_id, turn_number=turn_number, timeout=timeout, loop=loop)
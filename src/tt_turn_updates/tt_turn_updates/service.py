@@ -0,0 +1,31 @@
+
+from aiohttp import web
+
+from tt_web import log
+
+from . import operations
+
+
+async def on_cleanup(app):
+    operations.TURNS.clear()
+
+
+def register_routers(app):
+    from . import handlers
+
+    app.router.add_post('/push-turns', handlers.push_turns)
+    app.router.add_get('/wait', handlers.wait)
+
+
+def create_application(config, loop=None):
+    app = web.Application(loop=loop)
+
+    app['config'] = config
+
+    log.initilize(config['log'])
+
+    app.on_cleanup.append(on_cleanup)
+
+    register_routers(app)
+
+    return app
@@ -0,0 +1,53 @@
+import os
+
+import asyncio
+
+from aiohttp import test_utils
+
+from tt_protocol.protocol import base_pb2
+
+from tt_web import utils
+
+from tt_turn_updates import service
+from tt_turn_updates import operations
+
+
+class BaseTests(test_utils.AioHTTPTestCase):
+
+    def setUp(self):
+        super().setUp()
+        asyncio.set_event_loop(self.loop)
+
+
+    def get_app(self, loop):
+        application = service.create_application(get_config(), loop=loop)
+
+        application.on_startup.append(clean)
+
+        return application
+
+
+    async def check_answer(self, request, Data=None):
+        self.assertEqual(request.status, 200)
+        content = await request.content.read()
+        response = base_pb2.ApiResponse.FromString(content)
+        self.assertEqual(response.status, base_pb2.ApiResponse.SUCCESS)
+
+        if Data is None:
+            return None
+
+        response_data = Data()
+        response.data.Unpack(response_data)
+
+        await request.release()
+
+        return response_data
+
+
+def get_config():
+    config_path = os.path.join(os.path.dirname(__file__), 'fixtures', 'config.json')
+    return utils.load_config(config_path)
+
+
+async def clean(app=None):
+    operations.TURNS.clear()
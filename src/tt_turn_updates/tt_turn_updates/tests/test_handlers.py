@@ -0,0 +1,66 @@
+import asyncio
+
+from aiohttp import test_utils
+
+from tt_protocol.protocol import turn_updates_pb2
+
+from tt_turn_updates import operations
+
+from . import helpers
+
+
+class PushTurnsTests(helpers.BaseTests):
+
+    @test_utils.unittest_run_loop
+    async def test_push_turns(self):
+        turns = [turn_updates_pb2.AccountTurn(account_id=1, turn_number=10),
+                 turn_updates_pb2.AccountTurn(account_id=2, turn_number=20)]
+
+        request = await self.client.post('/push-turns', data=turn_updates_pb2.PushTurnsRequest(turns=turns).SerializeToString())
+        await self.check_answer(request, turn_updates_pb2.PushTurnsResponse)
+
+        self.assertEqual(operations.TURNS.turn(1), 10)
+        self.assertEqual(operations.TURNS.turn(2), 20)
+        self.assertEqual(operations.TURNS.turn(3), None)
+
+
+class WaitTests(helpers.BaseTests):
+
+    async def wait(self, account_id, turn_number):
+        request = await self.client.get('/wait', params={'account_id': account_id, 'turn_number': turn_number})
+        self.assertEqual(request.status, 200)
+        data = await request.json()
+        return data['turn_number']
+
+
+    @test_utils.unittest_run_loop
+    async def test_wrong_arguments(self):
+        for params in ({}, {'account_id': 1}, {'turn_number': 1}, {'account_id': 'x', 'turn_number': 1}):
+            request = await self.client.get('/wait', params=params)
+            self.assertEqual(request.status, 400)
+            await request.release()
+
+
+    @test_utils.unittest_run_loop
+    async def test_timeout(self):
+        self.assertEqual(await self.wait(account_id=1, turn_number=10), 10)
+        self.assertEqual(operations.TURNS.waiters_number(), 0)
+
+
+    @test_utils.unittest_run_loop
+    async def test_known_newer_turn(self):
+        operations.push_turns([(1, 11)])
+        self.assertEqual(await self.wait(account_id=1, turn_number=10), 11)
+
+
+    @test_utils.unittest_run_loop
+    async def test_pushed_turn(self):
+        waiter = asyncio.ensure_future(self.wait(account_id=1, turn_number=10), loop=self.loop)
+
+        while not operations.TURNS.waiters_number():
+            await asyncio.sleep(0.001, loop=self.loop)
+
+        request = await self.client.post('/push-turns', data=turn_updates_pb2.PushTurnsRequest(turns=[turn_updates_pb2.AccountTurn(account_id=1, turn_number=11)]).SerializeToString())
+        await self.check_answer(request, turn_updates_pb2.PushTurnsResponse)
+
+        self.assertEqual(await waiter, 11)
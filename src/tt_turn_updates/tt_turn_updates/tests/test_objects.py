@@ -0,0 +1,105 @@
+import asyncio
+
+from aiohttp import test_utils
+
+from tt_turn_updates import objects
+
+from . import helpers
+
+
+class TurnsHubTests(helpers.BaseTests):
+
+    def setUp(self):
+        super(TurnsHubTests, self).setUp()
+        self.hub = objects.TurnsHub()
+
+
+    def test_initialize(self):
+        self.assertEqual(self.hub.turn(1), None)
+        self.assertEqual(self.hub.waiters_number(), 0)
+
+
+    def test_push(self):
+        self.hub.push(account_id=1, turn_number=10)
+        self.hub.push(account_id=2, turn_number=20)
+
+        self.assertEqual(self.hub.turn(1), 10)
+        self.assertEqual(self.hub.turn(2), 20)
+
+
+    def test_push__old_turn(self):
+        self.hub.push(account_id=1, turn_number=10)
+        self.hub.push(account_id=1, turn_number=9)
+
+        self.assertEqual(self.hub.turn(1), 10)
+
+
+    @test_utils.unittest_run_loop
+    async def test_wait__known_newer_turn(self):
+        self.hub.push(account_id=1, turn_number=10)
+
+        turn_number = await self.hub.wait(account_id=1, turn_number=9, timeout=10, loop=self.loop)
+
+        self.assertEqual(turn_number, 10)
+        self.assertEqual(self.hub.waiters_number(), 0)
+
+
+    @test_utils.unittest_run_loop
+    async def test_wait__timeout(self):
+        self.hub.push(account_id=1, turn_number=10)
+
+        turn_number = await self.hub.wait(account_id=1, turn_number=10, timeout=0.01, loop=self.loop)
+
+        self.assertEqual(turn_number, 10)
+        self.assertEqual(self.hub.waiters_number(), 0)
+
+
+    @test_utils.unittest_run_loop
+    async def test_wait__push(self):
+        waiters = [asyncio.ensure_future(self.hub.wait(account_id=1, turn_number=10, timeout=10, loop=self.loop), loop=self.loop),
+                   asyncio.ensure_future(self.hub.wait(account_id=1, turn_number=10, timeout=10, loop=self.loop), loop=self.loop),
+                   asyncio.ensure_future(self.hub.wait(account_id=2, turn_number=10, timeout=0.01, loop=self.loop), loop=self.loop)]
+
+        await asyncio.sleep(0, loop=self.loop)
+
+        self.assertEqual(self.hub.waiters_number(), 3)
+
+        self.hub.push(account_id=1, turn_number=11)
+
+        turns = await asyncio.gather(*waiters, loop=self.loop)
+
+        self.assertEqual(turns, [11, 11, 10])
+        self.assertEqual(self.hub.waiters_number(), 0)
+
+
+    @test_utils.unittest_run_loop
+    async def test_wait__cancelled(self):
+        waiter = asyncio.ensure_future(self.hub.wait(account_id=1, turn_number=10, timeout=10, loop=self.loop), loop=self.loop)
+
+        await asyncio.sleep(0, loop=self.loop)
+
+        self.assertEqual(self.hub.waiters_number(), 1)
+
+        waiter.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        self.assertEqual(self.hub.waiters_number(), 0)
+
+
+    @test_utils.unittest_run_loop
+    async def test_clear(self):
+        waiter = asyncio.ensure_future(self.hub.wait(account_id=1, turn_number=10, timeout=10, loop=self.loop), loop=self.loop)
+
+        await asyncio.sleep(0, loop=self.loop)
+
+        self.hub.push(account_id=2, turn_number=10)
+
+        self.hub.clear()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        self.assertEqual(self.hub.turn(2), None)
+        self.assertEqual(self.hub.waiters_number(), 0)